@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from pathlib import PurePath
 from typing import Any
 
+import yaml
+
 from pants.backend.docker.target_types import AllDockerImageTargets
 from pants.backend.docker.target_types import rules as docker_target_types_rules
 from pants.backend.docker.utils import image_ref_regexp
@@ -19,19 +21,34 @@ from pants.backend.helm.dependency_inference.subsystem import (
 )
 from pants.backend.helm.subsystems import k8s_parser
 from pants.backend.helm.subsystems.k8s_parser import ParsedKubeManifest, ParseKubeManifestRequest
-from pants.backend.helm.target_types import HelmDeploymentFieldSet
+from pants.backend.helm.target_types import HelmDeploymentFieldSet, HelmDeploymentSourcesField
 from pants.backend.helm.target_types import rules as helm_target_types_rules
 from pants.backend.helm.util_rules import renderer
+from pants.backend.helm.util_rules.chart import FindHelmDeploymentChart, HelmChart
 from pants.backend.helm.util_rules.renderer import (
     HelmDeploymentCmd,
     HelmDeploymentRequest,
     RenderedHelmFiles,
+    sort_value_file_names_for_evaluation,
+)
+from pants.backend.helm.utils.image_refs import (
+    extract_static_image_refs,
+    inline_values_to_dict,
+    merge_values,
 )
 from pants.backend.helm.utils.yaml import FrozenYamlIndex, MutableYamlIndex
 from pants.build_graph.address import MaybeAddress
 from pants.engine.addresses import Address
 from pants.engine.engine_aware import EngineAwareParameter, EngineAwareReturnType
-from pants.engine.fs import Digest, DigestEntries, FileEntry
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.engine.fs import (
+    Digest,
+    DigestContents,
+    DigestEntries,
+    DigestSubset,
+    FileEntry,
+    PathGlobs,
+)
 from pants.engine.internals.native_engine import AddressInput, AddressParseException
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
@@ -51,6 +68,7 @@ logger = logging.getLogger(__name__)
 @dataclass(frozen=True)
 class AnalyseHelmDeploymentRequest(EngineAwareParameter):
     field_set: HelmDeploymentFieldSet
+    allow_static_analysis: bool = False
 
     def debug_hint(self) -> str | None:
         return self.field_set.address.spec
@@ -72,8 +90,76 @@ class HelmDeploymentReport(EngineAwareReturnType):
         return {"address": self.address, "image_refs": self.image_refs}
 
 
+async def _find_static_image_refs(field_set: HelmDeploymentFieldSet) -> FrozenYamlIndex[str] | None:
+    chart, value_files = await MultiGet(
+        Get(HelmChart, FindHelmDeploymentChart(field_set)),
+        Get(
+            SourceFiles,
+            SourceFilesRequest(
+                sources_fields=[field_set.sources],
+                for_sources_types=[HelmDeploymentSourcesField],
+                enable_codegen=True,
+            ),
+        ),
+    )
+    if chart.info.dependencies:
+        # Subcharts receive their own scope of values, which we can not follow without rendering.
+        return None
+
+    chart_contents, value_files_contents, sorted_value_files = await MultiGet(
+        Get(
+            DigestContents,
+            DigestSubset(chart.snapshot.digest, PathGlobs(["values.yaml", "templates/**"])),
+        ),
+        Get(DigestContents, Digest, value_files.snapshot.digest),
+        sort_value_file_names_for_evaluation(
+            field_set.address,
+            sources_field=field_set.sources,
+            value_files_snapshot=value_files.snapshot,
+            prefix="",
+        ),
+    )
+
+    inline_values = inline_values_to_dict(field_set.values.value or {})
+    if inline_values is None:
+        return None
+
+    value_files_by_name = {
+        file.path: file.content for file in (*chart_contents, *value_files_contents)
+    }
+    try:
+        all_values = [
+            yaml.safe_load(value_files_by_name[filename]) or {}
+            for filename in ("values.yaml", *sorted_value_files)
+            if filename in value_files_by_name
+        ]
+    except yaml.YAMLError:
+        # Let Helm report any problems with the values files.
+        return None
+
+    templates = [
+        (PurePath(chart.name, file.path), file.content.decode("utf-8"))
+        for file in chart_contents
+        if file.path.startswith("templates/") and not file.path.endswith("NOTES.txt")
+    ]
+    return extract_static_image_refs(templates, merge_values(*all_values, inline_values))
+
+
 @rule(desc="Analyse Helm deployment", level=LogLevel.DEBUG)
-async def analyse_deployment(request: AnalyseHelmDeploymentRequest) -> HelmDeploymentReport:
+async def analyse_deployment(
+    request: AnalyseHelmDeploymentRequest, helm_infer: HelmInferSubsystem
+) -> HelmDeploymentReport:
+    if request.allow_static_analysis and helm_infer.static_image_refs:
+        static_image_refs = await _find_static_image_refs(request.field_set)
+        if static_image_refs is not None:
+            return HelmDeploymentReport(
+                address=request.field_set.address, image_refs=static_image_refs
+            )
+        logger.debug(
+            f"Image references in {request.field_set.address} can not be found statically, "
+            "falling back to rendering the deployment."
+        )
+
     rendered_deployment = await Get(
         RenderedHelmFiles,
         HelmDeploymentRequest(
@@ -112,6 +198,7 @@ async def analyse_deployment(request: AnalyseHelmDeploymentRequest) -> HelmDeplo
 @dataclass(frozen=True)
 class FirstPartyHelmDeploymentMappingRequest(EngineAwareParameter):
     field_set: HelmDeploymentFieldSet
+    allow_static_analysis: bool = False
 
     def debug_hint(self) -> str | None:
         return self.field_set.address.spec
@@ -137,7 +224,10 @@ async def first_party_helm_deployment_mapping(
     helm_infer: HelmInferSubsystem,
 ) -> FirstPartyHelmDeploymentMapping:
     deployment_report = await Get(
-        HelmDeploymentReport, AnalyseHelmDeploymentRequest(request.field_set)
+        HelmDeploymentReport,
+        AnalyseHelmDeploymentRequest(
+            request.field_set, allow_static_analysis=request.allow_static_analysis
+        ),
     )
 
     def image_ref_to_address_input(image_ref: str) -> tuple[str, AddressInput] | None:
@@ -292,7 +382,9 @@ async def inject_deployment_dependencies(
             get_explicit_deps,
             Get(
                 FirstPartyHelmDeploymentMapping,
-                FirstPartyHelmDeploymentMappingRequest(request.field_set),
+                FirstPartyHelmDeploymentMappingRequest(
+                    request.field_set, allow_static_analysis=True
+                ),
             ),
         )
     else:
@@ -393,6 +393,103 @@ def test_inject_deployment_dependencies(rule_runner: RuleRunner) -> None:
     assert expected_dependency_addr in inferred_dependencies.include
 
 
+def test_static_deployment_dependencies_report(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/mychart/BUILD": "helm_chart()",
+            "src/mychart/Chart.yaml": HELM_CHART_FILE,
+            "src/mychart/values.yaml": dedent(
+                """\
+                container:
+                  image_ref: docker/image:latest
+                """
+            ),
+            "src/mychart/templates/_helpers.tpl": HELM_TEMPLATE_HELPERS_FILE,
+            "src/mychart/templates/pod.yaml": dedent(
+                """\
+                apiVersion: v1
+                kind: Pod
+                metadata:
+                  name: myapp
+                spec:
+                  containers:
+                    - name: myapp-container
+                      image: {{ .Values.container.image_ref0 }}
+                """
+            ),
+            "src/deployment/BUILD": dedent(
+                """\
+                helm_deployment(
+                  name="foo",
+                  chart="//src/mychart",
+                  values={"container.image_ref0": "src/image:myapp"},
+                )
+                """
+            ),
+        }
+    )
+
+    source_root_patterns = ("src/*",)
+    rule_runner.set_options(
+        [
+            f"--source-root-patterns={repr(source_root_patterns)}",
+            "--helm-infer-static-image-refs",
+        ],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+
+    deployment_addr = Address("src/deployment", target_name="foo")
+    tgt = rule_runner.get_target(deployment_addr)
+    field_set = HelmDeploymentFieldSet.create(tgt)
+
+    static_report = rule_runner.request(
+        HelmDeploymentReport,
+        [AnalyseHelmDeploymentRequest(field_set, allow_static_analysis=True)],
+    )
+    rendered_report = rule_runner.request(
+        HelmDeploymentReport, [AnalyseHelmDeploymentRequest(field_set)]
+    )
+
+    assert list(static_report.all_image_refs) == ["src/image:myapp"]
+    assert static_report.all_image_refs == rendered_report.all_image_refs
+
+    # Scalar actions and image free named templates can still be found statically.
+    rule_runner.write_files({"src/mychart/templates/pod.yaml": make_pod_yaml(0)})
+    static_report = rule_runner.request(
+        HelmDeploymentReport,
+        [AnalyseHelmDeploymentRequest(field_set, allow_static_analysis=True)],
+    )
+    assert list(static_report.all_image_refs) == ["src/image:myapp"]
+
+    # Other template actions may emit image references, so they force rendering the deployment.
+    rule_runner.write_files(
+        {
+            "src/mychart/templates/pod.yaml": dedent(
+                """\
+                apiVersion: v1
+                kind: Pod
+                metadata:
+                  name: {{ template "fullname" . }}
+                spec:
+                  containers:
+                    {{- range $idx, $ref := .Values.container }}
+                    - name: myapp-container-{{ $idx }}
+                      image: {{ $ref }}
+                    {{- end }}
+                """
+            )
+        }
+    )
+    fallback_report = rule_runner.request(
+        HelmDeploymentReport,
+        [AnalyseHelmDeploymentRequest(field_set, allow_static_analysis=True)],
+    )
+    assert set(fallback_report.all_image_refs) == {"docker/image:latest", "src/image:myapp"}
+    assert fallback_report.image_refs == rule_runner.request(
+        HelmDeploymentReport, [AnalyseHelmDeploymentRequest(field_set)]
+    ).image_refs
+
+
 def test_disambiguate_docker_dependency(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
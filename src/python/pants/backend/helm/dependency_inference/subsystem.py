@@ -79,6 +79,26 @@ class HelmInferSubsystem(Subsystem):
         advanced=True,
     )
 
+    static_image_refs = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, try to find the Docker image references used by a `helm_deployment` by reading
+            the chart templates and values files instead of rendering the deployment with Helm.
+
+            This is only possible when every `image` field in the chart templates is made of
+            literals and direct references to chart values (e.g.
+            `image: "{{ .Values.image.repository }}:{{ .Values.image.tag }}"`), outside of any
+            conditional block. Other actions are allowed as long as they can't emit `image` fields,
+            e.g. scalar values like `{{ .Release.Name }}`, named templates that don't emit `image`
+            fields (like the usual label helpers) and chart values without `image` fields emitted
+            with `toYaml`. Charts using `range`, `tpl` or other named templates, or with subcharts,
+            are still rendered, as those may emit image references.
+            """
+        ),
+        advanced=True,
+    )
+
     @cached_property
     def external_base_images(self) -> set[str]:
         return set(self.external_docker_images)
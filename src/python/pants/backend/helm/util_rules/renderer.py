@@ -42,6 +42,7 @@ from pants.engine.fs import (
 from pants.engine.internals.native_engine import FileDigest
 from pants.engine.process import InteractiveProcess, Process, ProcessCacheScope, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize, softwrap
 
@@ -92,6 +93,26 @@ class HelmDeploymentRequest(EngineAwareParameter):
         }
 
 
+@dataclass(frozen=True)
+class HelmRenderCacheKey:
+    """The set of inputs that fully determine the output of rendering a Helm deployment.
+
+    Renders are memoized using this key instead of the request that originated them, so callers
+    asking for the same chart, values, arguments and post-renderer configuration with a different
+    description (i.e. dependency inference and the post-renderer setup) share a single
+    `helm template` invocation.
+    """
+
+    chart_digest: Digest
+    values_digest: Digest
+    argv: tuple[str, ...]
+    post_renderer_digest: Digest | None = None
+    post_renderer_env: FrozenDict[str, str] = dataclasses.field(default_factory=FrozenDict)
+    post_renderer_immutable_input_digests: FrozenDict[str, Digest] = dataclasses.field(
+        default_factory=FrozenDict
+    )
+
+
 @dataclass(frozen=True)
 class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType):
     """Intermediate representation of a `HelmProcess` that will produce a fully rendered set of
@@ -107,6 +128,7 @@ class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType)
     process: HelmProcess
     address: Address
     output_directory: str | None
+    render_key: HelmRenderCacheKey
 
     @property
     def is_side_effect(self) -> bool:
@@ -142,6 +164,7 @@ class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType)
             "address": self.address.spec,
             "chart": self.chart,
             "process": self.process,
+            "render_key": self.render_key,
         }
 
         if self.output_directory:
@@ -193,7 +216,7 @@ class RenderedHelmFiles(EngineAwareReturnType):
         return not self.post_processed
 
 
-async def _sort_value_file_names_for_evaluation(
+async def sort_value_file_names_for_evaluation(
     address: Address,
     *,
     sources_field: HelmDeploymentSourcesField,
@@ -279,7 +302,7 @@ async def setup_render_helm_deployment_process(
         output_directories = [output_dir]
 
     # Sort the list of file names following a consistent ordering
-    sorted_value_files = await _sort_value_file_names_for_evaluation(
+    sorted_value_files = await sort_value_file_names_for_evaluation(
         request.field_set.address,
         sources_field=request.field_set.sources,
         value_files_snapshot=value_files.snapshot,
@@ -325,41 +348,43 @@ async def setup_render_helm_deployment_process(
         else ProcessCacheScope.SUCCESSFUL
     )
 
+    argv = (
+        request.cmd.value,
+        release_name,
+        chart.name,
+        *(
+            ("--description", f'"{request.field_set.description.value}"')
+            if request.field_set.description.value
+            else ()
+        ),
+        *(
+            ("--namespace", request.field_set.namespace.value)
+            if request.field_set.namespace.value
+            else ()
+        ),
+        *(("--skip-crds",) if request.field_set.skip_crds.value else ()),
+        *(("--no-hooks",) if request.field_set.no_hooks.value else ()),
+        *(("--output-dir", output_dir) if output_dir else ()),
+        *(("--enable-dns",) if request.field_set.enable_dns.value else ()),
+        *(
+            ("--post-renderer", os.path.join(".", request.post_renderer.exe))
+            if request.post_renderer
+            else ()
+        ),
+        *(("--values", ",".join(sorted_value_files)) if sorted_value_files else ()),
+        *chain.from_iterable(
+            (
+                ("--set", f"{key}={maybe_escape_string_value(value)}")
+                for key, value in inline_values.items()
+            )
+            if inline_values
+            else ()
+        ),
+        *request.extra_argv,
+    )
+
     process = HelmProcess(
-        argv=[
-            request.cmd.value,
-            release_name,
-            chart.name,
-            *(
-                ("--description", f'"{request.field_set.description.value}"')
-                if request.field_set.description.value
-                else ()
-            ),
-            *(
-                ("--namespace", request.field_set.namespace.value)
-                if request.field_set.namespace.value
-                else ()
-            ),
-            *(("--skip-crds",) if request.field_set.skip_crds.value else ()),
-            *(("--no-hooks",) if request.field_set.no_hooks.value else ()),
-            *(("--output-dir", output_dir) if output_dir else ()),
-            *(("--enable-dns",) if request.field_set.enable_dns.value else ()),
-            *(
-                ("--post-renderer", os.path.join(".", request.post_renderer.exe))
-                if request.post_renderer
-                else ()
-            ),
-            *(("--values", ",".join(sorted_value_files)) if sorted_value_files else ()),
-            *chain.from_iterable(
-                (
-                    ("--set", f"{key}={maybe_escape_string_value(value)}")
-                    for key, value in inline_values.items()
-                )
-                if inline_values
-                else ()
-            ),
-            *request.extra_argv,
-        ],
+        argv=argv,
         extra_env=env,
         extra_immutable_input_digests=immutable_input_digests,
         extra_append_only_caches=append_only_caches,
@@ -370,12 +395,26 @@ async def setup_render_helm_deployment_process(
         cache_scope=process_cache,
     )
 
+    render_key = HelmRenderCacheKey(
+        chart_digest=chart.snapshot.digest,
+        values_digest=value_files.snapshot.digest,
+        argv=argv,
+        post_renderer_digest=request.post_renderer.digest if request.post_renderer else None,
+        post_renderer_env=request.post_renderer.env if request.post_renderer else FrozenDict(),
+        post_renderer_immutable_input_digests=(
+            request.post_renderer.immutable_input_digests
+            if request.post_renderer
+            else FrozenDict()
+        ),
+    )
+
     return _HelmDeploymentProcessWrapper(
         cmd=request.cmd,
         chart=chart,
         process=process,
         address=request.field_set.address,
         output_directory=output_dir,
+        render_key=render_key,
     )
 
 
@@ -383,10 +422,53 @@ _YAML_FILE_SEPARATOR = "---"
 _HELM_OUTPUT_FILE_MARKER = "# Source: "
 
 
+@dataclass(frozen=True)
+class _CachedHelmRenderRequest:
+    """Request to run a render process, memoized by its `HelmRenderCacheKey` alone.
+
+    The process itself is left out of the comparison as it carries caller specific details, like its
+    description, that have no effect in the rendered output.
+    """
+
+    key: HelmRenderCacheKey
+    process: HelmProcess = dataclasses.field(compare=False)
+    output_directory: str | None = dataclasses.field(compare=False)
+
+
+@dataclass(frozen=True)
+class _CachedHelmRender(EngineAwareReturnType):
+    snapshot: Snapshot
+    post_processed: bool
+
+    def cacheable(self) -> bool:
+        # Same as with `RenderedHelmFiles`, post-processed output may contain sensitive information.
+        return not self.post_processed
+
+
 @rule(desc="Render Helm deployment", level=LogLevel.DEBUG)
 async def run_renderer(process_wrapper: _HelmDeploymentProcessWrapper) -> RenderedHelmFiles:
     assert not process_wrapper.is_side_effect
 
+    logger.debug(f"Rendering Helm files for {process_wrapper.address}")
+    cached_render = await Get(
+        _CachedHelmRender,
+        _CachedHelmRenderRequest(
+            key=process_wrapper.render_key,
+            process=process_wrapper.process,
+            output_directory=process_wrapper.output_directory,
+        ),
+    )
+
+    return RenderedHelmFiles(
+        address=process_wrapper.address,
+        chart=process_wrapper.chart,
+        snapshot=cached_render.snapshot,
+        post_processed=cached_render.post_processed,
+    )
+
+
+@rule(level=LogLevel.DEBUG)
+async def run_cached_renderer(request: _CachedHelmRenderRequest) -> _CachedHelmRender:
     def file_content(file_name: str, lines: Iterable[str]) -> FileContent:
         sanitised_lines = list(lines)
         if len(sanitised_lines) == 0:
@@ -418,28 +500,20 @@ async def run_renderer(process_wrapper: _HelmDeploymentProcessWrapper) -> Render
 
         return [file_content(file_name, lines) for file_name, lines in rendered_files.items()]
 
-    logger.debug(f"Rendering Helm files for {process_wrapper.address}")
-    result = await Get(ProcessResult, HelmProcess, process_wrapper.process)
+    result = await Get(ProcessResult, HelmProcess, request.process)
 
     output_snapshot = EMPTY_SNAPSHOT
-    if not process_wrapper.output_directory:
-        logger.debug(
-            f"Parsing Helm rendered files from the process' output of {process_wrapper.address}."
-        )
+    if not request.output_directory:
+        logger.debug("Parsing Helm rendered files from the process' output.")
         output_snapshot = await Get(Snapshot, CreateDigest(parse_renderer_output(result)))
     else:
-        logger.debug(
-            f"Obtaining Helm rendered files from the process' output directory of {process_wrapper.address}."
-        )
+        logger.debug("Obtaining Helm rendered files from the process' output directory.")
         output_snapshot = await Get(
-            Snapshot, RemovePrefix(result.output_digest, process_wrapper.output_directory)
+            Snapshot, RemovePrefix(result.output_digest, request.output_directory)
         )
 
-    return RenderedHelmFiles(
-        address=process_wrapper.address,
-        chart=process_wrapper.chart,
-        snapshot=output_snapshot,
-        post_processed=process_wrapper.uses_post_renderer,
+    return _CachedHelmRender(
+        snapshot=output_snapshot, post_processed=not request.output_directory
     )
 
 
@@ -0,0 +1,400 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import Any, Collection, Iterable, Mapping, Union
+
+from pants.backend.helm.utils.yaml import FrozenYamlIndex, MutableYamlIndex, YamlPath
+
+_IMAGE_FIELD_REGEX = re.compile(r"^\s*(?:-\s+)?image:\s*(?P<value>\S.*?)\s*$")
+_TEMPLATE_ACTION_REGEX = re.compile(r"\{\{-?\s*(?P<action>.*?)\s*-?\}\}")
+_TEMPLATE_COMMENT_REGEX = re.compile(r"\{\{-?\s*/\*.*?\*/\s*-?\}\}", re.DOTALL)
+_VALUES_REF_REGEX = re.compile(r"^\.Values(?P<path>(?:\.[A-Za-z_][A-Za-z0-9_]*)+)$")
+_STRING_LITERAL_REGEX = re.compile(r'"(?:[^"\\]|\\.)*"|`[^`]*`')
+_IDENTIFIER_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_NAMED_TEMPLATE_CALL_REGEX = re.compile(r'\b(?:include|template)\s+"(?P<name>[^"]*)"')
+_DYNAMIC_TEMPLATE_CALL_REGEX = re.compile(r'\b(?:include|template)\b(?!\s+"[^"]*")')
+_DEFINE_REGEX = re.compile(r'^define\s+"(?P<name>[^"]*)"$')
+_TO_YAML_REGEX = re.compile(
+    r"^(?:toYaml\s+(?P<arg>\S+)|(?P<piped>\S+)\s*\|\s*toYaml)(?:\s*\|\s*n?indent\s+\d+)?$"
+)
+_YAML_COMMENT_REGEX = re.compile(r"\s+#.*$")
+_YAML_DOCUMENT_SEPARATOR = "---"
+
+# Functions whose output may contain YAML structure, and so `image` fields.
+_STRUCTURED_OUTPUT_FUNCTIONS = frozenset({"tpl", "toJson", "toPrettyJson", "toRawJson", "toYaml"})
+# Actions that repeat or define parts of the template, which we don't follow.
+_UNSUPPORTED_CONTROL_ACTIONS = frozenset({"block", "break", "continue", "define", "range"})
+# Actions that start a nested block, closed by an `end` action.
+_BLOCK_ACTIONS = frozenset({"block", "define", "if", "range", "with"})
+
+ValuesPath = tuple[str, ...]
+"""Path to an element inside the chart values, e.g. `("image", "repository")`."""
+
+ImageRefPart = Union[str, ValuesPath]
+
+
+@dataclass(frozen=True)
+class ImageRefTemplate:
+    """An image reference found in a chart template.
+
+    Its `parts` are either literal strings or paths into the chart values that need to be
+    concatenated to obtain the final image reference.
+    """
+
+    file_path: PurePath
+    document_index: int
+    line_number: int
+    parts: tuple[ImageRefPart, ...]
+
+    def resolve(self, values: Mapping[str, Any]) -> str | None:
+        """Interpolates the given values into this template.
+
+        Returns `None` if any of the referenced values is not set or is not a scalar.
+        """
+
+        result = ""
+        for part in self.parts:
+            if isinstance(part, str):
+                result += part
+                continue
+
+            value = lookup_value(values, part)
+            if value is None or isinstance(value, (dict, list, bool)):
+                return None
+            result += str(value)
+        return result
+
+
+def _values_path(ref: str) -> ValuesPath | None:
+    values_ref = _VALUES_REF_REGEX.match(ref)
+    if not values_ref:
+        return None
+    return tuple(values_ref.group("path").split(".")[1:])
+
+
+def _parse_image_ref_parts(value: str) -> tuple[ImageRefPart, ...] | None:
+    value = _YAML_COMMENT_REGEX.sub("", value)
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        value = value[1:-1]
+
+    parts: list[ImageRefPart] = []
+    last_pos = 0
+    for match in _TEMPLATE_ACTION_REGEX.finditer(value):
+        if match.start() > last_pos:
+            parts.append(value[last_pos : match.start()])
+        last_pos = match.end()
+
+        values_path = _values_path(match.group("action"))
+        if values_path is None:
+            # The image is computed using functions, pipelines or named templates.
+            return None
+        parts.append(values_path)
+
+    if "{{" in value[last_pos:]:
+        return None
+    if last_pos < len(value):
+        parts.append(value[last_pos:])
+    return tuple(parts)
+
+
+@dataclass(frozen=True)
+class ParsedChartTemplate:
+    """The image references found in a chart template, along with the chart values that it emits
+    as YAML (i.e. using `toYaml`)."""
+
+    image_refs: tuple[ImageRefTemplate, ...]
+    yaml_values: tuple[ValuesPath, ...]
+
+
+def _parse_action(
+    action: str,
+    scopes: list[ValuesPath | None],
+    image_free_templates: Collection[str],
+    yaml_values: list[ValuesPath],
+) -> bool:
+    """Checks that the given action can't emit `image` fields, tracking the blocks it opens.
+
+    Each item of `scopes` is a block opened by a previous action, holding the values path bound to
+    `.` inside of it, if known. Returns `False` if the action is not understood.
+    """
+
+    code = _STRING_LITERAL_REGEX.sub('""', action)
+    words = code.split(maxsplit=1)
+    keyword = words[0] if words else ""
+    current_scope = scopes[-1] if scopes else None
+    if keyword == "if":
+        scopes.append(current_scope)
+        return True
+    if keyword == "with":
+        scopes.append(_values_path(words[1]) if len(words) > 1 else None)
+        return True
+    if keyword in ("else", "end"):
+        if not scopes:
+            return False
+        scopes.pop()
+        if keyword == "else":
+            # An `else with` binds `.` again, otherwise it is bound to the same value as outside.
+            is_with = len(words) > 1 and words[1].startswith("with")
+            scopes.append(None if is_with else (scopes[-1] if scopes else None))
+        return True
+    if keyword in _UNSUPPORTED_CONTROL_ACTIONS:
+        return False
+
+    # Named templates can only be used when we know that they don't emit `image` fields.
+    if _DYNAMIC_TEMPLATE_CALL_REGEX.search(action):
+        return False
+    if any(
+        call.group("name") not in image_free_templates
+        for call in _NAMED_TEMPLATE_CALL_REGEX.finditer(action)
+    ):
+        return False
+
+    if not _STRUCTURED_OUTPUT_FUNCTIONS.intersection(_IDENTIFIER_REGEX.findall(code)):
+        # Any other output is a scalar, e.g. the value of another field.
+        return True
+
+    # Chart values emitted with `toYaml` are checked once the values are known.
+    to_yaml = _TO_YAML_REGEX.match(code)
+    if not to_yaml:
+        return False
+    arg = to_yaml.group("arg") or to_yaml.group("piped")
+    path = current_scope if arg == "." else _values_path(arg)
+    if path is None:
+        return False
+    yaml_values.append(path)
+    return True
+
+
+def parse_image_ref_templates(
+    file_path: PurePath, content: str, *, image_free_templates: Collection[str] = frozenset()
+) -> ParsedChartTemplate | None:
+    """Finds all the `image` fields in the given chart template.
+
+    Returns `None` if any of the image references can not be statically determined. That is the
+    case when an `image` field is computed by anything other than direct references to the chart
+    values, or is inside of a conditional block. It is also the case when any other action could
+    emit `image` fields: `tpl`, `range`, `toJson`, `toYaml` of anything other than chart values,
+    and named templates not in `image_free_templates`. Other actions, e.g. `{{ .Release.Name }}`
+    or `if` conditions, only emit scalar values and are allowed.
+    """
+
+    document_index = 0
+    document_has_content = False
+    scopes: list[ValuesPath | None] = []
+    found: list[ImageRefTemplate] = []
+    yaml_values: list[ValuesPath] = []
+    content = _TEMPLATE_COMMENT_REGEX.sub(lambda m: "\n" * m.group().count("\n"), content)
+    for line_number, line in enumerate(content.splitlines(), start=1):
+        if line.startswith(_YAML_DOCUMENT_SEPARATOR):
+            if document_has_content:
+                document_index += 1
+                document_has_content = False
+            continue
+        if line.strip():
+            document_has_content = True
+
+        match = _IMAGE_FIELD_REGEX.match(line)
+        if not match:
+            for action in _TEMPLATE_ACTION_REGEX.finditer(line):
+                if not _parse_action(
+                    action.group("action"), scopes, image_free_templates, yaml_values
+                ):
+                    return None
+            if "{{" in _TEMPLATE_ACTION_REGEX.sub("", line):
+                return None
+            continue
+
+        if scopes:
+            # The `image` field may or may not be rendered, depending on the condition.
+            return None
+        parts = _parse_image_ref_parts(match.group("value"))
+        if parts is None:
+            return None
+        found.append(
+            ImageRefTemplate(
+                file_path=file_path,
+                document_index=document_index,
+                line_number=line_number,
+                parts=parts,
+            )
+        )
+
+    if scopes:
+        return None
+    return ParsedChartTemplate(image_refs=tuple(found), yaml_values=tuple(yaml_values))
+
+
+def split_named_templates(content: str) -> tuple[str, dict[str, str]] | None:
+    """Removes the `define` blocks from the given chart template, returning their bodies by name.
+
+    The removed blocks are replaced by empty lines, so the line numbers of the rest of the template
+    are preserved. Returns `None` if the blocks are not balanced.
+    """
+
+    content = _TEMPLATE_COMMENT_REGEX.sub(lambda m: "\n" * m.group().count("\n"), content)
+    named_templates: dict[str, str] = {}
+    chunks: list[str] = []
+    last_pos = 0
+    depth = 0
+    name = ""
+    define_start = body_start = 0
+    for match in _TEMPLATE_ACTION_REGEX.finditer(content):
+        action = match.group("action")
+        keyword = action.split(maxsplit=1)[0] if action else ""
+        if keyword == "define" and depth == 0:
+            define = _DEFINE_REGEX.match(action)
+            if not define:
+                return None
+            name = define.group("name")
+            define_start, body_start = match.start(), match.end()
+            depth = 1
+        elif depth and keyword in _BLOCK_ACTIONS:
+            depth += 1
+        elif depth and keyword == "end":
+            depth -= 1
+            if depth == 0:
+                named_templates[name] = content[body_start : match.start()]
+                chunks.append(content[last_pos:define_start])
+                chunks.append("\n" * content.count("\n", define_start, match.end()))
+                last_pos = match.end()
+    if depth:
+        return None
+    chunks.append(content[last_pos:])
+    return "".join(chunks), named_templates
+
+
+def find_image_free_templates(named_templates: Mapping[str, str]) -> frozenset[str]:
+    """Finds the named templates that can't emit `image` fields, e.g. the usual label helpers.
+
+    A named template can include other named templates, as long as those are image free as well.
+    """
+
+    image_free: set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, body in named_templates.items():
+            if name in image_free:
+                continue
+            parsed = parse_image_ref_templates(PurePath(), body, image_free_templates=image_free)
+            if parsed is not None and not parsed.image_refs and not parsed.yaml_values:
+                image_free.add(name)
+                changed = True
+    return frozenset(image_free)
+
+
+def _contains_image_field(value: Any) -> bool:
+    if isinstance(value, Mapping):
+        return "image" in value or any(_contains_image_field(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_contains_image_field(v) for v in value)
+    return False
+
+
+def lookup_value(values: Mapping[str, Any], path: ValuesPath) -> Any | None:
+    """Returns the value found at the given path or `None` if there is none."""
+
+    current: Any = values
+    for elem in path:
+        if not isinstance(current, Mapping):
+            return None
+        current = current.get(elem)
+    return current
+
+
+def merge_values(*values: Mapping[str, Any]) -> dict[str, Any]:
+    """Merges the given values following Helm's semantics.
+
+    Later values override earlier ones, nested maps are merged recursively and `null` values delete
+    the key they are set to.
+    """
+
+    result: dict[str, Any] = {}
+    for overrides in values:
+        for key, value in overrides.items():
+            if value is None:
+                result.pop(key, None)
+            elif isinstance(value, Mapping) and isinstance(result.get(key), Mapping):
+                result[key] = merge_values(result[key], value)
+            else:
+                result[key] = value
+    return result
+
+
+def inline_values_to_dict(inline_values: Mapping[str, str]) -> dict[str, Any] | None:
+    """Translates the `--set` style values of a deployment into a nested dictionary.
+
+    Returns `None` if any of the keys uses syntax other than dotted keys (e.g. list indexes).
+    """
+
+    result: dict[str, Any] = {}
+    for key, value in inline_values.items():
+        path = key.split(".")
+        if any(not elem or "[" in elem or "\\" in elem for elem in path):
+            return None
+
+        current = result
+        for elem in path[:-1]:
+            next_value = current.get(elem)
+            if not isinstance(next_value, dict):
+                next_value = {}
+                current[elem] = next_value
+            current = next_value
+        current[path[-1]] = value
+    return result
+
+
+def extract_static_image_refs(
+    templates: Iterable[tuple[PurePath, str]], values: Mapping[str, Any]
+) -> FrozenYamlIndex[str] | None:
+    """Finds the image references used by a chart without rendering it.
+
+    This only succeeds when every `image` field is made of literals and direct references to entries
+    in the chart values, and no other template action can emit `image` fields (see
+    `parse_image_ref_templates`), returning `None` otherwise. Named templates are only used when
+    they can't emit `image` fields, and chart values emitted with `toYaml` must not contain any.
+
+    Partial templates (those with a name starting with `_`) are not rendered by Helm, so only their
+    named templates are considered. As the final location of the image inside the rendered
+    manifests is unknown, items are indexed by the template line in which they were found instead
+    of their YAML path.
+    """
+
+    named_templates: dict[str, str] = {}
+    rendered_templates: list[tuple[PurePath, str]] = []
+    for file_path, content in templates:
+        split = split_named_templates(content)
+        if split is None:
+            return None
+        content, file_named_templates = split
+        named_templates.update(file_named_templates)
+        if not file_path.name.startswith("_"):
+            rendered_templates.append((file_path, content))
+
+    image_free_templates = find_image_free_templates(named_templates)
+    image_refs: MutableYamlIndex[str] = MutableYamlIndex()
+    for file_path, content in rendered_templates:
+        parsed = parse_image_ref_templates(
+            file_path, content, image_free_templates=image_free_templates
+        )
+        if parsed is None:
+            return None
+        if any(_contains_image_field(lookup_value(values, path)) for path in parsed.yaml_values):
+            return None
+
+        for ref_template in parsed.image_refs:
+            image_ref = ref_template.resolve(values)
+            if not image_ref:
+                return None
+            image_refs.insert(
+                file_path=ref_template.file_path,
+                document_index=ref_template.document_index,
+                yaml_path=YamlPath.root() / str(ref_template.line_number) / "image",
+                item=image_ref,
+            )
+    return image_refs.frozen()
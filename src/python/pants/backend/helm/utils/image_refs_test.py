@@ -0,0 +1,318 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pathlib import PurePath
+from textwrap import dedent
+
+import pytest
+
+from pants.backend.helm.utils.image_refs import (
+    extract_static_image_refs,
+    find_image_free_templates,
+    inline_values_to_dict,
+    merge_values,
+    parse_image_ref_templates,
+    split_named_templates,
+)
+
+
+@pytest.mark.parametrize(
+    "line, expected_parts",
+    [
+        ("image: busybox:1.28", ("busybox:1.28",)),
+        ("- image: 'busybox:1.28'  # comment", ("busybox:1.28",)),
+        ('image: "{{ .Values.image }}"', (("image",),)),
+        (
+            'image: "{{ .Values.image.repository }}:{{- .Values.image.tag -}}"',
+            (("image", "repository"), ":", ("image", "tag")),
+        ),
+        ("image: registry.example.com/{{ .Values.name }}", ("registry.example.com/", ("name",))),
+        ('image: "{{ .Values.image.tag | default .Chart.AppVersion }}"', None),
+        ('image: {{ include "chart.image" . }}', None),
+        ("image: {{ .Values.image", None),
+        ("image: {{ .Values.image }} {{/* A comment */}}", (("image",),)),
+        ("name: {{ .Release.Name }}", ()),
+        ("{{/* A comment */}}", ()),
+        ('name: {{ include "chart.fullname" . }}', None),
+        ("{{- if .Values.enabled }}\nimage: busybox\n{{- end }}", None),
+        ("{{- if .Values.enabled }}", None),
+        ("{{- end }}", None),
+    ],
+)
+def test_parse_image_ref_templates(line: str, expected_parts: tuple | None) -> None:
+    result = parse_image_ref_templates(PurePath("templates/pod.yaml"), line)
+    if expected_parts is None:
+        assert result is None
+    else:
+        assert result is not None
+        assert [ref.parts for ref in result.image_refs] == (
+            [expected_parts] if expected_parts else []
+        )
+
+
+def test_parse_image_ref_templates_document_index() -> None:
+    template = dedent(
+        """\
+        ---
+        kind: Pod
+        spec:
+          containers:
+            - image: busybox
+        ---
+        kind: Pod
+        spec:
+          initContainers:
+            - image: alpine
+          containers:
+            - image: python
+        """
+    )
+
+    result = parse_image_ref_templates(PurePath("templates/pod.yaml"), template)
+    assert result is not None
+    assert [(ref.document_index, ref.line_number) for ref in result.image_refs] == [
+        (0, 5),
+        (1, 10),
+        (1, 12),
+    ]
+
+
+def test_parse_image_ref_templates_yaml_values() -> None:
+    template = dedent(
+        """\
+        spec:
+          {{- with .Values.nodeSelector }}
+          nodeSelector:
+            {{- toYaml . | nindent 4 }}
+          {{- else }}
+          nodeSelector: {}
+          {{- end }}
+          resources:
+            {{- .Values.resources | toYaml | nindent 4 }}
+        """
+    )
+
+    result = parse_image_ref_templates(PurePath("templates/pod.yaml"), template)
+    assert result is not None
+    assert result.yaml_values == (("nodeSelector",), ("resources",))
+
+    # `.` is only known to be bound to chart values inside `with` blocks.
+    assert parse_image_ref_templates(PurePath("templates/pod.yaml"), "{{ toYaml . }}") is None
+
+
+def test_split_named_templates() -> None:
+    helpers = dedent(
+        """\
+        {{/* Chart name. */}}
+        {{- define "chart.name" -}}
+        {{- if .Values.name }}{{ .Values.name }}{{ else }}{{ .Chart.Name }}{{ end }}
+        {{- end }}
+        kind: Pod
+        {{- define "chart.labels" }}
+        app: {{ include "chart.name" . }}
+        {{- end }}
+        """
+    )
+
+    result = split_named_templates(helpers)
+    assert result is not None
+    content, named_templates = result
+    # The line numbers of the rest of the template are preserved.
+    assert content == "\n\n\n\nkind: Pod\n\n\n\n"
+    assert named_templates == {
+        "chart.name": (
+            "\n{{- if .Values.name }}{{ .Values.name }}{{ else }}{{ .Chart.Name }}{{ end }}\n"
+        ),
+        "chart.labels": '\napp: {{ include "chart.name" . }}\n',
+    }
+
+    assert split_named_templates('{{- define "chart.name" }}\n{{- if .Values.x }}') is None
+
+
+def test_find_image_free_templates() -> None:
+    named_templates = {
+        "chart.name": "{{ .Chart.Name }}",
+        "chart.labels": 'app: {{ include "chart.name" . }}\n{{ include "chart.version" . }}',
+        "chart.version": "{{- if .Chart.AppVersion }}\nversion: {{ .Chart.Version }}\n{{- end }}",
+        "chart.image": "image: {{ .Values.image }}",
+        "chart.container": '- name: app\n  {{ include "chart.image" . }}',
+        "chart.extra": "{{ toYaml .Values.extra }}",
+        "chart.missing": '{{ include "chart.undefined" . }}',
+    }
+    assert find_image_free_templates(named_templates) == {
+        "chart.name",
+        "chart.labels",
+        "chart.version",
+    }
+
+
+def test_merge_values() -> None:
+    assert merge_values(
+        {"image": {"repository": "busybox", "tag": "1.0"}, "removed": "value"},
+        {"image": {"tag": "2.0"}, "removed": None},
+    ) == {"image": {"repository": "busybox", "tag": "2.0"}}
+
+
+def test_inline_values_to_dict() -> None:
+    assert inline_values_to_dict({"image.tag": "2.0", "name": "foo"}) == {
+        "image": {"tag": "2.0"},
+        "name": "foo",
+    }
+    assert inline_values_to_dict({"containers[0].image": "busybox"}) is None
+
+
+def test_extract_static_image_refs() -> None:
+    template = dedent(
+        """\
+        spec:
+          containers:
+            - image: "{{ .Values.image.repository }}:{{ .Values.image.tag }}"
+            - image: alpine:3.19
+        """
+    )
+
+    values = {"image": {"repository": "src/docker:image", "tag": 1.0}}
+    result = extract_static_image_refs([(PurePath("templates/pod.yaml"), template)], values)
+    assert result is not None
+    assert list(result.values()) == ["src/docker:image:1.0", "alpine:3.19"]
+
+    assert extract_static_image_refs([(PurePath("templates/pod.yaml"), template)], {}) is None
+
+
+@pytest.mark.parametrize(
+    "containers",
+    [
+        "{{- toYaml .Values.containers | nindent 4 }}",
+        dedent(
+            """\
+            {{- with .Values.containers }}
+                {{- toYaml . | nindent 4 }}
+                {{- end }}"""
+        ),
+        '{{- include "chart.containers" . | nindent 4 }}',
+        '{{- include (printf "%s.containers" .Chart.Name) . | nindent 4 }}',
+        "{{- tpl .Values.containersTemplate . | nindent 4 }}",
+        dedent(
+            """\
+            {{- range .Values.containers }}
+                - image: {{ .image }}
+                {{- end }}"""
+        ),
+        dedent(
+            """\
+            {{- if .Values.enabled }}
+                - image: busybox
+                {{- end }}"""
+        ),
+    ],
+)
+def test_extract_static_image_refs_with_other_actions(containers: str) -> None:
+    # Other actions may emit `image` fields, so we must fall back to rendering the chart.
+    helpers = '{{- define "chart.containers" }}\n- image: {{ .Values.image }}\n{{- end }}\n'
+    template = f"spec:\n  containers:\n    {containers}\n"
+    values = {
+        "enabled": True,
+        "containers": [{"image": "busybox"}],
+        "containersTemplate": "- image: busybox",
+    }
+    assert (
+        extract_static_image_refs(
+            [
+                (PurePath("templates/_helpers.tpl"), helpers),
+                (PurePath("templates/pod.yaml"), template),
+            ],
+            values,
+        )
+        is None
+    )
+
+
+def test_extract_static_image_refs_with_scalar_actions() -> None:
+    # Similar to the templates created by `helm create`.
+    helpers = dedent(
+        """\
+        {{/*
+        Expand the name of the chart.
+        */}}
+        {{- define "chart.name" -}}
+        {{- default .Chart.Name .Values.nameOverride | trunc 63 | trimSuffix "-" }}
+        {{- end }}
+
+        {{- define "chart.fullname" -}}
+        {{- if .Values.fullnameOverride }}
+        {{- .Values.fullnameOverride | trunc 63 | trimSuffix "-" }}
+        {{- else }}
+        {{- $name := default .Chart.Name .Values.nameOverride }}
+        {{- printf "%s-%s" .Release.Name $name | trunc 63 | trimSuffix "-" }}
+        {{- end }}
+        {{- end }}
+
+        {{- define "chart.selectorLabels" -}}
+        app.kubernetes.io/name: {{ include "chart.name" . }}
+        app.kubernetes.io/instance: {{ .Release.Name }}
+        {{- end }}
+
+        {{- define "chart.labels" -}}
+        helm.sh/chart: {{ .Chart.Name }}-{{ .Chart.Version | replace "+" "_" }}
+        {{ include "chart.selectorLabels" . }}
+        {{- end }}
+        """
+    )
+    template = dedent(
+        """\
+        apiVersion: apps/v1
+        kind: Deployment
+        metadata:
+          name: {{ include "chart.fullname" . }}
+          labels:
+            {{- include "chart.labels" . | nindent 4 }}
+        spec:
+          {{- if not .Values.autoscaling.enabled }}
+          replicas: {{ .Values.replicaCount }}
+          {{- end }}
+          template:
+            metadata:
+              {{- with .Values.podAnnotations }}
+              annotations:
+                {{- toYaml . | nindent 8 }}
+              {{- end }}
+            spec:
+              containers:
+                - name: {{ .Chart.Name }}
+                  image: "{{ .Values.image.repository }}:{{ .Values.image.tag }}"
+                  resources:
+                    {{- toYaml .Values.resources | nindent 12 }}
+        """
+    )
+    values = {
+        "autoscaling": {"enabled": False},
+        "replicaCount": 1,
+        "image": {"repository": "src/docker:image", "tag": "1.0"},
+        "podAnnotations": {"team": "a"},
+        "resources": {"limits": {"cpu": "100m"}},
+    }
+    templates = [
+        (PurePath("templates/_helpers.tpl"), helpers),
+        (PurePath("templates/deployment.yaml"), template),
+    ]
+
+    result = extract_static_image_refs(templates, values)
+    assert result is not None
+    assert list(result.values()) == ["src/docker:image:1.0"]
+
+    # Values emitted with `toYaml` may contain `image` fields, too.
+    values["resources"] = {"image": "busybox"}
+    assert extract_static_image_refs(templates, values) is None
+
+
+def test_extract_static_image_refs_ignores_partials() -> None:
+    helpers = '{{- define "chart.containers" }}\n- image: {{ .Values.image }}\n{{- end }}\n'
+    template = "spec:\n  containers:\n    - image: alpine:3.19\n"
+    result = extract_static_image_refs(
+        [(PurePath("templates/_helpers.tpl"), helpers), (PurePath("templates/pod.yaml"), template)],
+        {"image": "busybox"},
+    )
+    assert result is not None
+    assert list(result.values()) == ["alpine:3.19"]
@@ -10,7 +10,10 @@ from dataclasses import dataclass
 
 import pkg_resources
 
-from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
+from pants.backend.java.dependency_inference.types import (
+    JavaSourceDependencyAnalysis,
+    JavaSourceTopLevelTypes,
+)
 from pants.core.goals.resolves import ExportableTool
 from pants.core.util_rules.source_files import SourceFiles
 from pants.engine.fs import AddPrefix, CreateDigest, Digest, DigestContents, Directory, FileContent
@@ -18,6 +21,7 @@ from pants.engine.internals.native_engine import MergeDigests, RemovePrefix
 from pants.engine.process import FallibleProcessResult, ProcessResult, ProductDescription
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.unions import UnionRule
+from pants.jvm.dependency_inference.source_header import JvmLanguage, parse_source_header
 from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
@@ -80,6 +84,25 @@ async def make_analysis_request_from_source_files(
     return JavaSourceDependencyAnalysisRequest(source_files=source_files)
 
 
+@rule(level=LogLevel.DEBUG)
+async def find_java_source_top_level_types(source_files: SourceFiles) -> JavaSourceTopLevelTypes:
+    """Finds the top level types of a Java source, only falling back to the Java parser for sources
+    using constructs that the in-process header parser does not support."""
+
+    digest_contents = await Get(DigestContents, Digest, source_files.snapshot.digest)
+    if len(digest_contents) == 1:
+        try:
+            content = digest_contents[0].content.decode("utf-8")
+        except UnicodeDecodeError:
+            content = None
+        header = parse_source_header(content, JvmLanguage.JAVA) if content is not None else None
+        if header is not None:
+            return JavaSourceTopLevelTypes(header.top_level_types)
+
+    analysis = await Get(JavaSourceDependencyAnalysis, SourceFiles, source_files)
+    return JavaSourceTopLevelTypes(tuple(analysis.top_level_types))
+
+
 @rule(level=LogLevel.DEBUG)
 async def analyze_java_source_dependencies(
     processor_classfiles: JavaParserCompiledClassfiles,
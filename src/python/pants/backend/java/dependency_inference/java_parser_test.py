@@ -11,7 +11,11 @@ from pants.backend.java.dependency_inference.java_parser import (
     FallibleJavaSourceDependencyAnalysisResult,
 )
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
-from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
+from pants.backend.java.dependency_inference.types import (
+    JavaImport,
+    JavaSourceDependencyAnalysis,
+    JavaSourceTopLevelTypes,
+)
 from pants.backend.java.target_types import JavaSourceField, JavaSourceTarget
 from pants.build_graph.address import Address
 from pants.core.util_rules import source_files
@@ -38,6 +42,7 @@ def rule_runner() -> RuleRunner:
             *jdk_rules.rules(),
             QueryRule(FallibleJavaSourceDependencyAnalysisResult, (SourceFiles,)),
             QueryRule(JavaSourceDependencyAnalysis, (SourceFiles,)),
+            QueryRule(JavaSourceTopLevelTypes, (SourceFiles,)),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[JavaSourceTarget],
@@ -309,3 +314,33 @@ def test_java_parser_consumed_types(rule_runner: RuleRunner) -> None:
         "String",
         "provider",  # note: false positive on a variable identifier
     ]
+
+
+def test_top_level_types_from_source_header(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "java_source(name='source', source='Source.java')",
+            "Source.java": dedent(
+                """\
+                package org.pantsbuild.example;
+
+                public class Source {
+                    class Nested {}
+                }
+
+                record Point(int x, int y) {}
+                """
+            ),
+        }
+    )
+
+    target = rule_runner.get_target(Address(spec_path="", target_name="source"))
+    source_files = rule_runner.request(
+        SourceFiles, [SourceFilesRequest([target.get(SourcesField)])]
+    )
+
+    # No JDK is needed, as the source can be handled without the Java parser.
+    top_level_types = rule_runner.request(JavaSourceTopLevelTypes, [source_files])
+    assert top_level_types == JavaSourceTopLevelTypes(
+        ("org.pantsbuild.example.Source", "org.pantsbuild.example.Point")
+    )
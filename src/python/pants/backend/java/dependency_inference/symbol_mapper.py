@@ -7,7 +7,7 @@ import logging
 from collections import defaultdict
 from typing import Mapping
 
-from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
+from pants.backend.java.dependency_inference.types import JavaSourceTopLevelTypes
 from pants.backend.java.target_types import JavaSourceField
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
@@ -43,7 +43,7 @@ async def map_first_party_java_targets_to_symbols(
     jvm: JvmSubsystem,
 ) -> SymbolMap:
     source_analysis = await MultiGet(
-        Get(JavaSourceDependencyAnalysis, SourceFilesRequest([target[JavaSourceField]]))
+        Get(JavaSourceTopLevelTypes, SourceFilesRequest([target[JavaSourceField]]))
         for target in java_targets
     )
     address_and_analysis = zip(
@@ -55,3 +55,14 @@ class JavaSourceDependencyAnalysis:
             "consumed_types": self.consumed_types,
             "export_types": self.export_types,
         }
+
+
+@dataclass(frozen=True)
+class JavaSourceTopLevelTypes:
+    """The fully qualified names of the types declared at the top level of a Java source file.
+
+    This is the subset of `JavaSourceDependencyAnalysis` needed to build the symbol map, and can
+    usually be computed without launching the Java parser.
+    """
+
+    top_level_types: tuple[str, ...]
@@ -49,7 +49,8 @@ async def export_node_modules_for_resolve(
         return MaybeExportResult(None)
 
     installation = await Get(
-        InstalledNodePackage, InstalledNodePackageRequest(requested_resolve.address)
+        InstalledNodePackage,
+        InstalledNodePackageRequest(requested_resolve.address, allow_immutable_node_modules=False),
     )
 
     return MaybeExportResult(
@@ -215,6 +215,7 @@ async def run_javascript_tests(
             ),
             description=f"Running npm tests for {file_description}.",
             input_digest=merged_digest,
+            immutable_input_digests=installation.immutable_input_digests,
             level=LogLevel.INFO,
             extra_env=FrozenDict(**test_extra_env.env, **target_env_vars),
             timeout_seconds=timeout_seconds,
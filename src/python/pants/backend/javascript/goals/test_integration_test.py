@@ -278,6 +278,49 @@ def test_mocha_tests(
         assert len(result.process_results) == ATTEMPTS_DEFAULT_OPTION
 
 
+def test_mocha_tests_with_immutable_node_modules(
+    package_manager: str,
+    mocha_lockfile: dict[str, str],
+    rule_runner: RuleRunner,
+) -> None:
+    rule_runner.set_options(
+        [
+            f"--nodejs-package-manager={package_manager}",
+            "--nodejs-immutable-node-modules",
+        ],
+        env_inherit={"PATH"},
+    )
+    rule_runner.write_files(
+        {
+            "foo/BUILD": "package_json()",
+            "foo/package.json": given_package_json(
+                test_script={"test": "mocha"},
+                runner={"mocha": "^10.4.0"},
+            ),
+            **{f"foo/{key}": value for key, value in mocha_lockfile.items()},
+            "foo/src/BUILD": "javascript_sources()",
+            "foo/src/index.mjs": make_source_to_test(),
+            "foo/src/tests/BUILD": "javascript_tests(name='tests')",
+            "foo/src/tests/index.test.mjs": textwrap.dedent(
+                """\
+                import assert from "assert"
+
+                import { add } from "../index.mjs"
+
+                it('adds 1 + 2 to equal 3', () => {
+                    assert.equal(add(1, 2), 3);
+                });
+                """
+            ),
+        }
+    )
+    tgt = rule_runner.get_target(Address("foo/src/tests", relative_file_path="index.test.mjs"))
+    package = rule_runner.get_target(Address("foo", generated_name="pkg"))
+    result = rule_runner.request(TestResult, [given_request_for(tgt, package=package)])
+    assert b"1 passing" in result.stdout_bytes
+    assert result.exit_code == 0
+
+
 def test_jest_test_with_coverage_reporting(
     package_manager: str,
     rule_runner: RuleRunner,
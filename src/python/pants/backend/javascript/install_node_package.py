@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os.path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable
 
 from pants.backend.javascript import nodejs_project_environment
@@ -20,27 +20,43 @@ from pants.backend.javascript.package_json import (
 )
 from pants.backend.javascript.package_manager import PackageManager
 from pants.backend.javascript.subsystems import nodejs
+from pants.backend.javascript.subsystems.nodejs import NodeJS
 from pants.backend.javascript.target_types import JSRuntimeSourceField
 from pants.build_graph.address import Address
 from pants.core.target_types import FileSourceField, ResourceSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.engine.fs import CreateDigest, SymlinkEntry
 from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests
 from pants.engine.internals.selectors import Get
 from pants.engine.process import ProcessResult
 from pants.engine.rules import Rule, collect_rules, rule
 from pants.engine.target import SourcesField, Target, TransitiveTargets, TransitiveTargetsRequest
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.frozendict import FrozenDict
 
 
 @dataclass(frozen=True)
 class InstalledNodePackageRequest:
     address: Address
+    # If false, the installed `node_modules` is always part of the digest, e.g. for exporting it.
+    allow_immutable_node_modules: bool = True
+
+
+# The directory of the sandbox where an immutable `node_modules` is mounted.
+_NODE_MODULES_STORE_DIR = "._node_modules"
 
 
 @dataclass(frozen=True)
 class InstalledNodePackage:
+    """The sources of a package, with its dependencies installed.
+
+    With `[nodejs].immutable_node_modules`, the `node_modules` directory in the digest is a symlink
+    into `immutable_input_digests`, which must be passed on to any process using the digest.
+    """
+
     project_env: NodeJsProjectEnvironment
     digest: Digest
+    immutable_input_digests: FrozenDict[str, Digest] = field(default_factory=FrozenDict)
 
     @property
     def project_dir(self) -> str:
@@ -77,9 +93,36 @@ async def _get_relevant_source_files(
     )
 
 
+async def _link_immutable_node_modules(
+    project_env: NodeJsProjectEnvironment, install_output: Digest
+) -> tuple[Digest, FrozenDict[str, Digest]]:
+    """Mounts the installed `node_modules` as an immutable input, and links to it.
+
+    Only the project root has a `node_modules` directory, so the packages in it only resolve each
+    other: Node.js resolves the symlink to the content-addressed mount, where they are still found
+    in a `node_modules` directory.
+    """
+    node_modules = os.path.join(project_env.root_dir, "node_modules")
+    link = await Get(
+        Digest,
+        CreateDigest(
+            [
+                SymlinkEntry(
+                    node_modules,
+                    os.path.relpath(
+                        os.path.join(_NODE_MODULES_STORE_DIR, "node_modules"),
+                        project_env.root_dir,
+                    ),
+                )
+            ]
+        ),
+    )
+    return link, FrozenDict({_NODE_MODULES_STORE_DIR: install_output})
+
+
 @rule
 async def install_node_packages_for_address(
-    req: InstalledNodePackageRequest, union_membership: UnionMembership
+    req: InstalledNodePackageRequest, union_membership: UnionMembership, nodejs: NodeJS
 ) -> InstalledNodePackage:
     project_env = await Get(NodeJsProjectEnvironment, NodeJSProjectEnvironmentRequest(req.address))
     target = project_env.ensure_target()
@@ -101,7 +144,19 @@ async def install_node_packages_for_address(
             output_directories=tuple(project_env.node_modules_directories),
         ),
     )
-    node_modules = await Get(Digest, AddPrefix(install_result.output_digest, project_env.root_dir))
+    immutable_input_digests: FrozenDict[str, Digest] = FrozenDict()
+    if (
+        nodejs.immutable_node_modules
+        and req.allow_immutable_node_modules
+        and project_env.project.single_workspace
+    ):
+        node_modules, immutable_input_digests = await _link_immutable_node_modules(
+            project_env, install_result.output_digest
+        )
+    else:
+        node_modules = await Get(
+            Digest, AddPrefix(install_result.output_digest, project_env.root_dir)
+        )
 
     return InstalledNodePackage(
         project_env,
@@ -114,6 +169,7 @@ async def install_node_packages_for_address(
                 ]
             ),
         ),
+        immutable_input_digests=immutable_input_digests,
     )
 
 
@@ -131,7 +187,11 @@ async def add_sources_to_installed_node_package(
         with_js=True,
     )
     digest = await Get(Digest, MergeDigests((installation.digest, source_files.snapshot.digest)))
-    return InstalledNodePackageWithSource(installation.project_env, digest=digest)
+    return InstalledNodePackageWithSource(
+        installation.project_env,
+        digest=digest,
+        immutable_input_digests=installation.immutable_input_digests,
+    )
 
 
 def rules() -> Iterable[Rule | UnionRule]:
@@ -101,6 +101,7 @@ async def pack_node_package_into_tgz_for_publication(
             args=("pack",),
             description=f"Packaging .tgz archive for {name}@{version}",
             input_digest=installation.digest,
+            immutable_input_digests=installation.immutable_input_digests,
             output_files=(installation.join_relative_workspace_directory(archive_file),),
             level=LogLevel.INFO,
         ),
@@ -202,6 +203,7 @@ async def run_node_build_script(req: NodeBuildScriptRequest) -> NodeBuildScriptR
             args=filter(None, args),
             description=f"Running node build script '{script_name}'.",
             input_digest=installation.digest,
+            immutable_input_digests=installation.immutable_input_digests,
             output_files=tuple(
                 installation.join_relative_workspace_directory(file) for file in output_files or ()
             ),
@@ -58,6 +58,7 @@ async def run_node_build_script(
             ),
             description=f"Running {str(field_set.entry_point.value)}.",
             input_digest=installation.digest,
+            immutable_input_digests=installation.immutable_input_digests,
             extra_env=target_env_vars,
         ),
     )
@@ -47,7 +47,13 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, Rule, collect_rules, implicitly, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import DictOption, ShellStrListOption, StrListOption, StrOption
+from pants.option.option_types import (
+    BoolOption,
+    DictOption,
+    ShellStrListOption,
+    StrListOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
 from pants.util.frozendict import FrozenDict
@@ -153,6 +159,24 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
         ),
     )
 
+    immutable_node_modules = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, share the installed `node_modules` of single-workspace projects between
+            sandboxes as an immutable, content-addressed input, instead of copying it into the
+            sandbox of every process that uses it.
+
+            The installed packages are materialized once per install, and the `node_modules`
+            directory of each sandbox is a symlink to them. This makes tests and builds of
+            projects with many dependencies much faster to set up, but the directory is
+            read-only: tools writing into `node_modules` (e.g. to `node_modules/.cache`) must
+            be configured to write elsewhere.
+            """
+        ),
+        advanced=True,
+    )
+
     @property
     def default_package_manager(self) -> str | None:
         if self.package_manager in self.package_managers:
@@ -237,6 +261,7 @@ class NodeJSToolProcess:
     timeout_seconds: int | None = None
     extra_env: Mapping[str, str] = field(default_factory=FrozenDict)
     project_digest: Digest | None = None
+    immutable_input_digests: FrozenDict[str, Digest] = field(default_factory=FrozenDict)
 
     @classmethod
     def npm(
@@ -591,7 +616,10 @@ async def setup_node_tool_process(
         argv=list(filter(None, (request.tool, *request.args))),
         input_digest=input_digest,
         output_files=request.output_files,
-        immutable_input_digests=environment.immutable_digest(),
+        immutable_input_digests={
+            **request.immutable_input_digests,
+            **environment.immutable_digest(),
+        },
         output_directories=request.output_directories,
         description=request.description,
         level=request.level,
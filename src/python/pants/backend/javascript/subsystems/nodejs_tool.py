@@ -161,6 +161,7 @@ async def _run_tool_with_resolve(request: NodeJSToolRequest, resolve: str) -> Pr
             ),
             description=request.description,
             input_digest=await Get(Digest, MergeDigests([request.input_digest, installed.digest])),
+            immutable_input_digests=installed.immutable_input_digests,
             output_files=request.output_files,
             output_directories=request.output_directories,
             per_package_caches=request.append_only_caches,
@@ -16,6 +16,7 @@ from pants.engine.process import FallibleProcessResult, ProcessResult, ProductDe
 from pants.engine.rules import collect_rules, rule
 from pants.engine.unions import UnionRule
 from pants.jvm.compile import ClasspathEntry
+from pants.jvm.dependency_inference.source_header import JvmLanguage, parse_source_header
 from pants.jvm.jdk_rules import InternalJdk, JdkEnvironment, JdkRequest, JvmProcess
 from pants.jvm.resolve.common import ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate
@@ -140,6 +141,17 @@ class KotlinSourceDependencyAnalysis:
         }
 
 
+@dataclass(frozen=True)
+class KotlinSourceImports:
+    """The imports of a Kotlin source file.
+
+    This is the subset of `KotlinSourceDependencyAnalysis` needed to infer dependencies from imports
+    alone, and can usually be computed without launching the Kotlin parser.
+    """
+
+    imports: frozenset[KotlinImport]
+
+
 @dataclass(frozen=True)
 class FallibleKotlinSourceDependencyAnalysisResult:
     process_result: FallibleProcessResult
@@ -216,6 +228,27 @@ async def analyze_kotlin_source_dependencies(
     return FallibleKotlinSourceDependencyAnalysisResult(process_result=process_result)
 
 
+@rule(level=LogLevel.DEBUG)
+async def find_kotlin_source_imports(source_files: SourceFiles) -> KotlinSourceImports:
+    digest_contents = await Get(DigestContents, Digest, source_files.snapshot.digest)
+    if len(digest_contents) == 1:
+        try:
+            content = digest_contents[0].content.decode("utf-8")
+        except UnicodeDecodeError:
+            content = None
+        header = parse_source_header(content, JvmLanguage.KOTLIN) if content is not None else None
+        if header is not None:
+            return KotlinSourceImports(
+                frozenset(
+                    KotlinImport(name=imp.name, alias=imp.alias, is_wildcard=imp.is_wildcard)
+                    for imp in header.imports
+                )
+            )
+
+    analysis = await Get(KotlinSourceDependencyAnalysis, SourceFiles, source_files)
+    return KotlinSourceImports(analysis.imports)
+
+
 @rule(level=LogLevel.DEBUG)
 async def resolve_fallible_result_to_analysis(
     fallible_result: FallibleKotlinSourceDependencyAnalysisResult,
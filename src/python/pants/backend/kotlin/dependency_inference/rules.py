@@ -5,7 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from pants.backend.kotlin.dependency_inference import kotlin_parser, symbol_mapper
-from pants.backend.kotlin.dependency_inference.kotlin_parser import KotlinSourceDependencyAnalysis
+from pants.backend.kotlin.dependency_inference.kotlin_parser import (
+    KotlinSourceDependencyAnalysis,
+    KotlinSourceImports,
+)
 from pants.backend.kotlin.subsystems.kotlin import KotlinSubsystem
 from pants.backend.kotlin.subsystems.kotlin_infer import KotlinInferSubsystem
 from pants.backend.kotlin.target_types import KotlinDependenciesField, KotlinSourceField
@@ -58,16 +61,25 @@ async def infer_kotlin_dependencies_via_source_analysis(
         return InferredDependencies([])
 
     address = request.field_set.address
-    explicitly_provided_deps, analysis = await MultiGet(
-        Get(ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)),
-        Get(KotlinSourceDependencyAnalysis, SourceFilesRequest([request.field_set.source])),
-    )
-
     symbols: OrderedSet[str] = OrderedSet()
-    if kotlin_infer_subsystem.imports:
-        symbols.update(imp.name for imp in analysis.imports)
     if kotlin_infer_subsystem.consumed_types:
+        explicitly_provided_deps, analysis = await MultiGet(
+            Get(
+                ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)
+            ),
+            Get(KotlinSourceDependencyAnalysis, SourceFilesRequest([request.field_set.source])),
+        )
+        symbols.update(imp.name for imp in analysis.imports)
         symbols.update(analysis.fully_qualified_consumed_symbols())
+    else:
+        # Imports alone can usually be found without launching the Kotlin parser.
+        explicitly_provided_deps, source_imports = await MultiGet(
+            Get(
+                ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)
+            ),
+            Get(KotlinSourceImports, SourceFilesRequest([request.field_set.source])),
+        )
+        symbols.update(imp.name for imp in source_imports.imports)
 
     resolve = request.field_set.resolve.normalized_value(jvm)
 
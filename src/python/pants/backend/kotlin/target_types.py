@@ -20,6 +20,7 @@ from pants.engine.target import (
     generate_multiple_sources_field_help_message,
 )
 from pants.jvm.target_types import (
+    JunitTestBatchCompatibilityTagField,
     JunitTestExtraEnvVarsField,
     JunitTestSourceField,
     JunitTestTimeoutField,
@@ -143,6 +144,7 @@ class KotlinJunitTestTarget(Target):
         KotlincConsumedPluginIdsField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmResolveField,
         JvmJdkField,
         JvmProvidesTypesField,
@@ -170,6 +172,7 @@ class KotlinJunitTestsGeneratorTarget(TargetFilesGenerator):
         KotlincConsumedPluginIdsField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmResolveField,
         JvmJdkField,
         JvmProvidesTypesField,
@@ -23,6 +23,7 @@ from pants.core.goals.test import TestResult, get_filtered_environment
 from pants.core.target_types import FilesGeneratorTarget, FileTarget, RelocatedFiles
 from pants.core.util_rules import config_files, source_files
 from pants.core.util_rules.external_tool import rules as external_tool_rules
+from pants.core.util_rules.partitions import Partitions
 from pants.engine.addresses import Addresses
 from pants.engine.target import CoarsenedTargets
 from pants.jvm import classpath
@@ -81,6 +82,7 @@ def rule_runner() -> RuleRunner:
             *kotlin_dep_inf_rules(),
             get_filtered_environment,
             QueryRule(CoarsenedTargets, (Addresses,)),
+            QueryRule(Partitions, (JunitTestRequest.PartitionRequest,)),
             QueryRule(TestResult, (JunitTestRequest.Batch,)),
         ],
         target_types=[
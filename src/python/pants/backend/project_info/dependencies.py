@@ -25,10 +25,13 @@ class DependenciesOutputFormat(Enum):
 
     text: List all dependencies as a single list of targets in plain text.
     json: List all dependencies as a mapping `{target: [dependencies]}`.
+    ndjson: List the dependencies of each target as a line of JSON
+        `{"address": target, "dependencies": [dependencies]}`, written as they are resolved.
     """
 
     text = "text"
     json = "json"
+    ndjson = "ndjson"
 
 
 class DependenciesSubsystem(LineOriented, GoalSubsystem):
@@ -54,10 +57,14 @@ class Dependencies(Goal):
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
 
 
-async def list_dependencies_as_json(
-    addresses: Addresses, dependencies_subsystem: DependenciesSubsystem, console: Console
-) -> None:
-    """Get dependencies for given addresses and list them in the console in JSON."""
+# The number of targets resolved at a time when streaming the output (for `dependencies` and
+# `peek`), so that the first lines are written before every target is resolved.
+_NDJSON_BATCH_SIZE = 1000
+
+
+async def _sorted_dependencies_per_target_root(
+    addresses: Addresses, dependencies_subsystem: DependenciesSubsystem
+) -> list[tuple[str, list[str]]]:
     # NB: We must preserve target generators for the roots, i.e. not replace with their
     # generated targets.
     target_roots = await Get(UnexpandedTargets, Addresses, addresses)
@@ -107,13 +114,35 @@ async def list_dependencies_as_json(
 
     # The assumption is that when iterating the targets and sending dependency requests
     # for them, the lists of dependencies are returned in the very same order.
-    mapping = dict(zip([str(tgt.address) for tgt in target_roots], iterated_targets))
+    return list(zip([str(tgt.address) for tgt in target_roots], iterated_targets))
+
+
+async def list_dependencies_as_json(
+    addresses: Addresses, dependencies_subsystem: DependenciesSubsystem, console: Console
+) -> None:
+    """Get dependencies for given addresses and list them in the console in JSON."""
+    mapping = dict(await _sorted_dependencies_per_target_root(addresses, dependencies_subsystem))
     output = json.dumps(mapping, indent=4)
 
     with dependencies_subsystem.line_oriented(console) as print_stdout:
         print_stdout(output)
 
 
+async def list_dependencies_as_ndjson(
+    addresses: Addresses, dependencies_subsystem: DependenciesSubsystem, console: Console
+) -> None:
+    """Get dependencies for given addresses in batches, and list them in the console as they are
+    resolved, with one line of JSON per address."""
+    sorted_addresses = sorted(addresses)
+    with dependencies_subsystem.line_oriented(console) as print_stdout:
+        for i in range(0, len(sorted_addresses), _NDJSON_BATCH_SIZE):
+            batch = Addresses(sorted_addresses[i : i + _NDJSON_BATCH_SIZE])
+            for address, dependencies in await _sorted_dependencies_per_target_root(
+                batch, dependencies_subsystem
+            ):
+                print_stdout(json.dumps({"address": address, "dependencies": dependencies}))
+
+
 async def list_dependencies_as_plain_text(
     addresses: Addresses, dependencies_subsystem: DependenciesSubsystem, console: Console
 ) -> None:
@@ -171,6 +200,13 @@ async def dependencies(
             console=console,
         )
 
+    elif DependenciesOutputFormat.ndjson == dependencies_subsystem.format:
+        await list_dependencies_as_ndjson(
+            addresses=addresses,
+            dependencies_subsystem=dependencies_subsystem,
+            console=console,
+        )
+
     return Dependencies(exit_code=0)
 
 
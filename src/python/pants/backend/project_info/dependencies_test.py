@@ -107,6 +107,8 @@ def assert_dependencies(
             assert result.stdout.splitlines() == expected
         elif output_format == DependenciesOutputFormat.json:
             assert json.loads(result.stdout) == expected
+        elif output_format == DependenciesOutputFormat.ndjson:
+            assert [json.loads(line) for line in result.stdout.splitlines()] == expected
     else:
         assert not result.stdout
         with rule_runner.pushd():
@@ -472,3 +474,41 @@ def test_python_dependencies_output_format_json_transitive_deps(
             ],
         },
     )
+
+
+def test_python_dependencies_output_format_ndjson(rule_runner: PythonRuleRunner) -> None:
+    create_targets(rule_runner)
+    assert_deps = partial(
+        assert_dependencies,
+        rule_runner,
+        output_format=DependenciesOutputFormat.ndjson,
+    )
+
+    assert_deps(
+        specs=["some/target/a.py", "some/other/target/a.py"],
+        expected=[
+            {
+                "address": "some/other/target/a.py",
+                "dependencies": ["3rdparty/python:req2", "some/target/a.py"],
+            },
+            {
+                "address": "some/target/a.py",
+                "dependencies": ["3rdparty/python:req1", "dep/target/a.py"],
+            },
+        ],
+    )
+    assert_deps(
+        specs=["some/other/target/a.py"],
+        transitive=True,
+        expected=[
+            {
+                "address": "some/other/target/a.py",
+                "dependencies": [
+                    "3rdparty/python:req1",
+                    "3rdparty/python:req2",
+                    "dep/target/a.py",
+                    "some/target/a.py",
+                ],
+            },
+        ],
+    )
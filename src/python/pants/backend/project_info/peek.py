@@ -5,12 +5,15 @@ from __future__ import annotations
 
 import collections
 import collections.abc
+import dataclasses
 import json
 import logging
 from abc import ABCMeta
 from dataclasses import dataclass, fields, is_dataclass
-from typing import Any, Iterable, Mapping, Protocol, runtime_checkable
+from enum import Enum
+from typing import Any, Iterable, Iterator, Mapping, Protocol, runtime_checkable
 
+from pants.backend.project_info.dependencies import _NDJSON_BATCH_SIZE
 from pants.core.goals.deploy import Deploy, DeployFieldSet
 from pants.core.goals.package import Package, PackageFieldSet
 from pants.core.goals.publish import Publish, PublishFieldSet
@@ -45,7 +48,7 @@ from pants.engine.target import (
     UnexpandedTargets,
 )
 from pants.engine.unions import UnionMembership, union
-from pants.option.option_types import BoolOption
+from pants.option.option_types import BoolOption, EnumOption
 from pants.util.frozendict import FrozenDict
 from pants.util.strutil import softwrap
 
@@ -60,6 +63,17 @@ class Dictable(Protocol):
         ...
 
 
+class PeekOutputFormat(Enum):
+    """Output format for `peek`.
+
+    json: A single JSON array containing all targets.
+    ndjson: One JSON object per line for each target, written as the targets are resolved.
+    """
+
+    json = "json"
+    ndjson = "ndjson"
+
+
 class PeekSubsystem(Outputting, GoalSubsystem):
     """Display detailed target information in JSON form."""
 
@@ -85,6 +99,18 @@ class PeekSubsystem(Outputting, GoalSubsystem):
         default=False, help="Whether to include additional information generated by plugins."
     )
 
+    format = EnumOption(
+        default=PeekOutputFormat.json,
+        help=softwrap(
+            """
+            Output format for the target information.
+
+            With `ndjson`, targets are resolved and written in batches, which bounds memory usage
+            and gets the first results out sooner for large sets of targets.
+            """
+        ),
+    )
+
 
 class Peek(Goal):
     subsystem_cls = PeekSubsystem
@@ -179,6 +205,15 @@ def render_json(
     return f"{json.dumps([td.to_dict(exclude_defaults, include_dep_rules) for td in tds], indent=2, cls=_PeekJsonEncoder)}\n"
 
 
+def render_ndjson(
+    tds: Iterable[TargetData], exclude_defaults: bool = False, include_dep_rules: bool = False
+) -> Iterator[str]:
+    """Renders each target as a single line of JSON."""
+    for td in tds:
+        data = td.to_dict(exclude_defaults, include_dep_rules)
+        yield f"{json.dumps(data, cls=_PeekJsonEncoder)}\n"
+
+
 class _PeekJsonEncoder(json.JSONEncoder):
     """Allow us to serialize some commonly found types in BUILD files."""
 
@@ -423,27 +458,30 @@ async def peek(
     :return: The `Peek` goal.
     """
 
-    tds = await Get(TargetDatas, UnexpandedTargets, targets)
     # This method needs to be called in a @goal_rule, otherwise it fails out with Rule errors (when called in an @rule)
     target_alias_to_goals_map = await _create_target_alias_to_goals_map()
 
-    if target_alias_to_goals_map:
+    def with_goals(tds: TargetDatas) -> TargetDatas:
+        if not target_alias_to_goals_map:
+            return tds
         # Attach the goals to the target data, in the hopes that we can pull `_create_target_alias_to_goals_map` back into `get_target_data`
         # TargetData is frozen so we need to create a new collection
-        tds = TargetDatas(
-            [
-                TargetData(
-                    td.target,
-                    td.expanded_sources,
-                    td.expanded_dependencies,
-                    td.dependencies_rules,
-                    td.dependents_rules,
-                    td.applicable_dep_rules,
-                    target_alias_to_goals_map.get(td.target.alias),
-                )
-                for td in tds
-            ]
+        return TargetDatas(
+            dataclasses.replace(td, goals=target_alias_to_goals_map.get(td.target.alias))
+            for td in tds
         )
+
+    if subsys.format == PeekOutputFormat.ndjson:
+        sorted_targets = sorted(targets, key=lambda tgt: tgt.address)
+        with subsys.output(console) as write_stdout:
+            for i in range(0, len(sorted_targets), _NDJSON_BATCH_SIZE):
+                batch = UnexpandedTargets(sorted_targets[i : i + _NDJSON_BATCH_SIZE])
+                tds = with_goals(await Get(TargetDatas, UnexpandedTargets, batch))
+                for line in render_ndjson(tds, subsys.exclude_defaults, subsys.include_dep_rules):
+                    write_stdout(line)
+        return Peek(exit_code=0)
+
+    tds = with_goals(await Get(TargetDatas, UnexpandedTargets, targets))
     output = render_json(tds, subsys.exclude_defaults, subsys.include_dep_rules)
 
     with subsys.output(console) as write_stdout:
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import json
 from textwrap import dedent
 from typing import Sequence, cast
 
@@ -75,6 +76,28 @@ def test_render_json_null_case():
     assert peek.render_json([]) == "[]\n"
 
 
+def test_render_ndjson() -> None:
+    target_data = [
+        TargetData(
+            FilesGeneratorTarget({"sources": ["*.txt"]}, Address("example", target_name=name)),
+            None,
+            tuple(),
+        )
+        for name in ("a", "b")
+    ]
+    lines = list(peek.render_ndjson(target_data, exclude_defaults=True))
+    assert all(line.endswith("}\n") and line.count("\n") == 1 for line in lines)
+    assert [json.loads(line) for line in lines] == [
+        {
+            "address": f"example:{name}",
+            "target_type": "files",
+            "dependencies": [],
+            "sources_raw": ["*.txt"],
+        }
+        for name in ("a", "b")
+    ]
+
+
 def test_render_json_with_single_target():
     target_data = TargetData(
         FilesGeneratorTarget(
@@ -354,6 +377,29 @@ def test_non_matching_build_target(rule_runner: RuleRunner) -> None:
     assert result.stdout == "[]\n"
 
 
+def test_ndjson_format(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "foo/BUILD": dedent(
+                """\
+                target(name="b", dependencies=[":a"])
+                target(name="a")
+                """
+            ),
+        }
+    )
+    json_result = rule_runner.run_goal_rule(Peek, args=["foo::"])
+    ndjson_result = rule_runner.run_goal_rule(Peek, args=["--format=ndjson", "foo::"])
+
+    assert [json.loads(line) for line in ndjson_result.stdout.splitlines()] == json.loads(
+        json_result.stdout
+    )
+    assert [json.loads(line)["address"] for line in ndjson_result.stdout.splitlines()] == [
+        "foo:a",
+        "foo:b",
+    ]
+
+
 def _normalize_fingerprints(tds: Sequence[TargetData]) -> list[TargetData]:
     """We're not here to test the computation of fingerprints."""
     return [
@@ -35,7 +35,7 @@ from pants.core.util_rules.stripped_source_files import StrippedFileName, Stripp
 from pants.engine.addresses import Address
 from pants.engine.environment import EnvironmentName
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.engine.target import AllTargets, Target
+from pants.engine.target import AllTargets, AllTargetsShard, AllTargetsShards, Target
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
@@ -197,6 +197,43 @@ class FirstPartyPythonModuleMapping:
         )
 
 
+@dataclass(frozen=True)
+class FirstPartyPythonModuleMappingShard(FirstPartyPythonModuleMapping):
+    """The part of the `FirstPartyPythonModuleMapping` which `providers_for_module` consults for a
+    single module, i.e. the providers of the module and of its parent.
+
+    Rules which look up a few modules should depend on the shards for those modules rather than on
+    the whole mapping, so that they are not rerun when unrelated modules are added or removed.
+    """
+
+
+@dataclass(frozen=True)
+class FirstPartyPythonModuleMappingShardRequest:
+    module: str
+
+
+@rule
+async def first_party_module_mapping_shard(
+    request: FirstPartyPythonModuleMappingShardRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+) -> FirstPartyPythonModuleMappingShard:
+    modules = (request.module, request.module.rsplit(".", maxsplit=1)[0])
+    resolves_to_modules_to_providers = (
+        (
+            resolve,
+            FrozenDict(
+                (module, mapping[module]) for module in sorted(set(modules)) if module in mapping
+            ),
+        )
+        for resolve, mapping in first_party_mapping.resolves_to_modules_to_providers.items()
+    )
+    return FirstPartyPythonModuleMappingShard(
+        FrozenDict(
+            (resolve, mapping) for resolve, mapping in resolves_to_modules_to_providers if mapping
+        )
+    )
+
+
 @rule(level=LogLevel.DEBUG)
 async def merge_first_party_module_mappings(
     union_membership: UnionMembership,
@@ -241,18 +278,44 @@ class FirstPartyPythonTargetsMappingMarker(FirstPartyPythonMappingImplMarker):
 )
 async def map_first_party_python_targets_to_modules(
     _: FirstPartyPythonTargetsMappingMarker,
-    all_python_targets: AllPythonTargets,
+    all_targets_shards: AllTargetsShards,
+) -> FirstPartyPythonMappingImpl:
+    # The targets are mapped per shard, so that only the shards whose targets changed are mapped
+    # again.
+    mappings_per_shard = await MultiGet(
+        Get(FirstPartyPythonMappingImpl, _FirstPartyPythonTargetsShard(shard))
+        for shard in all_targets_shards.with_field(PythonSourceField)
+    )
+
+    resolves_to_modules_to_providers: DefaultDict[
+        ResolveName, DefaultDict[str, list[ModuleProvider]]
+    ] = defaultdict(lambda: defaultdict(list))
+    for mapping_impl in mappings_per_shard:
+        for resolve, modules_to_providers in mapping_impl.items():
+            for module, providers in modules_to_providers.items():
+                resolves_to_modules_to_providers[resolve][module].extend(providers)
+    return FirstPartyPythonMappingImpl.create(resolves_to_modules_to_providers)
+
+
+@dataclass(frozen=True)
+class _FirstPartyPythonTargetsShard:
+    shard: AllTargetsShard
+
+
+@rule
+async def map_first_party_python_targets_shard_to_modules(
+    request: _FirstPartyPythonTargetsShard,
     python_setup: PythonSetup,
 ) -> FirstPartyPythonMappingImpl:
     stripped_file_per_target = await MultiGet(
         Get(StrippedFileName, StrippedFileNameRequest(tgt[PythonSourceField].file_path))
-        for tgt in all_python_targets.first_party
+        for tgt in request.shard.targets
     )
 
     resolves_to_modules_to_providers: DefaultDict[
         ResolveName, DefaultDict[str, list[ModuleProvider]]
     ] = defaultdict(lambda: defaultdict(list))
-    for tgt, stripped_file in zip(all_python_targets.first_party, stripped_file_per_target):
+    for tgt, stripped_file in zip(request.shard.targets, stripped_file_per_target):
         resolve = tgt[PythonResolveField].normalized_value(python_setup)
         stripped_f = PurePath(stripped_file.value)
         provider_type = (
@@ -452,9 +515,12 @@ class PythonModuleOwnersRequest:
 @rule
 async def map_module_to_address(
     request: PythonModuleOwnersRequest,
-    first_party_mapping: FirstPartyPythonModuleMapping,
     third_party_mapping: ThirdPartyPythonModuleMapping,
 ) -> PythonModuleOwners:
+    first_party_mapping = await Get(
+        FirstPartyPythonModuleMappingShard,
+        FirstPartyPythonModuleMappingShardRequest(request.module),
+    )
     possible_providers: tuple[PossibleModuleProvider, ...] = (
         *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
         *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
@@ -29,6 +29,8 @@ from pants.backend.python.dependency_inference.default_module_mapping import (
 )
 from pants.backend.python.dependency_inference.module_mapper import (
     FirstPartyPythonModuleMapping,
+    FirstPartyPythonModuleMappingShard,
+    FirstPartyPythonModuleMappingShardRequest,
     ModuleProvider,
     ModuleProviderType,
     PossibleModuleProvider,
@@ -267,6 +269,9 @@ def rule_runner() -> RuleRunner:
             *protobuf_additional_fields_rules(),
             *protobuf_target_type_rules(),
             QueryRule(FirstPartyPythonModuleMapping, []),
+            QueryRule(
+                FirstPartyPythonModuleMappingShard, [FirstPartyPythonModuleMappingShardRequest]
+            ),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModuleOwnersRequest]),
         ],
@@ -405,6 +410,35 @@ def test_map_first_party_modules_to_addresses(rule_runner: RuleRunner) -> None:
         )
     )
 
+    # A shard only contains the providers of the module and of its parent.
+    def shard(module: str) -> FirstPartyPythonModuleMappingShard:
+        return rule_runner.request(
+            FirstPartyPythonModuleMappingShard, [FirstPartyPythonModuleMappingShardRequest(module)]
+        )
+
+    default_modules = result.resolves_to_modules_to_providers["python-default"]
+    another_modules = result.resolves_to_modules_to_providers["another-resolve"]
+    assert shard("protos.f2_pb2.Message") == FirstPartyPythonModuleMappingShard(
+        FrozenDict(
+            {"python-default": FrozenDict({"protos.f2_pb2": default_modules["protos.f2_pb2"]})}
+        )
+    )
+    assert shard("project.util.dirutil") == FirstPartyPythonModuleMappingShard(
+        FrozenDict(
+            {
+                "another-resolve": FrozenDict(
+                    {"project.util.dirutil": another_modules["project.util.dirutil"]}
+                )
+            }
+        )
+    )
+    assert shard("unknown.module") == FirstPartyPythonModuleMappingShard(FrozenDict())
+    for module in ("multiple_owners", "protos.f1_pb2", "project.util.tarutil.Symbol"):
+        for resolve in ("python-default", "another-resolve", None):
+            assert shard(module).providers_for_module(
+                module, resolve
+            ) == result.providers_for_module(module, resolve)
+
 
 def test_map_third_party_modules_to_addresses(rule_runner: RuleRunner) -> None:
     def req(
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from enum import Enum
 from io import StringIO
 from pathlib import PurePath
-from typing import Any, MutableMapping, cast
+from typing import Any, MutableMapping, Sequence, cast
 
 import toml
 
@@ -56,6 +56,7 @@ from pants.option.option_types import (
     StrOption,
 )
 from pants.source.source_root import AllSourceRoots
+from pants.util.collections import partition_sequentially
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
 
@@ -370,16 +371,142 @@ class MergedCoverageData:
     addresses: tuple[Address, ...]
 
 
+# The number of `.coverage` files to aim to combine in each process when merging coverage data.
+_COMBINE_BATCH_SIZE = 32
+
+_GLOBAL_COVERAGE_BASE_DIR = PurePath("__global_coverage__")
+_COMBINED_COVERAGE_DIR = PurePath("__combined_coverage__")
+
+
+@dataclass(frozen=True)
+class CombineCoverageDataRequest:
+    """Combine the given `.coverage` files into a single `.coverage` file."""
+
+    digests: tuple[Digest, ...]
+    data_file_paths: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CombinedCoverageData:
+    digest: Digest
+
+
+@rule(level=LogLevel.DEBUG)
+async def combine_coverage_data(
+    request: CombineCoverageDataRequest, coverage_setup: CoverageSetup
+) -> CombinedCoverageData:
+    input_digest = await Get(Digest, MergeDigests(request.digests))
+    result = await Get(
+        ProcessResult,
+        VenvPexProcess(
+            coverage_setup.pex,
+            # We tell combine to keep the original input files, to aid debugging in the sandbox.
+            argv=("combine", "--keep", *sorted(request.data_file_paths)),
+            input_digest=input_digest,
+            output_files=(".coverage",),
+            description=f"Merge {len(request.data_file_paths)} Pytest coverage reports.",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    return CombinedCoverageData(result.output_digest)
+
+
+@dataclass(frozen=True)
+class GlobalCoverageBaseRequest:
+    sources_digest: Digest
+    source: tuple[str, ...]
+    branch: bool
+    namespace_packages: bool
+
+
+@dataclass(frozen=True)
+class GlobalCoverageBase:
+    """An empty coverage report of all the given sources, to merge into a global report."""
+
+    coverage_data: Digest
+    extra_sources: Digest
+
+
+@rule(desc="Create base global Pytest coverage report", level=LogLevel.DEBUG)
+async def create_global_coverage_base(
+    request: GlobalCoverageBaseRequest, coverage_setup: CoverageSetup
+) -> GlobalCoverageBase:
+    global_coverage_config_path = _GLOBAL_COVERAGE_BASE_DIR / "pyproject.toml"
+    global_coverage_config_content = toml.dumps(
+        {
+            "tool": {
+                "coverage": {
+                    "run": {
+                        "relative_files": True,
+                        "source": list(request.source),
+                        "branch": request.branch,
+                    },
+                    "report": {
+                        "include_namespace_packages": request.namespace_packages,
+                    },
+                }
+            }
+        }
+    ).encode()
+
+    no_op_exe_py_path = _GLOBAL_COVERAGE_BASE_DIR / "no-op-exe.py"
+
+    no_op_exe_py_digest, global_coverage_config_digest = await MultiGet(
+        Get(Digest, CreateDigest([FileContent(path=str(no_op_exe_py_path), content=b"")])),
+        Get(
+            Digest,
+            CreateDigest(
+                [
+                    FileContent(
+                        path=str(global_coverage_config_path),
+                        content=global_coverage_config_content,
+                    ),
+                ]
+            ),
+        ),
+    )
+    extra_sources_digest = await Get(
+        Digest, MergeDigests((request.sources_digest, no_op_exe_py_digest))
+    )
+    input_digest = await Get(
+        Digest, MergeDigests((extra_sources_digest, global_coverage_config_digest))
+    )
+    result = await Get(
+        ProcessResult,
+        VenvPexProcess(
+            coverage_setup.pex,
+            argv=("run", "--rcfile", str(global_coverage_config_path), str(no_op_exe_py_path)),
+            input_digest=input_digest,
+            output_files=(".coverage",),
+            description="Create base global Pytest coverage report.",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    coverage_data = await Get(
+        Digest, AddPrefix(digest=result.output_digest, prefix=str(_GLOBAL_COVERAGE_BASE_DIR))
+    )
+    return GlobalCoverageBase(coverage_data, extra_sources_digest)
+
+
+def _data_file_path(prefix: str) -> str:
+    return str(PurePath(prefix, ".coverage"))
+
+
+def _combined_data_prefix(depth: int, batch: Sequence[str]) -> str:
+    # Named after the first data file it combines rather than its position, so that adding or
+    # removing a batch does not rename the others, which would change the inputs of every level
+    # above them. The names also keep the order of the data files for the next level.
+    return str(_COMBINED_COVERAGE_DIR / str(depth) / PurePath(min(batch)).parent)
+
+
 @rule(desc="Merge Pytest coverage data", level=LogLevel.DEBUG)
 async def merge_coverage_data(
     data_collection: PytestCoverageDataCollection,
-    coverage_setup: CoverageSetup,
     coverage_config: CoverageConfig,
     coverage: CoverageSubsystem,
     source_roots: AllSourceRoots,
 ) -> MergedCoverageData:
-    coverage_digest_gets = []
-    coverage_data_file_paths = []
+    path_prefixes = []
     addresses: list[Address] = []
     for data in data_collection:
         path_prefix = data.addresses[0].path_safe_spec
@@ -387,10 +514,51 @@ async def merge_coverage_data(
             path_prefix = f"{path_prefix}+{len(data.addresses)-1}-others"
 
         # We prefix each .coverage file with its corresponding address to avoid collisions.
-        coverage_digest_gets.append(Get(Digest, AddPrefix(data.digest, prefix=path_prefix)))
-        coverage_data_file_paths.append(f"{path_prefix}/.coverage")
+        path_prefixes.append(path_prefix)
         addresses.extend(data.addresses)
 
+    prefixed_digests = await MultiGet(
+        Get(Digest, AddPrefix(data.digest, prefix=path_prefix))
+        for data, path_prefix in zip(data_collection, path_prefixes)
+    )
+    data_files = dict(zip(map(_data_file_path, path_prefixes), prefixed_digests))
+
+    # Rather than combining all of the data files in one process, we combine stable batches of
+    # them concurrently, and then combine the results, until few enough remain to combine at once.
+    # Unchanged batches of a run are then cache hits, and only the (small) levels above changed
+    # batches need to be combined again.
+    depth = 0
+    while len(data_files) > _COMBINE_BATCH_SIZE:
+        batches = list(
+            partition_sequentially(
+                data_files,
+                key=lambda path: path,
+                size_target=_COMBINE_BATCH_SIZE,
+                size_max=4 * _COMBINE_BATCH_SIZE,
+            )
+        )
+        combined_batches = [batch for batch in batches if len(batch) > 1]
+        combined = await MultiGet(
+            Get(
+                CombinedCoverageData,
+                CombineCoverageDataRequest(
+                    tuple(data_files[path] for path in batch), tuple(batch)
+                ),
+            )
+            for batch in combined_batches
+        )
+        prefixes = [_combined_data_prefix(depth, batch) for batch in combined_batches]
+        combined_digests = await MultiGet(
+            Get(Digest, AddPrefix(result.digest, prefix))
+            for result, prefix in zip(combined, prefixes)
+        )
+        next_data_files = dict(zip(map(_data_file_path, prefixes), combined_digests))
+        for batch in batches:
+            if len(batch) == 1:
+                next_data_files[batch[0]] = data_files[batch[0]]
+        data_files = next_data_files
+        depth += 1
+
     if coverage.global_report or coverage.filter:
         # It's important to set the `branch` value in the empty base report to the value it will
         # have when running on real inputs, so that the reports are of the same type, and can be
@@ -401,92 +569,35 @@ async def merge_coverage_data(
         namespace_packages = (
             get_namespace_value_from_config(config_contents[0]) if config_contents else False
         )
-        global_coverage_base_dir = PurePath("__global_coverage__")
-        global_coverage_config_path = global_coverage_base_dir / "pyproject.toml"
 
         if coverage.filter:
-            source = list(coverage.filter)
+            source = tuple(coverage.filter)
         else:
-            source = [source_root.path for source_root in source_roots]
-
-        global_coverage_config_content = toml.dumps(
-            {
-                "tool": {
-                    "coverage": {
-                        "run": {
-                            "relative_files": True,
-                            "source": source,
-                            "branch": branch,
-                        },
-                        "report": {
-                            "include_namespace_packages": namespace_packages,
-                        },
-                    }
-                }
-            }
-        ).encode()
-
-        no_op_exe_py_path = global_coverage_base_dir / "no-op-exe.py"
+            source = tuple(source_root.path for source_root in source_roots)
 
-        all_sources_digest, no_op_exe_py_digest, global_coverage_config_digest = await MultiGet(
-            Get(
-                Digest,
-                PathGlobs(globs=[f"{source_root.path}/**/*.py" for source_root in source_roots]),
-            ),
-            Get(Digest, CreateDigest([FileContent(path=str(no_op_exe_py_path), content=b"")])),
-            Get(
-                Digest,
-                CreateDigest(
-                    [
-                        FileContent(
-                            path=str(global_coverage_config_path),
-                            content=global_coverage_config_content,
-                        ),
-                    ]
-                ),
-            ),
-        )
-        extra_sources_digest = await Get(
-            Digest, MergeDigests((all_sources_digest, no_op_exe_py_digest))
+        all_sources_digest = await Get(
+            Digest,
+            PathGlobs(globs=[f"{source_root.path}/**/*.py" for source_root in source_roots]),
         )
-        input_digest = await Get(
-            Digest, MergeDigests((extra_sources_digest, global_coverage_config_digest))
-        )
-        result = await Get(
-            ProcessResult,
-            VenvPexProcess(
-                coverage_setup.pex,
-                argv=("run", "--rcfile", str(global_coverage_config_path), str(no_op_exe_py_path)),
-                input_digest=input_digest,
-                output_files=(".coverage",),
-                description="Create base global Pytest coverage report.",
-                level=LogLevel.DEBUG,
-            ),
+        # The base report only depends on the sources and the config, so it is created once per
+        # set of sources rather than once per run.
+        global_coverage_base = await Get(
+            GlobalCoverageBase,
+            GlobalCoverageBaseRequest(all_sources_digest, source, branch, namespace_packages),
         )
-        coverage_digest_gets.append(
-            Get(
-                Digest, AddPrefix(digest=result.output_digest, prefix=str(global_coverage_base_dir))
-            )
+        data_files[_data_file_path(str(_GLOBAL_COVERAGE_BASE_DIR))] = (
+            global_coverage_base.coverage_data
         )
-        coverage_data_file_paths.append(str(global_coverage_base_dir / ".coverage"))
+        extra_sources_digest = global_coverage_base.extra_sources
     else:
         extra_sources_digest = EMPTY_DIGEST
 
-    input_digest = await Get(Digest, MergeDigests(await MultiGet(coverage_digest_gets)))
     result = await Get(
-        ProcessResult,
-        VenvPexProcess(
-            coverage_setup.pex,
-            # We tell combine to keep the original input files, to aid debugging in the sandbox.
-            argv=("combine", "--keep", *sorted(coverage_data_file_paths)),
-            input_digest=input_digest,
-            output_files=(".coverage",),
-            description=f"Merge {len(coverage_data_file_paths)} Pytest coverage reports.",
-            level=LogLevel.DEBUG,
-        ),
+        CombinedCoverageData,
+        CombineCoverageDataRequest(tuple(data_files.values()), tuple(data_files)),
     )
     return MergedCoverageData(
-        await Get(Digest, MergeDigests((result.output_digest, extra_sources_digest))),
+        await Get(Digest, MergeDigests((result.digest, extra_sources_digest))),
         tuple(sorted(addresses)),
     )
 
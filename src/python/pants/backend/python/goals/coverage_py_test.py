@@ -3,23 +3,35 @@
 
 from __future__ import annotations
 
+import hashlib
 from textwrap import dedent
 
 from pants.backend.python.goals.coverage_py import (
+    CombineCoverageDataRequest,
+    CombinedCoverageData,
+    CoverageConfig,
     CoverageSubsystem,
+    MergedCoverageData,
+    PytestCoverageData,
+    PytestCoverageDataCollection,
     create_or_update_coverage_config,
     get_branch_value_from_config,
     get_namespace_value_from_config,
+    merge_coverage_data,
 )
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
+from pants.engine.addresses import Address
 from pants.engine.fs import (
     EMPTY_DIGEST,
     EMPTY_SNAPSHOT,
+    AddPrefix,
     CreateDigest,
     Digest,
     DigestContents,
     FileContent,
+    MergeDigests,
 )
+from pants.source.source_root import AllSourceRoots
 from pants.testutil.option_util import create_subsystem
 from pants.testutil.rule_runner import MockGet, RuleRunner, run_rule_with_mocks
 
@@ -439,3 +451,99 @@ def test_get_namespace_value_from_config() -> None:
         )
         is True
     )
+
+
+def merge_coverage_data_with_mocks(
+    addresses: list[Address],
+) -> tuple[MergedCoverageData, list[CombineCoverageDataRequest], dict[Digest, frozenset[Address]]]:
+    # The addresses whose coverage data is included in each digest.
+    contents: dict[Digest, frozenset[Address]] = {}
+
+    def make_digest(key: str, addresses: frozenset[Address]) -> Digest:
+        digest = Digest(hashlib.sha256(key.encode()).hexdigest(), len(addresses))
+        contents[digest] = addresses
+        return digest
+
+    def mock_add_prefix(request: AddPrefix) -> Digest:
+        key = f"{request.prefix}/{request.digest.fingerprint}"
+        return make_digest(key, contents[request.digest])
+
+    combine_requests: list[CombineCoverageDataRequest] = []
+
+    def mock_combine(request: CombineCoverageDataRequest) -> CombinedCoverageData:
+        assert len(request.digests) == len(request.data_file_paths)
+        combine_requests.append(request)
+        addresses = [address for digest in request.digests for address in contents[digest]]
+        assert len(addresses) == len(set(addresses))
+        key = repr([*request.data_file_paths, *(digest.fingerprint for digest in request.digests)])
+        return CombinedCoverageData(make_digest(key, frozenset(addresses)))
+
+    data_collection = PytestCoverageDataCollection(
+        PytestCoverageData((address,), make_digest(address.spec, frozenset([address])))
+        for address in addresses
+    )
+    result = run_rule_with_mocks(
+        merge_coverage_data,
+        rule_args=[
+            data_collection,
+            CoverageConfig(EMPTY_DIGEST, ".coveragerc"),
+            create_subsystem(CoverageSubsystem, global_report=False, filter=[]),
+            AllSourceRoots(),
+        ],
+        mock_gets=[
+            MockGet(output_type=Digest, input_types=(AddPrefix,), mock=mock_add_prefix),
+            MockGet(
+                output_type=CombinedCoverageData,
+                input_types=(CombineCoverageDataRequest,),
+                mock=mock_combine,
+            ),
+            MockGet(
+                output_type=Digest,
+                input_types=(MergeDigests,),
+                mock=lambda request: request.digests[0],
+            ),
+        ],
+    )
+    return result, combine_requests, contents
+
+
+def test_merge_coverage_data_in_batches() -> None:
+    addresses = [Address("src", relative_file_path=f"test_{i}.py") for i in range(500)]
+    result, combine_requests, contents = merge_coverage_data_with_mocks(addresses)
+
+    # The data was combined in batches, and then once more to produce the final result.
+    *batch_requests, final_request = combine_requests
+    assert batch_requests
+    assert all(1 < len(request.digests) <= 128 for request in batch_requests)
+    assert len(final_request.digests) <= 32
+    assert contents[result.coverage_data] == frozenset(addresses)
+    assert result.addresses == tuple(sorted(addresses))
+
+
+def test_merge_coverage_data_in_stable_batches() -> None:
+    # Enough test batches for two levels of intermediate batches.
+    addresses = [Address("src", relative_file_path=f"test_{i:04}.py") for i in range(5000)]
+    _, combine_requests, _ = merge_coverage_data_with_mocks(addresses)
+    _, combine_requests_without_one, _ = merge_coverage_data_with_mocks(
+        [address for address in addresses if address.spec != "src/test_2500.py"]
+    )
+
+    def requests_by_level(
+        requests: list[CombineCoverageDataRequest],
+    ) -> list[set[CombineCoverageDataRequest]]:
+        levels: dict[str, set[CombineCoverageDataRequest]] = {}
+        for request in requests[:-1]:
+            first_path = request.data_file_paths[0]
+            level = first_path.split("/")[1] if first_path.startswith("__combined") else "tests"
+            levels.setdefault(level, set()).add(request)
+        return [levels[level] for level in sorted(levels)]
+
+    # Only the batch containing the removed data at each level (or two, if the removal moved a
+    # batch boundary) needs to be combined again, and the others are cache hits.
+    levels = requests_by_level(combine_requests)
+    levels_without_one = requests_by_level(combine_requests_without_one)
+    assert len(levels) == len(levels_without_one) == 2
+    for requests, requests_without_one in zip(levels, levels_without_one):
+        assert len(requests) > 2
+        assert 1 <= len(requests - requests_without_one) <= 2
+        assert 1 <= len(requests_without_one - requests) <= 2
@@ -25,6 +25,8 @@ from pants.backend.python.util_rules.pex_requirements import (
     PexRequirements,
     ResolvePexConfig,
     ResolvePexConfigRequest,
+    is_probably_pex_json_lockfile,
+    strip_comments_from_pex_json_lockfile,
 )
 from pants.core.goals.generate_lockfiles import (
     DEFAULT_TOOL_LOCKFILE,
@@ -39,7 +41,15 @@ from pants.core.goals.generate_lockfiles import (
 )
 from pants.core.goals.resolves import ExportableTool
 from pants.core.util_rules.lockfile_metadata import calculate_invalidation_digest
-from pants.engine.fs import CreateDigest, Digest, DigestContents, FileContent, MergeDigests
+from pants.engine.fs import (
+    CreateDigest,
+    Digest,
+    DigestContents,
+    FileContent,
+    GlobMatchErrorBehavior,
+    MergeDigests,
+    PathGlobs,
+)
 from pants.engine.internals.synthetic_targets import SyntheticAddressMaps, SyntheticTargetsRequest
 from pants.engine.internals.target_adaptor import TargetAdaptor
 from pants.engine.process import ProcessCacheScope, ProcessResult
@@ -91,6 +101,26 @@ async def _setup_pip_args_and_constraints_file(resolve_name: str) -> _PipArgsAnd
     return _PipArgsAndConstraintsSetup(resolve_config, tuple(args), input_digest)
 
 
+async def _existing_lockfile_digest(lockfile_dest: str) -> Digest | None:
+    """The existing Pex lockfile for the resolve, without its header, as `lock.json`."""
+    digest_contents = await Get(
+        DigestContents,
+        PathGlobs([lockfile_dest], glob_match_error_behavior=GlobMatchErrorBehavior.ignore),
+    )
+    if not digest_contents or not is_probably_pex_json_lockfile(digest_contents[0].content):
+        return None
+    return await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(
+                    "lock.json", strip_comments_from_pex_json_lockfile(digest_contents[0].content)
+                )
+            ]
+        ),
+    )
+
+
 @rule(desc="Generate Python lockfile", level=LogLevel.DEBUG)
 async def generate_lockfile(
     req: GeneratePythonLockfile,
@@ -108,12 +138,30 @@ async def generate_lockfile(
 
     python = await Get(PythonExecutable, InterpreterConstraints, req.interpreter_constraints)
 
+    # With `--incremental`, `pex3 lock sync` updates the existing lockfile, only re-resolving the
+    # requirements which changed.
+    existing_lockfile_digest = (
+        await _existing_lockfile_digest(req.lockfile_dest)
+        if generate_lockfiles_subsystem.incremental
+        else None
+    )
+    if existing_lockfile_digest:
+        subcommand = ("lock", "sync")
+        lockfile_arg = "--lock=lock.json"
+        input_digest = await Get(
+            Digest, MergeDigests([pip_args_setup.digest, existing_lockfile_digest])
+        )
+    else:
+        subcommand = ("lock", "create")
+        lockfile_arg = "--output=lock.json"
+        input_digest = pip_args_setup.digest
+
     result = await Get(
         ProcessResult,
         PexCliProcess(
-            subcommand=("lock", "create"),
+            subcommand=subcommand,
             extra_args=(
-                "--output=lock.json",
+                lockfile_arg,
                 # See https://github.com/pantsbuild/pants/issues/12458. For now, we always
                 # generate universal locks because they have the best compatibility. We may
                 # want to let users change this, as `style=strict` is safer.
@@ -142,7 +190,7 @@ async def generate_lockfile(
                 *req.interpreter_constraints.generate_pex_arg_list(),
                 *req.requirements,
             ),
-            additional_input_digest=pip_args_setup.digest,
+            additional_input_digest=input_digest,
             output_files=("lock.json",),
             description=f"Generate lockfile for {req.resolve_name}",
             # Instead of caching lockfile generation with LMDB, we instead use the invalidation
@@ -196,6 +196,26 @@ def test_constraints_file(rule_runner: PythonRuleRunner) -> None:
     assert reqs[0]["version"] == "1.1.7"
 
 
+def test_incremental(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.set_options(
+        ["--python-resolves={'test': 'foo.lock'}", "--generate-lockfiles-incremental"],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+    # Without an existing lockfile, the lockfile is generated from scratch.
+    rule_runner.write_files(
+        {"test.lock": _generate(rule_runner=rule_runner, requirements_string="ansicolors==1.1.7")}
+    )
+
+    # The locked version still satisfies the requirement, so it is kept.
+    lock_entry = json.loads(
+        _generate(rule_runner=rule_runner, requirements_string="ansicolors>=1.0")
+    )
+    reqs = lock_entry["locked_resolves"][0]["locked_requirements"]
+    assert len(reqs) == 1
+    assert reqs[0]["project_name"] == "ansicolors"
+    assert reqs[0]["version"] == "1.1.7"
+
+
 def test_multiple_resolves() -> None:
     rule_runner = PythonRuleRunner(
         rules=[
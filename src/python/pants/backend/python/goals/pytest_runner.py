@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
 from abc import ABC, abstractmethod
@@ -35,7 +37,12 @@ from pants.backend.python.util_rules.pex import (
     VenvPex,
     VenvPexProcess,
 )
-from pants.backend.python.util_rules.pex_from_targets import RequirementsPexRequest
+from pants.backend.python.util_rules.pex_from_targets import (
+    ChosenPythonResolve,
+    ChosenPythonResolveRequest,
+    EntireResolvePexRequest,
+    RequirementsPexRequest,
+)
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
 from pants.backend.python.util_rules.python_sources import (
     PythonSourceFiles,
@@ -53,9 +60,16 @@ from pants.core.goals.test import (
     TestSubsystem,
 )
 from pants.core.subsystems.debug_adapter import DebugAdapterSubsystem
+from pants.core.util_rules import split_digest
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
+from pants.core.util_rules.environments import (
+    EnvironmentsSubsystem,
+    EnvironmentTarget,
+    LocalEnvironmentTarget,
+)
 from pants.core.util_rules.partitions import Partition, PartitionerType, Partitions
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.core.util_rules.split_digest import DigestPart, SplitDigest, SplitDigestRequest
 from pants.engine.addresses import Address
 from pants.engine.collection import Collection
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
@@ -67,10 +81,9 @@ from pants.engine.fs import (
     DigestContents,
     DigestSubset,
     Directory,
+    FileContent,
     MergeDigests,
     PathGlobs,
-    RemovePrefix,
-    Snapshot,
 )
 from pants.engine.process import (
     InteractiveProcess,
@@ -94,6 +107,7 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.pip_requirement import PipRequirement
+from pants.util.resources import read_resource
 from pants.util.strutil import softwrap
 
 logger = logging.getLogger()
@@ -174,6 +188,11 @@ async def run_all_setup_plugins(
 # ./pants test <target> -- --html=extra-output/report.html
 _EXTRA_OUTPUT_DIR = "extra-output"
 
+_FORK_SERVER_SCRIPT_RESOURCE = "scripts/pytest_fork_server.py"
+_FORK_SERVER_SCRIPT = "__pants_pytest_fork_server.py"
+_FORK_SERVER_CACHE_NAME = "pytest_fork_server"
+_FORK_SERVER_CACHE_PATH = ".cache/pytest_fork_server"
+
 
 @dataclass(frozen=True)
 class TestMetadata:
@@ -260,6 +279,10 @@ async def setup_pytest_for_target(
     coverage_config: CoverageConfig,
     coverage_subsystem: CoverageSubsystem,
     test_extra_env: TestExtraEnv,
+    python_setup: PythonSetup,
+    env_tgt: EnvironmentTarget,
+    environments_subsystem: EnvironmentsSubsystem,
+    global_options: GlobalOptions,
 ) -> TestSetup:
     addresses = tuple(field_set.address for field_set in request.field_sets)
 
@@ -271,7 +294,16 @@ async def setup_pytest_for_target(
 
     interpreter_constraints = request.metadata.interpreter_constraints
 
-    requirements_pex_get = Get(Pex, RequirementsPexRequest(addresses))
+    if python_setup.run_against_entire_lockfile and python_setup.enable_resolves:
+        # Request the entire lockfile independently of the batch, so that all batches for the same
+        # resolve and interpreter constraints share a single runner venv, with only their sources
+        # differing.
+        chosen_resolve = await Get(ChosenPythonResolve, ChosenPythonResolveRequest(addresses))
+        requirements_pex_get = Get(
+            Pex, EntireResolvePexRequest(chosen_resolve.name, interpreter_constraints)
+        )
+    else:
+        requirements_pex_get = Get(Pex, RequirementsPexRequest(addresses))
     pytest_pex_get = Get(
         Pex, PexRequest, pytest.to_pex_request(interpreter_constraints=interpreter_constraints)
     )
@@ -421,6 +453,50 @@ async def setup_pytest_for_target(
         **field_set_extra_env,
     }
 
+    argv_prefix: tuple[str, ...] = ()
+    append_only_caches: dict[str, str] = {}
+    # The server outlives the sandbox of the batch which started it, so it must run on this
+    # machine, rather than e.g. in a Docker container or a remote execution worker.
+    is_local_environment = isinstance(env_tgt.val, LocalEnvironmentTarget) or (
+        env_tgt.val is None
+        and not environments_subsystem.remote_execution_used_globally(global_options)
+    )
+    if (
+        pytest.fork_server
+        and is_local_environment
+        and not request.is_debug
+        and not pytest.xdist_enabled
+    ):
+        # The script is run by the venv PEX acting as an interpreter, and either hands the tests
+        # over to a server for this runner PEX, config and environment, or runs them itself. See
+        # the script for details.
+        fork_server_script = read_resource(__name__, _FORK_SERVER_SCRIPT_RESOURCE)
+        fork_server_key = hashlib.sha256(
+            json.dumps(
+                [
+                    hashlib.sha256(fork_server_script).hexdigest(),
+                    pytest_runner_pex.digest.fingerprint,
+                    pytest_config_digest.fingerprint,
+                    pytest.fork_server_preload,
+                    # The source roots vary between batches, but are only used by the children.
+                    sorted(item for item in extra_env.items() if item[0] != "PEX_EXTRA_SYS_PATH"),
+                ]
+            ).encode()
+        ).hexdigest()[:16]
+        fork_server_digest = await Get(
+            Digest, CreateDigest([FileContent(_FORK_SERVER_SCRIPT, fork_server_script)])
+        )
+        input_digest = await Get(Digest, MergeDigests((input_digest, fork_server_digest)))
+        extra_env = {
+            **extra_env,
+            "PEX_INTERPRETER": "1",
+            "_PANTS_PYTEST_FORK_SERVER_KEY": fork_server_key,
+            "_PANTS_PYTEST_FORK_SERVER_DIR": _FORK_SERVER_CACHE_PATH,
+            "_PANTS_PYTEST_FORK_SERVER_PRELOAD": ",".join(pytest.fork_server_preload),
+        }
+        argv_prefix = (_FORK_SERVER_SCRIPT,)
+        append_only_caches[_FORK_SERVER_CACHE_NAME] = _FORK_SERVER_CACHE_PATH
+
     # Cache test runs only if they are successful, or not at all if `--test-force`.
     cache_scope = (
         ProcessCacheScope.PER_SESSION if test_subsystem.force else ProcessCacheScope.SUCCESSFUL
@@ -451,6 +527,7 @@ async def setup_pytest_for_target(
         VenvPexProcess(
             pytest_runner_pex,
             argv=(
+                *argv_prefix,
                 *request.prepend_argv,
                 *pytest.args,
                 *(("-c", pytest.config) if pytest.config else ()),
@@ -470,6 +547,7 @@ async def setup_pytest_for_target(
             description=f"Run Pytest for {run_description}",
             level=LogLevel.DEBUG,
             cache_scope=cache_scope,
+            append_only_caches=append_only_caches,
         ),
     )
     return TestSetup(process, results_file_name=results_file_name)
@@ -540,11 +618,21 @@ async def run_python_tests(
             description = f"{description} ({batch.partition_metadata.description})"
         return description
 
+    # Extract all the outputs we're interested in at once, rather than with a `DigestSubset` each.
+    output_parts = [
+        DigestPart("extra_output", (f"{_EXTRA_OUTPUT_DIR}/**",), strip_prefix=_EXTRA_OUTPUT_DIR)
+    ]
+    if test_subsystem.use_coverage:
+        output_parts.append(DigestPart("coverage", (".coverage",)))
+    if setup.results_file_name:
+        output_parts.append(DigestPart("xml_results", (setup.results_file_name,)))
+    outputs = await Get(
+        SplitDigest, SplitDigestRequest(last_result.output_digest, tuple(output_parts))
+    )
+
     coverage_data = None
     if test_subsystem.use_coverage:
-        coverage_snapshot = await Get(
-            Snapshot, DigestSubset(last_result.output_digest, PathGlobs([".coverage"]))
-        )
+        coverage_snapshot = outputs["coverage"]
         if coverage_snapshot.files == (".coverage",):
             coverage_data = PytestCoverageData(
                 tuple(field_set.address for field_set in batch.elements), coverage_snapshot.digest
@@ -554,17 +642,10 @@ async def run_python_tests(
 
     xml_results_snapshot = None
     if setup.results_file_name:
-        xml_results_snapshot = await Get(
-            Snapshot, DigestSubset(last_result.output_digest, PathGlobs([setup.results_file_name]))
-        )
+        xml_results_snapshot = outputs["xml_results"]
         if xml_results_snapshot.files != (setup.results_file_name,):
             logger.warning(f"Failed to generate JUnit XML data for {warning_description()}.")
-    extra_output_snapshot = await Get(
-        Snapshot, DigestSubset(last_result.output_digest, PathGlobs([f"{_EXTRA_OUTPUT_DIR}/**"]))
-    )
-    extra_output_snapshot = await Get(
-        Snapshot, RemovePrefix(extra_output_snapshot.digest, _EXTRA_OUTPUT_DIR)
-    )
+    extra_output_snapshot = outputs["extra_output"]
 
     return TestResult.from_batched_fallible_process_result(
         results.results,
@@ -652,6 +733,7 @@ def rules():
     return [
         *collect_rules(),
         *pytest.rules(),
+        *split_digest.rules(),
         UnionRule(PytestPluginSetupRequest, RuntimePackagesPluginRequest),
         *PyTestRequest.rules(),
     ]
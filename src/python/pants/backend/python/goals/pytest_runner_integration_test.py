@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import glob
 import os
 import re
+import signal
 import unittest.mock
+import uuid
 from textwrap import dedent
 from typing import Iterable
 
@@ -980,3 +983,85 @@ def test_batched_failing(rule_runner: PythonRuleRunner) -> None:
     stdout_text = result.stdout_simplified_str
     assert f"{PACKAGE}/test_1.py ." in stdout_text
     assert f"{PACKAGE}/test_2.py F" in stdout_text
+
+
+def test_fork_server(rule_runner: PythonRuleRunner) -> None:
+    test_run_id = uuid.uuid4().hex
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/helper.py": "VALUE = 42\n",
+            f"{PACKAGE}/test_good.py": dedent(
+                """\
+                import os
+                from pants_test.helper import VALUE
+
+                def test():
+                    assert VALUE == 42
+                    assert os.getenv("SOME_VAR") == "some_value"
+                    assert "PEX_INTERPRETER" not in os.environ
+                """
+            ),
+            f"{PACKAGE}/test_bad.py": dedent(
+                """\
+                def test():
+                    assert False
+                """
+            ),
+            f"{PACKAGE}/BUILD": dedent(
+                f"""\
+                python_sources(name="lib", sources=["helper.py"])
+                python_tests(
+                    name="tests",
+                    # Servers are started per environment, so this test gets its own server.
+                    extra_env_vars=["SOME_VAR=some_value", "TEST_RUN_ID={test_run_id}"],
+                )
+                """
+            ),
+        }
+    )
+    extra_args = ["--pytest-fork-server", "--pytest-fork-server-preload=['json']"]
+    good_tgt = rule_runner.get_target(
+        Address(PACKAGE, target_name="tests", relative_file_path="test_good.py")
+    )
+    bad_tgt = rule_runner.get_target(
+        Address(PACKAGE, target_name="tests", relative_file_path="test_bad.py")
+    )
+
+    # Each server writes its pid next to its socket in the named cache.
+    server_dir = os.path.join(
+        rule_runner.options_bootstrapper.bootstrap_options.for_global_scope().named_caches_dir,
+        "pytest_fork_server",
+    )
+
+    def server_pid_files() -> set[str]:
+        return set(glob.glob(os.path.join(server_dir, "*.pid")))
+
+    existing_pid_files = server_pid_files()
+    try:
+        for _ in range(2):
+            result = run_pytest(rule_runner, [good_tgt], extra_args=[*extra_args, "--test-force"])
+            assert result.xml_results is not None
+            assert result.exit_code == 0
+            assert f"{PACKAGE}/test_good.py ." in result.stdout_simplified_str
+
+        result = run_pytest(rule_runner, [bad_tgt], extra_args=extra_args)
+        assert result.xml_results is not None
+        assert result.exit_code == 1
+        assert f"{PACKAGE}/test_bad.py F" in result.stdout_simplified_str
+
+        # The batches were handed over to a server, rather than run by the clients.
+        new_pid_files = server_pid_files() - existing_pid_files
+        assert new_pid_files
+        for pid_file in new_pid_files:
+            assert os.path.exists(os.path.splitext(pid_file)[0] + ".sock")
+    finally:
+        for pid_file in server_pid_files() - existing_pid_files:
+            with open(pid_file) as f:
+                pid = int(f.read())
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            for path in (pid_file, os.path.splitext(pid_file)[0] + ".sock"):
+                if os.path.exists(path):
+                    os.unlink(path)
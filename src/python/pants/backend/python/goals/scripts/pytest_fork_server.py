@@ -0,0 +1,364 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This must be compatible with Python 3.6+.
+#
+# Runs Pytest in a process forked from a long-lived server, which has already imported Pytest, its
+# plugins and any configured modules.
+#
+# This script is invoked in the sandbox of each test batch (the "client"), with the arguments for
+# Pytest. The client connects to the server for its key, starting it if needed, and hands it the
+# sandbox working directory, arguments, environment, `sys.path` and stdio file descriptors. The
+# server forks a child for the batch, which runs Pytest as though it had been started in the
+# sandbox, and reports the exit code back to the client. Since all inputs are read from and all
+# outputs are written to the sandbox, the results are the same as when running Pytest directly.
+#
+# The server is started in the background, writes its pid next to its socket and exits after being
+# idle for a while. If anything goes wrong while connecting to the server, the client runs Pytest
+# itself.
+
+import array
+import errno
+import fcntl
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import time
+
+KEY_ENV = "_PANTS_PYTEST_FORK_SERVER_KEY"
+DIR_ENV = "_PANTS_PYTEST_FORK_SERVER_DIR"
+PRELOAD_ENV = "_PANTS_PYTEST_FORK_SERVER_PRELOAD"
+
+IDLE_TIMEOUT_SECONDS = 600
+STARTUP_TIMEOUT_SECONDS = 60
+
+_LENGTH = struct.Struct("!I")
+_EXIT_CODE = struct.Struct("!i")
+_STDIO_FDS = (0, 1, 2)
+
+
+def _recv_exactly(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise EOFError()
+        data += chunk
+    return data
+
+
+def _run_pytest(args):
+    import pytest
+
+    sys.argv = ["pytest", *args]
+    return pytest.main(args)
+
+
+# -----------------------------------------------------------------------------------------
+# Client
+# -----------------------------------------------------------------------------------------
+
+
+def _connect(socket_name):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # Socket paths are limited to ~100 bytes, so we connect using a path relative to the
+        # server directory.
+        sock.connect(socket_name)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _start_server(server_dir, key):
+    # The sandbox will go away, so the server runs from a copy of this script.
+    script = os.path.join(server_dir, key + ".py")
+    with open(os.path.abspath(__file__), "rb") as src, open(script, "wb") as dst:
+        dst.write(src.read())
+
+    with open(os.path.join(server_dir, key + ".log"), "ab") as log:
+        env = {
+            name: value
+            for name, value in os.environ.items()
+            if not name.startswith("PEX_") and name != DIR_ENV
+        }
+        return subprocess.Popen(
+            [sys.executable, script, "serve"],
+            cwd=server_dir,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+
+def _connect_or_start_server(server_dir, key):
+    socket_name = key + ".sock"
+    cwd = os.getcwd()
+    os.chdir(server_dir)
+    try:
+        with open(key + ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            sock = _connect(socket_name)
+            if sock is not None:
+                return sock
+
+            server = _start_server(server_dir, key)
+            deadline = time.time() + STARTUP_TIMEOUT_SECONDS
+            while time.time() < deadline and server.poll() is None:
+                sock = _connect(socket_name)
+                if sock is not None:
+                    return sock
+                time.sleep(0.01)
+            return None
+    finally:
+        os.chdir(cwd)
+
+
+def _request_pytest_run(sock, args):
+    # The script's own directory is on the path only because this script was invoked directly.
+    sys_path = list(sys.path)
+    if sys_path and os.path.abspath(sys_path[0]) == os.path.dirname(os.path.abspath(__file__)):
+        del sys_path[0]
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name not in (KEY_ENV, DIR_ENV, PRELOAD_ENV)
+    }
+    request = json.dumps(
+        {"cwd": os.getcwd(), "args": args, "env": env, "sys_path": sys_path}
+    ).encode("utf-8")
+    fds = array.array("i", _STDIO_FDS)
+    sock.sendmsg(
+        [_LENGTH.pack(len(request))], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds.tobytes())]
+    )
+    sock.sendall(request)
+    (exit_code,) = _EXIT_CODE.unpack(_recv_exactly(sock, _EXIT_CODE.size))
+    return exit_code
+
+
+def client_main(args):
+    # This script is run by the venv PEX acting as an interpreter, which Pytest should not inherit.
+    os.environ.pop("PEX_INTERPRETER", None)
+
+    sock = None
+    try:
+        server_dir = os.path.realpath(os.environ[DIR_ENV])
+        os.makedirs(server_dir, exist_ok=True)
+        sock = _connect_or_start_server(server_dir, os.environ[KEY_ENV])
+    except (KeyError, OSError) as e:
+        sys.stderr.write("Failed to connect to the Pytest fork server: {}\n".format(e))
+
+    if sock is None:
+        return _run_pytest(args)
+
+    # N.B.: Once the request has been sent, the tests may have started, so we must not retry.
+    with sock:
+        try:
+            return _request_pytest_run(sock, args)
+        except (EOFError, OSError) as e:
+            sys.stderr.write("The Pytest fork server failed to run the tests: {!r}\n".format(e))
+            return 1
+
+
+# -----------------------------------------------------------------------------------------
+# Server
+# -----------------------------------------------------------------------------------------
+
+
+def _preload():
+    import pytest  # noqa: F401
+
+    try:
+        from importlib.metadata import entry_points
+
+        if sys.version_info >= (3, 10):
+            plugins = entry_points(group="pytest11")
+        else:
+            plugins = entry_points().get("pytest11", ())
+    except Exception:
+        plugins = ()
+    modules = [plugin.value.split(":")[0] for plugin in plugins]
+    modules.extend(filter(None, os.environ.get(PRELOAD_ENV, "").split(",")))
+
+    for module in modules:
+        try:
+            __import__(module)
+        except Exception as e:
+            print("Failed to preload {}: {}".format(module, e), flush=True)
+
+
+def _run_child(request, fds):
+    os.setpgid(0, 0)
+    for fd, target in zip(fds, _STDIO_FDS):
+        os.dup2(fd, target)
+        os.close(fd)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.path[:] = request["sys_path"]
+
+    exit_code = 1
+    try:
+        exit_code = int(_run_pytest(request["args"]))
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _receive_request(conn):
+    fds = array.array("i")
+    data, ancdata, _, _ = conn.recvmsg(
+        _LENGTH.size, socket.CMSG_LEN(len(_STDIO_FDS) * fds.itemsize)
+    )
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+    if len(data) != _LENGTH.size or len(fds) != len(_STDIO_FDS):
+        for fd in fds:
+            os.close(fd)
+        raise EOFError()
+    (length,) = _LENGTH.unpack(data)
+    return json.loads(_recv_exactly(conn, length).decode("utf-8")), list(fds)
+
+
+def _has_pending(key, listener, socket_name):
+    """Checks for connections made before shutting down, removing the socket if there are none.
+
+    Clients hold the lock while connecting, so once we hold it no more connections can be made.
+    """
+
+    with open(key + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        readable, _, _ = select.select([listener], [], [], 0)
+        if readable:
+            return True
+        os.unlink(socket_name)
+        return False
+
+
+def _exit_code(status):
+    if os.WIFSIGNALED(status):
+        return 128 + os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def server_main():
+    # The server must not see anything but the venv: the script's own directory is only on the
+    # path because the script was invoked directly.
+    del sys.path[0]
+    key = os.environ[KEY_ENV]
+    socket_name = key + ".sock"
+
+    _preload()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        os.unlink(socket_name)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+    listener.bind(socket_name)
+    listener.listen(64)
+    pid_file = key + ".pid"
+    with open(pid_file, "w") as f:
+        f.write(str(os.getpid()))
+
+    # Wake up as soon as a child exits, to report its exit code without delay.
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_r, False)
+    os.set_blocking(wakeup_w, False)
+    signal.set_wakeup_fd(wakeup_w)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    # Running children, by pid, and the connection to report their exit code to.
+    children = {}
+    last_active = time.time()
+    try:
+        while children or time.time() - last_active < IDLE_TIMEOUT_SECONDS or _has_pending(
+            key, listener, socket_name
+        ):
+            readable, _, _ = select.select([listener, wakeup_r, *children.values()], [], [], 1.0)
+            for sock in readable:
+                if sock is wakeup_r:
+                    try:
+                        while os.read(wakeup_r, 1024):
+                            pass
+                    except BlockingIOError:
+                        pass
+                elif sock is listener:
+                    conn, _ = listener.accept()
+                    try:
+                        request, fds = _receive_request(conn)
+                    except (EOFError, OSError, ValueError):
+                        conn.close()
+                        continue
+                    pid = os.fork()
+                    if pid == 0:
+                        signal.set_wakeup_fd(-1)
+                        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                        os.close(wakeup_r)
+                        os.close(wakeup_w)
+                        listener.close()
+                        for other in children.values():
+                            other.close()
+                        conn.close()
+                        _run_child(request, fds)
+                    try:
+                        os.setpgid(pid, pid)
+                    except OSError:
+                        pass
+                    for fd in fds:
+                        os.close(fd)
+                    children[pid] = conn
+                else:
+                    # The client should not send anything else, so it went away: e.g. because it
+                    # timed out or was interrupted.
+                    for pid, conn in list(children.items()):
+                        if conn is sock:
+                            try:
+                                os.killpg(pid, signal.SIGKILL)
+                            except OSError:
+                                pass
+
+            while children:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                conn = children.pop(pid, None)
+                if conn is not None:
+                    try:
+                        conn.sendall(_EXIT_CODE.pack(_exit_code(status)))
+                    except OSError:
+                        pass
+                    conn.close()
+                last_active = time.time()
+    finally:
+        listener.close()
+        try:
+            os.unlink(pid_file)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["serve"]:
+        server_main()
+    else:
+        sys.exit(client_main(sys.argv[1:]))
@@ -26,7 +26,14 @@ from pants.core.util_rules.environments import EnvironmentField
 from pants.engine.rules import collect_rules
 from pants.engine.target import Target
 from pants.engine.unions import UnionRule
-from pants.option.option_types import ArgsListOption, BoolOption, FileOption, SkipOption, StrOption
+from pants.option.option_types import (
+    ArgsListOption,
+    BoolOption,
+    FileOption,
+    SkipOption,
+    StrListOption,
+    StrOption,
+)
 from pants.util.strutil import softwrap
 
 
@@ -131,6 +138,39 @@ class PyTest(PythonToolBase):
         ),
     )
 
+    fork_server = BoolOption(
+        default=False,
+        advanced=True,
+        help=lambda cls: softwrap(
+            f"""
+            If true, Pants will run each batch of tests in a process forked from a long-lived
+            server that has already imported Pytest, its plugins and the modules listed in
+            `[{cls.options_scope}].fork_server_preload`, rather than in a fresh interpreter.
+
+            A server is started for each combination of Pytest runner PEX, Pytest config and
+            environment variables, and exits after being idle for a while. Tests still read their
+            inputs from and write their outputs to the sandbox, so results are cached as usual.
+
+            This requires the tests to run with Python 3.6+, and tests must not rely on state left
+            behind in the server by imports (e.g. by monkeypatching modules at import time). It is
+            only used for tests run in a local environment, rather than in Docker or with remote
+            execution, and not when debugging tests or when `[{cls.options_scope}].xdist_enabled`
+            is true.
+            """
+        ),
+    )
+    fork_server_preload = StrListOption(
+        advanced=True,
+        help=lambda cls: softwrap(
+            f"""
+            Third-party modules to import in the server before forking each batch of tests, when
+            `[{cls.options_scope}].fork_server` is true, e.g. `["django", "numpy", "pandas"]`.
+
+            The modules are imported without any first-party sources on the path.
+            """
+        ),
+    )
+
     skip = SkipOption("test")
 
     def config_request(self, dirs: Iterable[str]) -> ConfigFilesRequest:
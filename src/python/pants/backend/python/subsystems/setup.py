@@ -422,6 +422,10 @@ class PythonSetup(Subsystem):
             2) Requirements unneeded by a test/run/repl will be present on the sys.path, which
                might in rare cases cause their behavior to change.
 
+            When running tests, all test batches using the same resolve and interpreter
+            constraints share a single venv containing the entire lockfile, rather than
+            each using a venv for its own subset.
+
             This option does not affect packaging deployable artifacts, such as
             PEX files, wheels and cloud functions, which will still use just the exact
             subset of requirements needed.
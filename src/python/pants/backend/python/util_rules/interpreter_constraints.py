@@ -236,6 +236,14 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
             args.extend(["--interpreter-constraint", str(constraint)])
         return args
 
+    def matches_interpreter(self, implementation: str, version: str) -> bool:
+        """Checks if an interpreter, e.g. `CPython` at version `3.11.4`, satisfies the constraints."""
+        return any(
+            req.key == implementation.lower()
+            and req.specifier.contains(version, prereleases=True)  # type: ignore[attr-defined]
+            for req in self
+        )
+
     def _valid_patch_versions(self, major: int, minor: int) -> Iterator[int]:
         for p in range(0, _PATCH_VERSION_UPPER_BOUND + 1):
             for req in self:
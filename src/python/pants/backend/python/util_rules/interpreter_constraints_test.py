@@ -456,6 +456,15 @@ def test_contains(candidate, target, matches) -> None:
     )
 
 
+def test_matches_interpreter() -> None:
+    ics = InterpreterConstraints(["CPython>=3.8,<3.10", "PyPy==3.10.*"])
+    assert ics.matches_interpreter("CPython", "3.8.18")
+    assert ics.matches_interpreter("CPython", "3.9.0rc1")
+    assert not ics.matches_interpreter("CPython", "3.10.4")
+    assert ics.matches_interpreter("PyPy", "3.10.13")
+    assert not ics.matches_interpreter("PyPy", "3.9.18")
+
+
 def test_constraints_are_correctly_sorted_at_construction() -> None:
     # #12578: This list itself is out of order, and `CPython>=3.6,<4,!=3.7.*` is specified with
     # out-of-order component requirements. This test verifies that the list is fully sorted after
@@ -3,11 +3,9 @@
 
 from __future__ import annotations
 
-import itertools
-import json
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any
 
 from packaging.version import parse
 
@@ -20,13 +18,15 @@ from pants.backend.python.util_rules.pex_requirements import (
     LoadedLockfile,
     LoadedLockfileRequest,
     Lockfile,
+    ParsedPexLockfile,
+    ParsePexLockfileRequest,
+    parse_pex_lockfile,
     strip_comments_from_pex_json_lockfile,
 )
 from pants.base.exceptions import EngineError
 from pants.core.goals.generate_lockfiles import LockfileDiff, LockfilePackages, PackageName
 from pants.engine.fs import Digest, DigestContents
 from pants.engine.rules import Get
-from pants.util.frozendict import FrozenDict
 
 logger = logging.getLogger(__name__)
 
@@ -46,62 +46,39 @@ class PythonRequirementVersion:
         return getattr(self._parsed, key)
 
 
-def _pex_lockfile_requirements(
-    lockfile_data: Mapping[str, Any] | None, path: str | None = None
-) -> LockfilePackages:
-    if not lockfile_data:
+def _pex_lockfile_requirements(parsed: ParsedPexLockfile | None) -> LockfilePackages:
+    if parsed is None:
         return LockfilePackages({})
-
-    try:
-        # Setup generators
-        locked_resolves = (
-            (
-                (PackageName(r["project_name"]), PythonRequirementVersion.parse(r["version"]))
-                for r in resolve["locked_requirements"]
-            )
-            for resolve in lockfile_data["locked_resolves"]
-        )
-        requirements = dict(itertools.chain.from_iterable(locked_resolves))
-    except KeyError as e:
-        if path:
-            logger.warning(f"{path}: Failed to parse lockfile: {e}")
-
-        requirements = {}
-
-    return LockfilePackages(requirements)
+    return LockfilePackages(
+        {
+            PackageName(project_name): PythonRequirementVersion.parse(version)
+            for project_name, version in parsed.locked_requirements
+        }
+    )
 
 
-async def _parse_lockfile(lockfile: Lockfile) -> FrozenDict[str, Any] | None:
+async def _parse_lockfile(lockfile: Lockfile) -> ParsedPexLockfile | None:
     try:
         loaded = await Get(
             LoadedLockfile,
             LoadedLockfileRequest(lockfile),
         )
-        fc = await Get(DigestContents, Digest, loaded.lockfile_digest)
-        parsed = await _parse_lockfile_content(next(iter(fc)).content, lockfile.url)
-        return parsed
+        return await Get(
+            ParsedPexLockfile,
+            ParsePexLockfileRequest(loaded.lockfile_digest, loaded.lockfile_path),
+        )
     except EngineError:
         # May fail in case the file doesn't exist, which is expected when parsing the "old" lockfile
         # the first time a new lockfile is generated.
         return None
 
 
-async def _parse_lockfile_content(content: bytes, url: str) -> FrozenDict[str, Any] | None:
-    try:
-        parsed_lockfile = json.loads(content)
-        return FrozenDict.deep_freeze(parsed_lockfile)
-    except json.JSONDecodeError as e:
-        logger.debug(f"{url}: Failed to parse lockfile contents: {e}")
-        return None
-
-
 async def _generate_python_lockfile_diff(
     digest: Digest, resolve_name: str, path: str
 ) -> LockfileDiff:
     new_digest_contents = await Get(DigestContents, Digest, digest)
     new_content = next(c for c in new_digest_contents if c.path == path).content
-    new_content = strip_comments_from_pex_json_lockfile(new_content)
-    new = await _parse_lockfile_content(new_content, path)
+    new = parse_pex_lockfile(strip_comments_from_pex_json_lockfile(new_content), path)
     old = await _parse_lockfile(
         Lockfile(
             url=path,
@@ -113,5 +90,5 @@ async def _generate_python_lockfile_diff(
         path=path,
         resolve_name=resolve_name,
         old=_pex_lockfile_requirements(old),
-        new=_pex_lockfile_requirements(new, path),
+        new=_pex_lockfile_requirements(new),
     )
@@ -64,7 +64,7 @@ from pants.engine.fs import EMPTY_DIGEST, AddPrefix, CreateDigest, Digest, FileC
 from pants.engine.internals.native_engine import Snapshot
 from pants.engine.internals.selectors import MultiGet
 from pants.engine.intrinsics import add_prefix
-from pants.engine.process import Process, ProcessCacheScope, ProcessResult
+from pants.engine.process import FallibleProcessResult, Process, ProcessCacheScope, ProcessResult
 from pants.engine.rules import Get, collect_rules, concurrently, implicitly, rule
 from pants.engine.target import (
     HydratedSources,
@@ -361,6 +361,13 @@ async def find_interpreter(
         )
         return python
 
+    # Select from the inventory of interpreters first, which only requires running Pex once rather
+    # than once per distinct set of constraints.
+    inventory = await Get(_PythonInterpreterInventory, _PythonInterpreterInventoryRequest())
+    selected = inventory.select(interpreter_constraints)
+    if selected is not None:
+        return await Get(PythonExecutable, _PythonInterpreterFingerprintRequest(selected.path))
+
     formatted_constraints = " OR ".join(str(constraint) for constraint in interpreter_constraints)
     result = await Get(
         ProcessResult,
@@ -376,26 +383,7 @@ async def find_interpreter(
                 *interpreter_constraints.generate_pex_arg_list(),
                 "--",
                 "-c",
-                # N.B.: The following code snippet must be compatible with Python 2.7 and
-                # Python 3.5+.
-                #
-                # When hashing, we pick 8192 for efficiency of reads and fingerprint updates
-                # (writes) since it's a common OS buffer size and an even multiple of the
-                # hash block size.
-                dedent(
-                    """\
-                    import hashlib, os, sys
-
-                    python = os.path.realpath(sys.executable)
-                    print(python)
-
-                    hasher = hashlib.sha256()
-                    with open(python, "rb") as fp:
-                      for chunk in iter(lambda: fp.read(8192), b""):
-                          hasher.update(chunk)
-                    print(hasher.hexdigest())
-                    """
-                ),
+                _FINGERPRINT_INTERPRETER_SCRIPT,
             ),
             level=LogLevel.DEBUG,
             cache_scope=env_target.executable_search_path_cache_scope(),
@@ -408,6 +396,128 @@ async def find_interpreter(
     return PythonExecutable(path=path, fingerprint=fingerprint)
 
 
+# N.B.: The following code snippet must be compatible with Python 2.7 and Python 3.5+.
+#
+# When hashing, we pick 8192 for efficiency of reads and fingerprint updates (writes) since it's a
+# common OS buffer size and an even multiple of the hash block size.
+_FINGERPRINT_INTERPRETER_SCRIPT = dedent(
+    """\
+    import hashlib, os, sys
+
+    python = os.path.realpath(sys.executable)
+    print(python)
+
+    hasher = hashlib.sha256()
+    with open(python, "rb") as fp:
+      for chunk in iter(lambda: fp.read(8192), b""):
+          hasher.update(chunk)
+    print(hasher.hexdigest())
+    """
+)
+
+
+@dataclass(frozen=True)
+class _PythonInterpreterInfo:
+    path: str
+    implementation: str
+    version: str
+
+
+@dataclass(frozen=True)
+class _PythonInterpreterInventoryRequest:
+    pass
+
+
+@dataclass(frozen=True)
+class _PythonInterpreterInventory:
+    """All the interpreters Pex finds on the interpreter search path, in search path order."""
+
+    interpreters: tuple[_PythonInterpreterInfo, ...]
+
+    @classmethod
+    def parse(cls, output: str) -> _PythonInterpreterInventory:
+        """Parses the output of `pex3 interpreter inspect --all --verbose`.
+
+        If any interpreter's details can't be understood, the inventory is left empty, so that
+        interpreter selection falls back to running Pex for each set of constraints.
+        """
+
+        interpreters = []
+        for line in output.splitlines():
+            try:
+                info = json.loads(line)
+                implementation, _, version = info["requirement"].partition("==")
+                packaging.version.Version(version)
+                path = info["path"]
+            except (ValueError, KeyError, TypeError, AttributeError):
+                return cls(())
+            interpreters.append(_PythonInterpreterInfo(path, implementation, version))
+        return cls(tuple(interpreters))
+
+    def select(
+        self, interpreter_constraints: InterpreterConstraints
+    ) -> _PythonInterpreterInfo | None:
+        """Selects the interpreter Pex would: the lowest version matching the constraints."""
+
+        compatible = [
+            interpreter
+            for interpreter in self.interpreters
+            if interpreter_constraints.matches_interpreter(
+                interpreter.implementation, interpreter.version
+            )
+        ]
+        if not compatible:
+            return None
+        return min(compatible, key=lambda i: packaging.version.Version(i.version))
+
+
+@rule(desc="Find Python interpreters", level=LogLevel.DEBUG)
+async def find_interpreter_inventory(
+    _: _PythonInterpreterInventoryRequest, env_target: EnvironmentTarget
+) -> _PythonInterpreterInventory:
+    result = await Get(
+        FallibleProcessResult,
+        PexCliProcess(
+            description="Find Python interpreters on the search path",
+            subcommand=("interpreter", "inspect"),
+            extra_args=("--all", "--verbose"),
+            level=LogLevel.DEBUG,
+            cache_scope=env_target.executable_search_path_cache_scope(),
+        ),
+    )
+    if result.exit_code != 0:
+        logger.debug(
+            f"Failed to list Python interpreters, falling back to per-constraint interpreter "
+            f"selection:\n{result.stderr.decode()}"
+        )
+        return _PythonInterpreterInventory(())
+    return _PythonInterpreterInventory.parse(result.stdout.decode())
+
+
+@dataclass(frozen=True)
+class _PythonInterpreterFingerprintRequest:
+    path: str
+
+
+@rule(desc="Fingerprint Python interpreter", level=LogLevel.DEBUG)
+async def fingerprint_interpreter(
+    request: _PythonInterpreterFingerprintRequest, env_target: EnvironmentTarget
+) -> PythonExecutable:
+    # The fingerprint only depends on the interpreter, so it is shared by all the constraints which
+    # select it.
+    result = await Get(
+        ProcessResult,
+        Process(
+            argv=(request.path, "-c", _FINGERPRINT_INTERPRETER_SCRIPT),
+            description=f"Fingerprint Python interpreter {request.path}",
+            level=LogLevel.DEBUG,
+            cache_scope=env_target.executable_search_path_cache_scope(),
+        ),
+    )
+    path, fingerprint = result.stdout.decode().strip().splitlines()
+    return PythonExecutable(path=path, fingerprint=fingerprint)
+
+
 @dataclass(frozen=True)
 class BuildPexResult:
     result: ProcessResult
@@ -243,6 +243,17 @@ class ChosenPythonResolve:
     name: str
     lockfile: Lockfile
 
+    @classmethod
+    def for_resolve(cls, resolve: str, python_setup: PythonSetup) -> ChosenPythonResolve:
+        return cls(
+            name=resolve,
+            lockfile=Lockfile(
+                url=python_setup.resolves[resolve],
+                url_description_of_origin=f"the resolve `{resolve}` (from `[python].resolves`)",
+                resolve_name=resolve,
+            ),
+        )
+
 
 @dataclass(frozen=True)
 class ChosenPythonResolveRequest:
@@ -296,16 +307,7 @@ async def choose_python_resolve(
         # for example, when running `./pants repl` with no specs or only on non-Python targets.
         chosen_resolve = python_setup.default_resolve
 
-    return ChosenPythonResolve(
-        name=chosen_resolve,
-        lockfile=Lockfile(
-            url=python_setup.resolves[chosen_resolve],
-            url_description_of_origin=(
-                f"the resolve `{chosen_resolve}` (from `[python].resolves`)"
-            ),
-            resolve_name=chosen_resolve,
-        ),
-    )
+    return ChosenPythonResolve.for_resolve(chosen_resolve, python_setup)
 
 
 class GlobalRequirementConstraints(DeduplicatedCollection[PipRequirement]):
@@ -647,25 +649,44 @@ async def get_repository_pex(
         ),
     )
     return OptionalPexRequest(
-        PexRequest(
-            description=softwrap(
-                f"""
-                Installing {chosen_resolve.lockfile.url} for the resolve
-                `{chosen_resolve.name}`
-                """
-            ),
-            output_filename=f"{path_safe(chosen_resolve.name)}_lockfile.pex",
+        _entire_lockfile_pex_request(
+            chosen_resolve,
+            interpreter_constraints,
             internal_only=request.internal_only,
-            requirements=EntireLockfile(chosen_resolve.lockfile),
-            interpreter_constraints=interpreter_constraints,
-            layout=PexLayout.PACKED,
             platforms=request.platforms,
             complete_platforms=request.complete_platforms,
-            additional_args=request.additional_lockfile_args,
+            additional_lockfile_args=request.additional_lockfile_args,
         )
     )
 
 
+def _entire_lockfile_pex_request(
+    chosen_resolve: ChosenPythonResolve,
+    interpreter_constraints: InterpreterConstraints,
+    *,
+    internal_only: bool,
+    platforms: PexPlatforms = PexPlatforms(),
+    complete_platforms: CompletePlatforms = CompletePlatforms(),
+    additional_lockfile_args: tuple[str, ...] = (),
+) -> PexRequest:
+    return PexRequest(
+        description=softwrap(
+            f"""
+            Installing {chosen_resolve.lockfile.url} for the resolve
+            `{chosen_resolve.name}`
+            """
+        ),
+        output_filename=f"{path_safe(chosen_resolve.name)}_lockfile.pex",
+        internal_only=internal_only,
+        requirements=EntireLockfile(chosen_resolve.lockfile),
+        interpreter_constraints=interpreter_constraints,
+        layout=PexLayout.PACKED,
+        platforms=platforms,
+        complete_platforms=complete_platforms,
+        additional_args=additional_lockfile_args,
+    )
+
+
 @rule
 async def _setup_constraints_repository_pex(
     constraints_request: _ConstraintsRepositoryPexRequest,
@@ -792,5 +813,30 @@ async def generalize_requirements_pex_request(
     )
 
 
+@dataclass(frozen=True)
+class EntireResolvePexRequest:
+    """Requests a PEX of the entire lockfile of a resolve, for internal use.
+
+    Unlike a `RequirementsPexRequest` with `[python].run_against_entire_lockfile` set, the request
+    does not depend on any targets, and so the PEX (and any venv created from it) is shared by all
+    consumers of the same resolve and interpreter constraints. Callers are responsible for checking
+    that their targets belong to the resolve, e.g. using `ChosenPythonResolveRequest`.
+    """
+
+    resolve: str
+    interpreter_constraints: InterpreterConstraints
+
+
+@rule
+async def entire_resolve_pex_request(
+    request: EntireResolvePexRequest, python_setup: PythonSetup
+) -> PexRequest:
+    return _entire_lockfile_pex_request(
+        ChosenPythonResolve.for_resolve(request.resolve, python_setup),
+        request.interpreter_constraints,
+        internal_only=True,
+    )
+
+
 def rules():
     return (*collect_rules(), *pex_rules(), *local_dists_rules(), *python_sources_rules())
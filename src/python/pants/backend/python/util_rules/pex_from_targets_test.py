@@ -31,6 +31,7 @@ from pants.backend.python.target_types import (
     PythonTestTarget,
 )
 from pants.backend.python.util_rules import pex_from_targets, pex_test_utils
+from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex import (
     OptionalPex,
     OptionalPexRequest,
@@ -42,6 +43,7 @@ from pants.backend.python.util_rules.pex import (
 from pants.backend.python.util_rules.pex_from_targets import (
     ChosenPythonResolve,
     ChosenPythonResolveRequest,
+    EntireResolvePexRequest,
     GlobalRequirementConstraints,
     PexFromTargetsRequest,
     _determine_requirements_for_pex_from_targets,
@@ -83,6 +85,7 @@ def rule_runner() -> PythonRuleRunner:
             QueryRule(PexRequirementsInfo, (PexRequirements,)),
             QueryRule(GlobalRequirementConstraints, ()),
             QueryRule(ChosenPythonResolve, [ChosenPythonResolveRequest]),
+            QueryRule(PexRequest, [EntireResolvePexRequest]),
             *setuptools.rules(),
         ],
         target_types=[
@@ -161,6 +164,22 @@ def test_choose_compatible_resolve(rule_runner: PythonRuleRunner) -> None:
         )
 
 
+def test_entire_resolve_pex_request(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.set_options(
+        ["--python-resolves={'a': 'a.lock', 'b': 'b.lock'}", "--python-enable-resolves"],
+        env_inherit={"PATH"},
+    )
+    interpreter_constraints = InterpreterConstraints(["CPython==3.10.*"])
+    pex_request = rule_runner.request(
+        PexRequest, [EntireResolvePexRequest("b", interpreter_constraints)]
+    )
+    assert pex_request.internal_only
+    assert pex_request.interpreter_constraints == interpreter_constraints
+    assert isinstance(pex_request.requirements, EntireLockfile)
+    assert pex_request.requirements.lockfile.url == "b.lock"
+    assert pex_request.requirements.lockfile.resolve_name == "b"
+
+
 def test_determine_requirements_for_pex_from_targets() -> None:
     class RequirementMode(Enum):
         PEX_LOCKFILE = 1
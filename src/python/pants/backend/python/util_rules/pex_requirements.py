@@ -4,7 +4,10 @@
 from __future__ import annotations
 
 import importlib.resources
+import io
+import json
 import logging
+import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Iterable, Iterator
 from urllib.parse import urlparse
@@ -116,19 +119,38 @@ class LoadedLockfileRequest:
     lockfile: Lockfile
 
 
+_PEX_JSON_LOCKFILE_COMMENT_LINE = re.compile(rb"^[ \t\x0b\x0c]*//", re.MULTILINE)
+
+
 def strip_comments_from_pex_json_lockfile(lockfile_bytes: bytes) -> bytes:
     """Pex does not like the header Pants adds to lockfiles, as it violates JSON.
 
     Note that we only strip lines starting with `//`, which is all that Pants will ever add. If
     users add their own comments, things will fail.
     """
+    if b"\r" not in lockfile_bytes:
+        # Pants only adds comments in a header at the top, so unless there are other comments,
+        # the rest of a (possibly very large) lockfile is kept as is, rather than split into lines
+        # and joined again.
+        body_start = 0
+        while _PEX_JSON_LOCKFILE_COMMENT_LINE.match(lockfile_bytes, body_start):
+            line_end = lockfile_bytes.find(b"\n", body_start)
+            if line_end == -1:
+                return b""
+            body_start = line_end + 1
+        body = lockfile_bytes[body_start:]
+        if not _PEX_JSON_LOCKFILE_COMMENT_LINE.search(body):
+            return body[:-1] if body.endswith(b"\n") else body
+
     return b"\n".join(
         line for line in lockfile_bytes.splitlines() if not line.lstrip().startswith(b"//")
     )
 
 
 def is_probably_pex_json_lockfile(lockfile_bytes: bytes) -> bool:
-    for line in lockfile_bytes.splitlines():
+    # NB: Lines are read lazily, since only the first lines are usually needed.
+    for line in io.BytesIO(lockfile_bytes):
+        line = line.rstrip(b"\r\n")
         if line and not line.startswith(b"//"):
             # Note that pip/Pex complain if a requirements.txt style starts with `{`.
             return line.lstrip().startswith(b"{")
@@ -136,17 +158,54 @@ def is_probably_pex_json_lockfile(lockfile_bytes: bytes) -> bool:
 
 
 def _pex_lockfile_requirement_count(lockfile_bytes: bytes) -> int:
-    # TODO: this is a very naive heuristic that will overcount, and also relies on Pants
-    #  setting `--indent` when generating lockfiles. More robust would be parsing the JSON
-    #  and getting the len(locked_resolves.locked_requirements.project_name), but we risk
-    #  if Pex ever changes its lockfile format.
-
-    num_lines = len(lockfile_bytes.splitlines())
-    # These are very naive estimates, and they bias towards overcounting. For example, requirements
-    # often are 20+ lines.
-    num_lines_for_options = 10
-    lines_per_req = 10
-    return max((num_lines - num_lines_for_options) // lines_per_req, 2)
+    # Each locked requirement of each locked resolve has exactly one `project_name` key, which is
+    # much cheaper to count than parsing the JSON of a large lockfile.
+    return max(lockfile_bytes.count(b'"project_name":'), 2)
+
+
+@dataclass(frozen=True)
+class ParsePexLockfileRequest:
+    """Parse the locked requirements of the (comment-stripped) Pex JSON lockfile in a digest.
+
+    The result only depends on the content of the digest, so it is computed once per lockfile
+    content and shared by all of its consumers.
+    """
+
+    lockfile_digest: Digest
+    lockfile_path: str
+
+
+@dataclass(frozen=True)
+class ParsedPexLockfile:
+    # The project name and version of each locked requirement of each locked resolve.
+    locked_requirements: tuple[tuple[str, str], ...]
+
+
+def parse_pex_lockfile(lockfile_bytes: bytes, lockfile_path: str) -> ParsedPexLockfile:
+    try:
+        lockfile_data = json.loads(lockfile_bytes)
+    except json.JSONDecodeError as e:
+        logger.debug(f"{lockfile_path}: Failed to parse lockfile contents: {e}")
+        return ParsedPexLockfile(())
+
+    try:
+        return ParsedPexLockfile(
+            tuple(
+                (requirement["project_name"], requirement["version"])
+                for resolve in lockfile_data["locked_resolves"]
+                for requirement in resolve["locked_requirements"]
+            )
+        )
+    except KeyError as e:
+        logger.warning(f"{lockfile_path}: Failed to parse lockfile: {e}")
+        return ParsedPexLockfile(())
+
+
+@rule
+async def parse_pex_lockfile_from_digest(request: ParsePexLockfileRequest) -> ParsedPexLockfile:
+    digest_contents = await Get(DigestContents, Digest, request.lockfile_digest)
+    content = next(fc.content for fc in digest_contents if fc.path == request.lockfile_path)
+    return parse_pex_lockfile(content, request.lockfile_path)
 
 
 def get_metadata(
@@ -14,11 +14,13 @@ from pants.backend.python.util_rules.interpreter_constraints import InterpreterC
 from pants.backend.python.util_rules.lockfile_metadata import PythonLockfileMetadataV3
 from pants.backend.python.util_rules.pex_requirements import (
     Lockfile,
+    ParsedPexLockfile,
     ResolvePexConfig,
     ResolvePexConstraintsFile,
     _pex_lockfile_requirement_count,
     get_metadata,
     is_probably_pex_json_lockfile,
+    parse_pex_lockfile,
     strip_comments_from_pex_json_lockfile,
     validate_metadata,
 )
@@ -276,6 +278,27 @@ def test_strip_comments_from_pex_json_lockfile() -> None:
             }"""
         ),
     )
+    assert_stripped(
+        textwrap.dedent(
+            """\
+            // header
+               // more header
+              {
+                "key": "foo",
+            }
+
+            """
+        ),
+        textwrap.dedent(
+            """\
+              {
+                "key": "foo",
+            }
+            """
+        ),
+    )
+    assert_stripped("// header\r\n{\r\n}\r\n", "{\n}")
+    assert_stripped("// only a header", "")
     assert_stripped(
         textwrap.dedent(
             """\
@@ -346,8 +369,34 @@ def test_pex_lockfile_requirement_count() -> None:
             """
             ).encode()
         )
-        == 3
+        == 2
+    )
+    assert (
+        _pex_lockfile_requirement_count(
+            b'{"locked_resolves": [{"locked_requirements": ['
+            + b",".join(b'{"project_name": "p%d", "version": "1"}' % i for i in range(5))
+            + b"]}]}"
+        )
+        == 5
+    )
+
+
+def test_parse_pex_lockfile() -> None:
+    lockfile = textwrap.dedent(
+        """\
+        {
+          "locked_resolves": [
+            {"locked_requirements": [{"project_name": "ansicolors", "version": "1.1.8"}]},
+            {"locked_requirements": [{"project_name": "cowsay", "version": "4.0"}]}
+          ]
+        }
+        """
+    ).encode()
+    assert parse_pex_lockfile(lockfile, "lock.json") == ParsedPexLockfile(
+        (("ansicolors", "1.1.8"), ("cowsay", "4.0"))
     )
+    assert parse_pex_lockfile(b"not json", "lock.json") == ParsedPexLockfile(())
+    assert parse_pex_lockfile(b"{}", "lock.json") == ParsedPexLockfile(())
 
 
 class TestResolvePexConfigPexArgs:
@@ -39,6 +39,8 @@ from pants.backend.python.util_rules.pex import (
     _BuildPexPythonSetup,
     _BuildPexRequirementsSetup,
     _determine_pex_python_and_platforms,
+    _PythonInterpreterInfo,
+    _PythonInterpreterInventory,
     _setup_pex_requirements,
 )
 from pants.backend.python.util_rules.pex import rules as pex_rules
@@ -681,6 +683,84 @@ def test_determine_pex_python_and_platforms() -> None:
     )
 
 
+# Captured from `pex3 interpreter inspect --all --verbose`, with `supported_tags` and `env_markers`
+# trimmed for brevity.
+_INTERPRETER_INSPECT_OUTPUT = textwrap.dedent(
+    """\
+    {"path": "/usr/bin/python3.11", "requirement": "CPython==3.11.4", "platform": "cp311-cp311-manylinux_2_35_x86_64", "venv": false, "supported_tags": ["cp311-cp311-manylinux_2_35_x86_64"], "env_markers": {"implementation_name": "cpython", "python_full_version": "3.11.4"}}
+    {"path": "/usr/bin/python3.9", "requirement": "CPython==3.9.18", "platform": "cp39-cp39-manylinux_2_35_x86_64", "venv": false, "supported_tags": ["cp39-cp39-manylinux_2_35_x86_64"], "env_markers": {"implementation_name": "cpython", "python_full_version": "3.9.18"}}
+    {"path": "/opt/pypy/bin/pypy3.9", "requirement": "PyPy==3.9.18", "platform": "pp39-pypy39_pp73-manylinux_2_35_x86_64", "venv": false, "supported_tags": ["pp39-pypy39_pp73-manylinux_2_35_x86_64"], "env_markers": {"implementation_name": "pypy", "python_full_version": "3.9.18"}}
+    {"path": "/usr/local/bin/python3.9", "requirement": "CPython==3.9.18", "platform": "cp39-cp39-manylinux_2_35_x86_64", "venv": false, "supported_tags": ["cp39-cp39-manylinux_2_35_x86_64"], "env_markers": {"implementation_name": "cpython", "python_full_version": "3.9.18"}}
+    {"path": "/usr/bin/python3.12", "requirement": "CPython==3.12.0", "platform": "cp312-cp312-manylinux_2_35_x86_64", "venv": false, "supported_tags": ["cp312-cp312-manylinux_2_35_x86_64"], "env_markers": {"implementation_name": "cpython", "python_full_version": "3.12.0"}}
+    """
+)
+
+
+def test_python_interpreter_inventory_parse() -> None:
+    assert _PythonInterpreterInventory.parse(_INTERPRETER_INSPECT_OUTPUT).interpreters == (
+        _PythonInterpreterInfo("/usr/bin/python3.11", "CPython", "3.11.4"),
+        _PythonInterpreterInfo("/usr/bin/python3.9", "CPython", "3.9.18"),
+        _PythonInterpreterInfo("/opt/pypy/bin/pypy3.9", "PyPy", "3.9.18"),
+        _PythonInterpreterInfo("/usr/local/bin/python3.9", "CPython", "3.9.18"),
+        _PythonInterpreterInfo("/usr/bin/python3.12", "CPython", "3.12.0"),
+    )
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "",
+        "Traceback (most recent call last):\n  ...",
+        '{"path": "/usr/bin/python3.11"}',
+        '{"path": "/usr/bin/python3.11", "requirement": "CPython==not-a-version"}',
+        '{"requirement": "CPython==3.11.4"}',
+        '["/usr/bin/python3.11", "CPython==3.11.4"]',
+        _INTERPRETER_INSPECT_OUTPUT + "{truncated",
+    ],
+)
+def test_python_interpreter_inventory_parse_malformed(output: str) -> None:
+    # Any output that can't be fully understood leaves the inventory empty.
+    inventory = _PythonInterpreterInventory.parse(output)
+    assert inventory.interpreters == ()
+    assert inventory.select(InterpreterConstraints(["CPython>=3.7"])) is None
+
+
+@pytest.mark.parametrize(
+    "constraints, expected",
+    [
+        # The lowest matching version wins, regardless of search path order.
+        (["CPython>=3.7"], "/usr/bin/python3.9"),
+        (["CPython>=3.10"], "/usr/bin/python3.11"),
+        (["CPython==3.12.*"], "/usr/bin/python3.12"),
+        # Implementations are matched, too.
+        (["PyPy>=3.7"], "/opt/pypy/bin/pypy3.9"),
+        (["CPython>=3.11", "PyPy>=3.7"], "/opt/pypy/bin/pypy3.9"),
+        (["CPython>=3.10", "PyPy>=3.10"], "/usr/bin/python3.11"),
+        # Nothing matches.
+        (["CPython==3.8.*"], None),
+        (["CPython>=3.13"], None),
+        (["PyPy==3.10.*"], None),
+    ],
+)
+def test_python_interpreter_inventory_select(constraints: list[str], expected: str | None) -> None:
+    inventory = _PythonInterpreterInventory.parse(_INTERPRETER_INSPECT_OUTPUT)
+    selected = inventory.select(InterpreterConstraints(constraints))
+    assert (selected.path if selected else None) == expected
+
+
+def test_python_interpreter_inventory_select_ties() -> None:
+    # Among interpreters with the same version, the first on the search path wins.
+    inventory = _PythonInterpreterInventory(
+        (
+            _PythonInterpreterInfo("/first/python3.9", "CPython", "3.9.18"),
+            _PythonInterpreterInfo("/second/python3.9", "CPython", "3.9.18"),
+        )
+    )
+    selected = inventory.select(InterpreterConstraints(["CPython==3.9.*"]))
+    assert selected == _PythonInterpreterInfo("/first/python3.9", "CPython", "3.9.18")
+    assert _PythonInterpreterInventory(()).select(InterpreterConstraints(["CPython>=3.7"])) is None
+
+
 def test_setup_pex_requirements() -> None:
     rule_runner = RuleRunner()
 
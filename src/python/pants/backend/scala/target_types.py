@@ -38,6 +38,7 @@ from pants.engine.unions import UnionMembership, UnionRule
 from pants.jvm import target_types as jvm_target_types
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import (
+    JunitTestBatchCompatibilityTagField,
     JunitTestExtraEnvVarsField,
     JunitTestSourceField,
     JunitTestTimeoutField,
@@ -216,6 +217,7 @@ class ScalaJunitTestTarget(Target):
         ScalaConsumedPluginNamesField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmResolveField,
         JvmProvidesTypesField,
         JvmJdkField,
@@ -258,6 +260,7 @@ class ScalaJunitTestsGeneratorTarget(TargetFilesGenerator):
         ScalaConsumedPluginNamesField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmJdkField,
         JvmProvidesTypesField,
         JvmResolveField,
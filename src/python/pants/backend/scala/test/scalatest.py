@@ -22,10 +22,12 @@ from pants.core.goals.test import (
     TestSubsystem,
 )
 from pants.core.target_types import FileSourceField
+from pants.core.util_rules import split_digest
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.core.util_rules.split_digest import DigestPart, SplitDigest, SplitDigestRequest
 from pants.engine.addresses import Addresses
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, RemovePrefix, Snapshot
+from pants.engine.fs import Digest, MergeDigests
 from pants.engine.process import (
     InteractiveProcess,
     Process,
@@ -179,11 +181,18 @@ async def run_scalatest_test(
     )
     reports_dir_prefix = test_setup.reports_dir_prefix
 
-    xml_result_subset = await Get(
-        Digest,
-        DigestSubset(process_results.last.output_digest, PathGlobs([f"{reports_dir_prefix}/**"])),
+    reports = await Get(
+        SplitDigest,
+        SplitDigestRequest(
+            process_results.last.output_digest,
+            (
+                DigestPart(
+                    "xml_results", (f"{reports_dir_prefix}/**",), strip_prefix=reports_dir_prefix
+                ),
+            ),
+        ),
     )
-    xml_results = await Get(Snapshot, RemovePrefix(xml_result_subset, reports_dir_prefix))
+    xml_results = reports["xml_results"]
 
     return TestResult.from_fallible_process_result(
         process_results=process_results.results,
@@ -208,6 +217,7 @@ def rules():
     return [
         *collect_rules(),
         *lockfile.rules(),
+        *split_digest.rules(),
         UnionRule(ExportableTool, Scalatest),
         *ScalatestTestRequest.rules(),
     ]
@@ -214,6 +214,12 @@ class BSPGoal(AuxiliaryGoal):
             build_id="bsp", dynamic_ui=False, session_values=session_values
         )
 
+        # NB: Imported here, since the BSP rules depend on this goal.
+        from pants.bsp.watcher import BSPBuildTargetsWatcher
+
+        watcher = BSPBuildTargetsWatcher(scheduler_session, context)
+        watcher.start()
+
         saved_stdout = sys.stdout
         saved_stdin = sys.stdin
         try:
@@ -228,6 +234,7 @@ class BSPGoal(AuxiliaryGoal):
             )
             conn.run()
         finally:
+            watcher.end()
             sys.stdout = saved_stdout
             sys.stdin = saved_stdin
 
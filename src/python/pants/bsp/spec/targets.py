@@ -7,6 +7,7 @@ from enum import IntEnum
 from typing import Any
 
 from pants.bsp.spec.base import BSPData, BuildTarget, BuildTargetIdentifier, Uri
+from pants.bsp.spec.notification import BSPNotification
 
 # -----------------------------------------------------------------------------------------------
 # Workspace Build Targets Request
@@ -36,6 +37,58 @@ class WorkspaceBuildTargetsResult:
         return {"targets": [tgt.to_json_dict() for tgt in self.targets]}
 
 
+# -----------------------------------------------------------------------------------------------
+# Build Target Changed Notification
+# See https://build-server-protocol.github.io/docs/specification.html#build-target-changed-notification
+# -----------------------------------------------------------------------------------------------
+
+
+class BuildTargetEventKind(IntEnum):
+    # The build target is new.
+    CREATED = 1
+    # The build target has changed.
+    CHANGED = 2
+    # The build target has been deleted.
+    DELETED = 3
+
+
+@dataclass(frozen=True)
+class BuildTargetEvent:
+    # The identifier for the changed build target.
+    target: BuildTargetIdentifier
+
+    # The kind of change for this build target.
+    kind: BuildTargetEventKind | None = None
+
+    @classmethod
+    def from_json_dict(cls, d: Any):
+        kind = d.get("kind")
+        return cls(
+            target=BuildTargetIdentifier.from_json_dict(d["target"]),
+            kind=BuildTargetEventKind(kind) if kind is not None else None,
+        )
+
+    def to_json_dict(self):
+        result: dict[str, Any] = {"target": self.target.to_json_dict()}
+        if self.kind is not None:
+            result["kind"] = self.kind.value
+        return result
+
+
+@dataclass(frozen=True)
+class DidChangeBuildTarget(BSPNotification):
+    notification_name = "buildTarget/didChange"
+
+    changes: tuple[BuildTargetEvent, ...]
+
+    @classmethod
+    def from_json_dict(cls, d: Any):
+        return cls(changes=tuple(BuildTargetEvent.from_json_dict(c) for c in d["changes"]))
+
+    def to_json_dict(self):
+        return {"changes": [change.to_json_dict() for change in self.changes]}
+
+
 # -----------------------------------------------------------------------------------------------
 # Build Target Sources Request
 # See https://build-server-protocol.github.io/docs/specification.html#build-target-sources-request
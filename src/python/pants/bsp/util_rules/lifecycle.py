@@ -85,7 +85,7 @@ async def bsp_build_initialize(
             dependency_modules_provider=True,
             resources_provider=resources_provider,
             can_reload=None,
-            build_target_changed_provider=None,
+            build_target_changed_provider=True,
         ),
         data=None,
     )
@@ -27,6 +27,8 @@ from pants.bsp.spec.base import (
     Uri,
 )
 from pants.bsp.spec.targets import (
+    BuildTargetEvent,
+    BuildTargetEventKind,
     DependencyModule,
     DependencyModulesItem,
     DependencyModulesParams,
@@ -46,7 +48,7 @@ from pants.engine.environment import EnvironmentName
 from pants.engine.fs import DigestContents, PathGlobs, Workspace
 from pants.engine.internals.native_engine import EMPTY_DIGEST, Digest, MergeDigests
 from pants.engine.internals.selectors import Get, MultiGet
-from pants.engine.rules import _uncacheable_rule, collect_rules, rule
+from pants.engine.rules import QueryRule, _uncacheable_rule, collect_rules, rule
 from pants.engine.target import (
     Field,
     FieldDefaults,
@@ -431,25 +433,63 @@ async def generate_one_bsp_build_target_request(
     )
 
 
-@_uncacheable_rule
-async def bsp_workspace_build_targets(
-    _: WorkspaceBuildTargetsParams,
+@dataclass(frozen=True)
+class BSPWorkspaceBuildTargets:
+    """All BSP build targets of the workspace, and the output to write for them.
+
+    This is memoized by the engine for the lifetime of the BSP server, so that only the build
+    targets whose definitions, BUILD files or sources changed are recomputed.
+    """
+
+    build_targets: tuple[BuildTarget, ...]
+    digest: Digest = EMPTY_DIGEST
+
+    def changes_since(self, previous: BSPWorkspaceBuildTargets) -> tuple[BuildTargetEvent, ...]:
+        """The events to notify a client of which has seen the `previous` build targets."""
+        previous_by_id = {tgt.id: tgt for tgt in previous.build_targets}
+        current_by_id = {tgt.id: tgt for tgt in self.build_targets}
+        changes = []
+        for target_id, build_target in current_by_id.items():
+            previous_build_target = previous_by_id.get(target_id)
+            if previous_build_target is None:
+                changes.append(BuildTargetEvent(target_id, BuildTargetEventKind.CREATED))
+            elif previous_build_target != build_target:
+                changes.append(BuildTargetEvent(target_id, BuildTargetEventKind.CHANGED))
+        changes.extend(
+            BuildTargetEvent(target_id, BuildTargetEventKind.DELETED)
+            for target_id in previous_by_id
+            if target_id not in current_by_id
+        )
+        return tuple(changes)
+
+
+@rule
+async def generate_bsp_workspace_build_targets(
     bsp_build_targets: BSPBuildTargets,
-    workspace: Workspace,
-) -> WorkspaceBuildTargetsResult:
+) -> BSPWorkspaceBuildTargets:
     bsp_target_results = await MultiGet(
         Get(GenerateOneBSPBuildTargetResult, GenerateOneBSPBuildTargetRequest(target_internal))
         for target_internal in bsp_build_targets.targets_mapping.values()
     )
     digest = await Get(Digest, MergeDigests([r.digest for r in bsp_target_results]))
-    if digest != EMPTY_DIGEST:
-        workspace.write_digest(digest, path_prefix=".pants.d/bsp")
-
-    return WorkspaceBuildTargetsResult(
-        targets=tuple(r.build_target for r in bsp_target_results),
+    return BSPWorkspaceBuildTargets(
+        build_targets=tuple(r.build_target for r in bsp_target_results),
+        digest=digest,
     )
 
 
+@_uncacheable_rule
+async def bsp_workspace_build_targets(
+    _: WorkspaceBuildTargetsParams,
+    workspace_build_targets: BSPWorkspaceBuildTargets,
+    workspace: Workspace,
+) -> WorkspaceBuildTargetsResult:
+    if workspace_build_targets.digest != EMPTY_DIGEST:
+        workspace.write_digest(workspace_build_targets.digest, path_prefix=".pants.d/bsp")
+
+    return WorkspaceBuildTargetsResult(targets=workspace_build_targets.build_targets)
+
+
 # -----------------------------------------------------------------------------------------------
 # Build Target Sources Request
 # See https://build-server-protocol.github.io/docs/specification.html#build-target-sources-request
@@ -690,4 +730,6 @@ def rules():
         UnionRule(BSPHandlerMapping, BuildTargetSourcesHandlerMapping),
         UnionRule(BSPHandlerMapping, DependencySourcesHandlerMapping),
         UnionRule(BSPHandlerMapping, DependencyModulesHandlerMapping),
+        # For `BSPBuildTargetsWatcher`, which polls for changes to the build targets.
+        QueryRule(BSPWorkspaceBuildTargets, (EnvironmentName,)),
     )
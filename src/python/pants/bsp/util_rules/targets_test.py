@@ -1,5 +1,7 @@
 # Copyright 2022 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
+from __future__ import annotations
+
 import textwrap
 
 import pytest
@@ -9,8 +11,13 @@ from pants.backend.java.bsp import rules as java_bsp_rules
 from pants.backend.java.compile import javac
 from pants.backend.java.target_types import JavaSourceTarget
 from pants.bsp.rules import rules as bsp_rules
-from pants.bsp.spec.base import BuildTargetIdentifier
-from pants.bsp.util_rules.targets import BSPBuildTargets, BSPTargetDefinition
+from pants.bsp.spec.base import BuildTarget, BuildTargetCapabilities, BuildTargetIdentifier
+from pants.bsp.spec.targets import BuildTargetEvent, BuildTargetEventKind
+from pants.bsp.util_rules.targets import (
+    BSPBuildTargets,
+    BSPTargetDefinition,
+    BSPWorkspaceBuildTargets,
+)
 from pants.engine.internals.parametrize import Parametrize
 from pants.engine.rules import QueryRule
 from pants.engine.target import Targets
@@ -144,3 +151,35 @@ def test_resolve_filtering(rule_runner: RuleRunner) -> None:
 
     targets = rule_runner.request(Targets, [BuildTargetIdentifier("pants:lib_other")])
     assert {"lib:lib2@resolve=other"} == {str(t.address) for t in targets}
+
+
+def test_workspace_build_targets_changes() -> None:
+    def build_target(name: str, base_directory: str | None = None) -> BuildTarget:
+        return BuildTarget(
+            id=BuildTargetIdentifier(f"pants:{name}"),
+            display_name=name,
+            base_directory=base_directory,
+            tags=(),
+            capabilities=BuildTargetCapabilities(),
+            language_ids=("java",),
+            dependencies=(),
+            data=None,
+        )
+
+    previous = BSPWorkspaceBuildTargets(
+        (build_target("unchanged"), build_target("changed"), build_target("deleted"))
+    )
+    current = BSPWorkspaceBuildTargets(
+        (
+            build_target("unchanged"),
+            build_target("changed", base_directory="file:///src/jvm"),
+            build_target("created"),
+        )
+    )
+
+    assert current.changes_since(previous) == (
+        BuildTargetEvent(BuildTargetIdentifier("pants:changed"), BuildTargetEventKind.CHANGED),
+        BuildTargetEvent(BuildTargetIdentifier("pants:created"), BuildTargetEventKind.CREATED),
+        BuildTargetEvent(BuildTargetIdentifier("pants:deleted"), BuildTargetEventKind.DELETED),
+    )
+    assert current.changes_since(current) == ()
@@ -0,0 +1,87 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+from __future__ import annotations
+
+import logging
+import threading
+
+from pants.bsp.context import BSPContext
+from pants.bsp.spec.targets import DidChangeBuildTarget
+from pants.bsp.util_rules.targets import BSPWorkspaceBuildTargets
+from pants.core.util_rules.environments import determine_bootstrap_environment
+from pants.engine.internals.native_engine import PyThreadLocals
+from pants.engine.internals.scheduler import (
+    ExecutionError,
+    ExecutionTimeoutError,
+    SchedulerSession,
+)
+from pants.engine.internals.selectors import Params
+
+_logger = logging.getLogger(__name__)
+
+
+class BSPBuildTargetsWatcher(threading.Thread):
+    """Notifies the BSP client with `buildTarget/didChange` when the build targets change.
+
+    The build targets are polled for in a separate session, which the engine wakes up whenever the
+    files they were computed from change. Since the engine memoizes each build target, only the
+    build targets affected by a change are recomputed.
+    """
+
+    def __init__(
+        self,
+        scheduler_session: SchedulerSession,
+        context: BSPContext,
+        *,
+        poll_timeout: float = 5.0,
+        poll_delay: float = 0.5,
+    ) -> None:
+        super().__init__(daemon=True)
+        self._scheduler_session = scheduler_session.isolated_shallow_clone("bsp_build_targets")
+        self._env_name = determine_bootstrap_environment(scheduler_session)
+        self._context = context
+        self._poll_timeout = poll_timeout
+        self._poll_delay = poll_delay
+        self.stop_request = threading.Event()
+        # Get the parent thread's thread locals. Note that this thread has not yet started
+        # as we are only in the constructor.
+        self._thread_locals = PyThreadLocals.get_for_current_thread()
+
+    def _poll(self) -> BSPWorkspaceBuildTargets | None:
+        try:
+            (build_targets,) = self._scheduler_session.product_request(
+                BSPWorkspaceBuildTargets,
+                [Params(self._env_name)],
+                poll=True,
+                poll_delay=self._poll_delay,
+                timeout=self._poll_timeout,
+            )
+        except ExecutionTimeoutError:
+            return None
+        except ExecutionError as e:
+            # The client will see the error itself when it requests the build targets.
+            _logger.debug(f"Failed to compute the BSP build targets: {e}")
+            self.stop_request.wait(timeout=self._poll_delay)
+            return None
+        return build_targets
+
+    def run(self) -> None:
+        self._thread_locals.set_for_current_thread()
+        # Only the build targets seen by an initialized client are relevant.
+        while not self._context.is_connection_initialized:
+            if self.stop_request.wait(timeout=0.1):
+                return
+
+        previous: BSPWorkspaceBuildTargets | None = None
+        while not self.stop_request.is_set():
+            current = self._poll()
+            if current is None:
+                continue
+            if previous is not None:
+                changes = current.changes_since(previous)
+                if changes:
+                    self._context.notify_client(DidChangeBuildTarget(changes))
+            previous = current
+
+    def end(self) -> None:
+        self.stop_request.set()
@@ -542,6 +542,21 @@ class GenerateLockfilesSubsystem(GoalSubsystem):
             """
         ),
     )
+    incremental = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, update existing lockfiles in place, keeping the locked versions of
+            requirements which did not change, rather than resolving all requirements from
+            scratch. This is much faster for large resolves where only a few requirements changed,
+            but requirements which did not change are not upgraded to newer versions.
+
+            Currently only supported for Python resolves: other resolves are generated from
+            scratch.
+            """
+        ),
+    )
     diff = BoolOption(
         default=True,
         help=softwrap(
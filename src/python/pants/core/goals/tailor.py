@@ -13,7 +13,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator, Mapping, cast
 
-from pants.base.specs import AncestorGlobSpec, DirLiteralSpec, RawSpecs, Specs
+from pants.base.specs import (
+    AncestorGlobSpec,
+    DirGlobSpec,
+    DirLiteralSpec,
+    RawSpecs,
+    RecursiveGlobSpec,
+    Specs,
+)
 from pants.build_graph.address import Address
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.console import Console
@@ -432,6 +439,48 @@ async def determine_all_owned_sources(all_tgts: AllUnexpandedTargets) -> AllOwne
     )
 
 
+@dataclass(frozen=True)
+class OwnedSourcesRequest:
+    """Find the files already owned by targets in (or below) the given directories."""
+
+    dirs: tuple[str, ...]
+
+
+class OwnedSources(DeduplicatedCollection[str]):
+    """Files in (or below) the requested directories already owned by targets."""
+
+
+def _outermost_dirs(dirs: Iterable[str]) -> list[str]:
+    """Returns the given directories, minus those nested in any of the others."""
+    outermost: set[str] = set()
+    for d in sorted(set(dirs), key=lambda d: (d.count(os.path.sep), d)):
+        ancestors = itertools.accumulate(d.split(os.path.sep), os.path.join) if d else ()
+        if "" not in outermost and not any(a in outermost for a in ancestors):
+            outermost.add(d)
+    return sorted(outermost)
+
+
+@rule(desc="Determine files already owned by targets", level=LogLevel.DEBUG)
+async def determine_owned_sources(request: OwnedSourcesRequest) -> OwnedSources:
+    # A target can only own files in its own directory or below, so only the targets in the
+    # requested directories, their ancestors and their subdirectories need their sources expanded.
+    outermost_dirs = _outermost_dirs(request.dirs)
+    possible_owners = await Get(
+        UnexpandedTargets,
+        RawSpecs(
+            ancestor_globs=tuple(AncestorGlobSpec(d) for d in outermost_dirs),
+            recursive_globs=tuple(RecursiveGlobSpec(d) for d in outermost_dirs),
+            description_of_origin="the `tailor` goal",
+        ),
+    )
+    possible_owners_sources = await MultiGet(
+        Get(SourcesPaths, SourcesPathsRequest(tgt.get(SourcesField))) for tgt in possible_owners
+    )
+    return OwnedSources(
+        itertools.chain.from_iterable(paths.files for paths in possible_owners_sources)
+    )
+
+
 @dataclass(frozen=True)
 class UniquelyNamedPutativeTargets:
     """Putative targets that have no name conflicts with existing targets (or each other)."""
@@ -440,11 +489,16 @@ class UniquelyNamedPutativeTargets:
 
 
 @rule
-async def rename_conflicting_targets(
-    ptgts: PutativeTargets, all_existing_tgts: AllUnexpandedTargets
-) -> UniquelyNamedPutativeTargets:
+async def rename_conflicting_targets(ptgts: PutativeTargets) -> UniquelyNamedPutativeTargets:
     """Ensure that no target addresses collide."""
-    existing_addrs: set[str] = {tgt.address.spec for tgt in all_existing_tgts}
+    existing_tgts = await Get(
+        UnexpandedTargets,
+        RawSpecs(
+            dir_globs=tuple(DirGlobSpec(path) for path in sorted({ptgt.path for ptgt in ptgts})),
+            description_of_origin="the `tailor` goal",
+        ),
+    )
+    existing_addrs: set[str] = {tgt.address.spec for tgt in existing_tgts}
     uniquely_named_putative_targets: list[PutativeTarget] = []
     for ptgt in ptgts:
         idx = 0
@@ -650,8 +704,19 @@ async def tailor(
     specs_paths = await Get(SpecsPaths, Specs, specs)
     dir_search_paths = tuple(sorted({os.path.dirname(f) for f in specs_paths.files}))
 
+    # Rather than expanding the sources of every target in the repository (as `AllOwnedSources`
+    # does), only consider the targets which may own files in the search paths. This makes e.g.
+    # `--changed-since=HEAD tailor --check` scale with the size of the change.
+    owned_sources = await Get(OwnedSources, OwnedSourcesRequest(dir_search_paths))
+    all_owned_sources = AllOwnedSources(owned_sources)
     putative_targets_results = await MultiGet(
-        Get(PutativeTargets, PutativeTargetsRequest, req_type(dir_search_paths))
+        Get(
+            PutativeTargets,
+            {
+                req_type(dir_search_paths): PutativeTargetsRequest,
+                all_owned_sources: AllOwnedSources,
+            },
+        )
         for req_type in union_membership[PutativeTargetsRequest]
     )
     putative_targets = PutativeTargets.merge(putative_targets_results)
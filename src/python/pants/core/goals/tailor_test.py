@@ -17,6 +17,8 @@ from pants.core.goals.tailor import (
     DisjointSourcePutativeTarget,
     EditBuildFilesRequest,
     EditedBuildFiles,
+    OwnedSources,
+    OwnedSourcesRequest,
     PutativeTarget,
     PutativeTargets,
     PutativeTargetsRequest,
@@ -142,6 +144,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(DisjointSourcePutativeTarget, (PutativeTarget,)),
             QueryRule(EditedBuildFiles, (EditBuildFilesRequest,)),
             QueryRule(AllOwnedSources, ()),
+            QueryRule(OwnedSources, (OwnedSourcesRequest,)),
         ],
         target_types=[FortranLibraryTarget, FortranTestsTarget],
     )
@@ -509,6 +512,28 @@ def test_all_owned_sources(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_owned_sources(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "fortran_library(name='root', sources=['dir/a.f90'])",
+            "dir/a.f90": "",
+            "dir/b.f90": "",
+            "dir/BUILD": "fortran_library(sources=['b.f90'])",
+            "dir/sub/c.f90": "",
+            "dir/sub/BUILD": "fortran_library()",
+            "other/d.f90": "",
+            "other/BUILD": "fortran_library()",
+        }
+    )
+    # Owners may be in the requested directories, their ancestors or their subdirectories.
+    assert rule_runner.request(OwnedSources, [OwnedSourcesRequest(("dir",))]) == OwnedSources(
+        ["dir/a.f90", "dir/b.f90", "dir/sub/c.f90"]
+    )
+    assert rule_runner.request(
+        OwnedSources, [OwnedSourcesRequest(("dir/sub", "other"))]
+    ) == OwnedSources(["dir/a.f90", "dir/b.f90", "dir/sub/c.f90", "other/d.f90"])
+
+
 def test_target_type_with_no_sources_field(rule_runner: RuleRunner) -> None:
     putative_targets = rule_runner.request(
         PutativeTargets, [MockPutativeFortranModuleRequest(("dir",))]
@@ -11,7 +11,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
-from typing import DefaultDict, cast
+from typing import DefaultDict, Iterable, cast
 
 from colors import green, red
 
@@ -32,6 +32,9 @@ from pants.backend.python.lint.yapf.subsystem import Yapf
 from pants.backend.python.subsystems.python_tool_base import get_lockfile_interpreter_constraints
 from pants.backend.python.util_rules import pex
 from pants.base.specs import Specs
+from pants.core.goals.fmt import FmtResult
+from pants.core.goals.multi_tool_goal_helper import BatchSizeOption
+from pants.engine.collection import Collection
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.environment import EnvironmentName
@@ -53,6 +56,7 @@ from pants.engine.platform import Platform
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.option.option_types import BoolOption, EnumOption
+from pants.util.collections import partition_sequentially
 from pants.util.docutil import bin_name, doc_url
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized
@@ -72,6 +76,10 @@ class RewrittenBuildFile:
     change_descriptions: tuple[str, ...]
 
 
+class RewrittenBuildFiles(Collection[RewrittenBuildFile]):
+    pass
+
+
 class Formatter(Enum):
     YAPF = "yapf"
     BLACK = "black"
@@ -115,6 +123,20 @@ class DeprecationFixerRequest(RewrittenBuildFileRequest):
     """
 
 
+@union(in_scope_types=[EnvironmentName])
+@dataclass(frozen=True)
+class FormatBuildFilesRequest(EngineAwareParameter):
+    """A batch of BUILD files to format with a single run of a formatter.
+
+    The formatter runs after all `RewrittenBuildFileRequest`s have been applied.
+    """
+
+    build_files: tuple[FileContent, ...]
+
+    def debug_hint(self) -> str:
+        return f"{len(self.build_files)} BUILD files"
+
+
 class UpdateBuildFilesSubsystem(GoalSubsystem):
     name = "update-build-files"
     help = help_text(
@@ -129,7 +151,10 @@ class UpdateBuildFilesSubsystem(GoalSubsystem):
 
     @classmethod
     def activated(cls, union_membership: UnionMembership) -> bool:
-        return RewrittenBuildFileRequest in union_membership
+        return (
+            RewrittenBuildFileRequest in union_membership
+            or FormatBuildFilesRequest in union_membership
+        )
 
     check = BoolOption(
         default=False,
@@ -168,6 +193,7 @@ class UpdateBuildFilesSubsystem(GoalSubsystem):
             """
         ),
     )
+    batch_size = BatchSizeOption(uppercase="Formatter", lowercase="formatter")
 
 
 class UpdateBuildFilesGoal(Goal):
@@ -222,8 +248,7 @@ async def update_build_files(
         PathGlobs(fp for fp in all_build_file_paths.files if fp in specified_paths),
     )
 
-    rewrite_request_classes = []
-    formatter_to_request_class: dict[Formatter, type[RewrittenBuildFileRequest]] = {
+    formatter_to_request_class: dict[Formatter, type[FormatBuildFilesRequest]] = {
         Formatter.BLACK: FormatWithBlackRequest,
         Formatter.YAPF: FormatWithYapfRequest,
         Formatter.RUFF: FormatWithRuffRequest,
@@ -235,27 +260,28 @@ async def update_build_files(
     if not chosen_formatter_request_class:
         raise ValueError(f"Unrecognized formatter: {update_build_files_subsystem.formatter}")
 
-    for request in union_membership[RewrittenBuildFileRequest]:
-        if update_build_files_subsystem.fmt and request == chosen_formatter_request_class:
-            rewrite_request_classes.append(request)
-
-        if update_build_files_subsystem.fix_safe_deprecations and issubclass(
-            request, DeprecationFixerRequest
-        ):
-            rewrite_request_classes.append(request)
-
-        # If there are other types of requests that aren't the standard formatter
-        # backends or deprecation fixers, add them here.
-        if request not in formatter_to_request_class.values() and not issubclass(
-            request, DeprecationFixerRequest
-        ):
-            rewrite_request_classes.append(request)
+    rewrite_request_classes = [
+        request
+        for request in union_membership.get(RewrittenBuildFileRequest)
+        if update_build_files_subsystem.fix_safe_deprecations
+        or not issubclass(request, DeprecationFixerRequest)
+    ]
 
     build_file_to_lines = {
         build_file.path: tuple(build_file.content.decode("utf-8").splitlines())
         for build_file in specified_build_files
     }
     build_file_to_change_descriptions: DefaultDict[str, list[str]] = defaultdict(list)
+
+    def record_rewritten_files(rewritten_files: Iterable[RewrittenBuildFile]) -> None:
+        for rewritten_file in rewritten_files:
+            if not rewritten_file.change_descriptions:
+                continue
+            build_file_to_lines[rewritten_file.path] = rewritten_file.lines
+            build_file_to_change_descriptions[rewritten_file.path].extend(
+                rewritten_file.change_descriptions
+            )
+
     for rewrite_request_cls in rewrite_request_classes:
         all_rewritten_files = await MultiGet(  # noqa: PNT30: this is inherently sequential
             Get(
@@ -265,13 +291,30 @@ async def update_build_files(
             )
             for build_file, lines in build_file_to_lines.items()
         )
-        for rewritten_file in all_rewritten_files:
-            if not rewritten_file.change_descriptions:
-                continue
-            build_file_to_lines[rewritten_file.path] = rewritten_file.lines
-            build_file_to_change_descriptions[rewritten_file.path].extend(
-                rewritten_file.change_descriptions
+        record_rewritten_files(all_rewritten_files)
+
+    # Formatters run over stable batches of BUILD files, rather than once per BUILD file, to avoid
+    # the overhead of starting a process for each of them while still getting cache hits for the
+    # batches which didn't change.
+    if update_build_files_subsystem.fmt and chosen_formatter_request_class in union_membership.get(
+        FormatBuildFilesRequest
+    ):
+        batch_size = update_build_files_subsystem.batch_size
+        batches = partition_sequentially(
+            build_file_to_lines, key=str, size_target=batch_size, size_max=4 * batch_size
+        )
+        all_formatted_files = await MultiGet(
+            Get(
+                RewrittenBuildFiles,
+                FormatBuildFilesRequest,
+                chosen_formatter_request_class(
+                    tuple(_build_file_content(path, build_file_to_lines[path]) for path in batch)
+                ),
             )
+            for batch in batches
+        )
+        for formatted_files in all_formatted_files:
+            record_rewritten_files(formatted_files)
 
     changed_build_files = sorted(
         build_file
@@ -321,20 +364,50 @@ async def update_build_files(
     return UpdateBuildFilesGoal(exit_code=1 if update_build_files_subsystem.check else 0)
 
 
+# ------------------------------------------------------------------------------------------
+# Formatter helpers
+# ------------------------------------------------------------------------------------------
+
+
+def _build_file_content(path: str, lines: tuple[str, ...]) -> FileContent:
+    return FileContent(path, ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+async def _rewritten_build_files(
+    request: FormatBuildFilesRequest, result: FmtResult, change_description: str
+) -> RewrittenBuildFiles:
+    """Converts the result of formatting a batch to the `RewrittenBuildFile` for each file."""
+    output_content = await Get(DigestContents, Digest, result.output.digest)
+    formatted_contents = {fc.path: fc.content for fc in output_content}
+    rewritten_build_files = []
+    for build_file in request.build_files:
+        formatted_content = formatted_contents[build_file.path]
+        rewritten_build_files.append(
+            RewrittenBuildFile(
+                build_file.path,
+                tuple(formatted_content.decode("utf-8").splitlines()),
+                change_descriptions=(change_description,)
+                if formatted_content != build_file.content
+                else (),
+            )
+        )
+    return RewrittenBuildFiles(rewritten_build_files)
+
+
 # ------------------------------------------------------------------------------------------
 # Yapf formatter fixer
 # ------------------------------------------------------------------------------------------
 
 
-class FormatWithYapfRequest(RewrittenBuildFileRequest):
+class FormatWithYapfRequest(FormatBuildFilesRequest):
     pass
 
 
 @rule
-async def format_build_file_with_yapf(
+async def format_build_files_with_yapf(
     request: FormatWithYapfRequest, yapf: Yapf
-) -> RewrittenBuildFile:
-    input_snapshot = await Get(Snapshot, CreateDigest([request.to_file_content()]))
+) -> RewrittenBuildFiles:
+    input_snapshot = await Get(Snapshot, CreateDigest(request.build_files))
     yapf_ics = await get_lockfile_interpreter_constraints(yapf)
     result = await _run_yapf(
         YapfRequest.Batch(
@@ -346,13 +419,7 @@ async def format_build_file_with_yapf(
         yapf,
         yapf_ics,
     )
-    output_content = await Get(DigestContents, Digest, result.output.digest)
-
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = ("Format with Yapf",) if result.did_change else ()
-
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+    return await _rewritten_build_files(request, result, "Format with Yapf")
 
 
 # ------------------------------------------------------------------------------------------
@@ -360,15 +427,15 @@ async def format_build_file_with_yapf(
 # ------------------------------------------------------------------------------------------
 
 
-class FormatWithBlackRequest(RewrittenBuildFileRequest):
+class FormatWithBlackRequest(FormatBuildFilesRequest):
     pass
 
 
 @rule
-async def format_build_file_with_black(
+async def format_build_files_with_black(
     request: FormatWithBlackRequest, black: Black
-) -> RewrittenBuildFile:
-    input_snapshot = await Get(Snapshot, CreateDigest([request.to_file_content()]))
+) -> RewrittenBuildFiles:
+    input_snapshot = await Get(Snapshot, CreateDigest(request.build_files))
     black_ics = await get_lockfile_interpreter_constraints(black)
     result = await _run_black(
         BlackRequest.Batch(
@@ -380,13 +447,7 @@ async def format_build_file_with_black(
         black,
         black_ics,
     )
-    output_content = await Get(DigestContents, Digest, result.output.digest)
-
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = ("Format with Black",) if result.did_change else ()
-
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+    return await _rewritten_build_files(request, result, "Format with Black")
 
 
 # ------------------------------------------------------------------------------------------
@@ -394,15 +455,15 @@ async def format_build_file_with_black(
 # ------------------------------------------------------------------------------------------
 
 
-class FormatWithRuffRequest(RewrittenBuildFileRequest):
+class FormatWithRuffRequest(FormatBuildFilesRequest):
     pass
 
 
 @rule
-async def format_build_file_with_ruff(
+async def format_build_files_with_ruff(
     request: FormatWithRuffRequest, ruff: Ruff
-) -> RewrittenBuildFile:
-    input_snapshot = await Get(Snapshot, CreateDigest([request.to_file_content()]))
+) -> RewrittenBuildFiles:
+    input_snapshot = await Get(Snapshot, CreateDigest(request.build_files))
     ruff_ics = await get_lockfile_interpreter_constraints(ruff)
     result = await _run_ruff_fmt(
         RuffRequest.Batch(
@@ -414,13 +475,7 @@ async def format_build_file_with_ruff(
         ruff,
         ruff_ics,
     )
-    output_content = await Get(DigestContents, Digest, result.output.digest)
-
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = ("Format with Ruff",) if result.did_change else ()
-
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+    return await _rewritten_build_files(request, result, "Format with Ruff")
 
 
 # ------------------------------------------------------------------------------------------
@@ -428,15 +483,15 @@ async def format_build_file_with_ruff(
 # ------------------------------------------------------------------------------------------
 
 
-class FormatWithBuildifierRequest(RewrittenBuildFileRequest):
+class FormatWithBuildifierRequest(FormatBuildFilesRequest):
     pass
 
 
 @rule
-async def format_build_file_with_buildifier(
+async def format_build_files_with_buildifier(
     request: FormatWithBuildifierRequest, buildifier: Buildifier, platform: Platform
-) -> RewrittenBuildFile:
-    input_snapshot = await Get(Snapshot, CreateDigest([request.to_file_content()]))
+) -> RewrittenBuildFiles:
+    input_snapshot = await Get(Snapshot, CreateDigest(request.build_files))
     result = await _run_buildifier_fmt(
         request=BuildifierRequest.Batch(
             tool_name=Buildifier.options_scope,
@@ -447,66 +502,55 @@ async def format_build_file_with_buildifier(
         buildifier=buildifier,
         platform=platform,
     )
-    output_content = await Get(DigestContents, Digest, result.output.digest)
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = (f"Format with {Buildifier.name}",) if result.did_change else ()
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+    return await _rewritten_build_files(request, result, f"Format with {Buildifier.name}")
 
 
 # ------------------------------------------------------------------------------------------
-# Rename deprecated target types fixer
+# Safe deprecations fixer
 # ------------------------------------------------------------------------------------------
 
 
-class RenameDeprecatedTargetsRequest(DeprecationFixerRequest):
+class FixSafeDeprecationsRequest(DeprecationFixerRequest):
     pass
 
 
-@rule(desc="Check for deprecated target type names", level=LogLevel.DEBUG)
-async def maybe_rename_deprecated_targets(
-    request: RenameDeprecatedTargetsRequest,
+@rule(desc="Check for deprecated target type and field names", level=LogLevel.DEBUG)
+async def maybe_fix_safe_deprecations(
+    request: FixSafeDeprecationsRequest,
+    renamed_target_types: renamed_targets_rules.RenamedTargetTypes,
+    renamed_field_types: renamed_fields_rules.RenamedFieldTypes,
 ) -> RewrittenBuildFile:
-    old_bytes = "\n".join(request.lines).encode("utf-8")
-    new_content = await Get(
-        FixedBUILDFile,
-        renamed_targets_rules.RenameTargetsInFileRequest(path=request.path, content=old_bytes),
-    )
-
-    return RewrittenBuildFile(
-        request.path,
-        tuple(new_content.content.decode("utf-8").splitlines()),
-        change_descriptions=("Renamed deprecated targets",)
-        if old_bytes != new_content.content
-        else (),
-    )
-
-
-# ------------------------------------------------------------------------------------------
-# Rename deprecated field types fixer
-# ------------------------------------------------------------------------------------------
-
-
-class RenameDeprecatedFieldsRequest(DeprecationFixerRequest):
-    pass
+    """Renames deprecated target types and then deprecated fields, in a single pass per file.
 
+    If nothing has been renamed, which is the common case, the file is not even tokenized.
+    """
+    content = "\n".join(request.lines).encode("utf-8")
+    change_descriptions = []
 
-@rule(desc="Check for deprecated field type names", level=LogLevel.DEBUG)
-async def maybe_rename_deprecated_fields(
-    request: RenameDeprecatedFieldsRequest,
-) -> RewrittenBuildFile:
-    old_bytes = "\n".join(request.lines).encode("utf-8")
-    new_content = await Get(
-        FixedBUILDFile,
-        renamed_fields_rules.RenameFieldsInFileRequest(path=request.path, content=old_bytes),
-    )
+    if renamed_target_types.target_renames:
+        fixed_targets = await Get(
+            FixedBUILDFile,
+            renamed_targets_rules.RenameTargetsInFileRequest(path=request.path, content=content),
+        )
+        if fixed_targets.content != content:
+            change_descriptions.append("Renamed deprecated targets")
+            content = fixed_targets.content
+
+    if renamed_field_types.target_field_renames:
+        fixed_fields = await Get(
+            FixedBUILDFile,
+            renamed_fields_rules.RenameFieldsInFileRequest(path=request.path, content=content),
+        )
+        if fixed_fields.content != content:
+            change_descriptions.append("Renamed deprecated fields")
+            content = fixed_fields.content
 
+    if not change_descriptions:
+        return RewrittenBuildFile(request.path, request.lines, change_descriptions=())
     return RewrittenBuildFile(
         request.path,
-        tuple(new_content.content.decode("utf-8").splitlines()),
-        change_descriptions=("Renamed deprecated fields",)
-        if old_bytes != new_content.content
-        else (),
+        tuple(content.decode("utf-8").splitlines()),
+        change_descriptions=tuple(change_descriptions),
     )
 
 
@@ -517,12 +561,9 @@ def rules():
         *collect_rules(renamed_targets_rules),
         *pex.rules(),
         *lockfile.rules(),
-        UnionRule(RewrittenBuildFileRequest, RenameDeprecatedTargetsRequest),
-        UnionRule(RewrittenBuildFileRequest, RenameDeprecatedFieldsRequest),
-        # NB: We want this to come at the end so that running Black or Yapf happens
-        # after all our deprecation fixers.
-        UnionRule(RewrittenBuildFileRequest, FormatWithBlackRequest),
-        UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
-        UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
-        UnionRule(RewrittenBuildFileRequest, FormatWithBuildifierRequest),
+        UnionRule(RewrittenBuildFileRequest, FixSafeDeprecationsRequest),
+        UnionRule(FormatBuildFilesRequest, FormatWithBlackRequest),
+        UnionRule(FormatBuildFilesRequest, FormatWithYapfRequest),
+        UnionRule(FormatBuildFilesRequest, FormatWithRuffRequest),
+        UnionRule(FormatBuildFilesRequest, FormatWithBuildifierRequest),
     )
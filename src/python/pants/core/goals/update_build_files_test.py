@@ -23,6 +23,7 @@ from pants.backend.python.util_rules.pex_requirements import (
     Lockfile,
 )
 from pants.core.goals.update_build_files import (
+    FormatBuildFilesRequest,
     FormatWithBlackRequest,
     FormatWithBuildifierRequest,
     FormatWithRuffRequest,
@@ -31,10 +32,10 @@ from pants.core.goals.update_build_files import (
     RewrittenBuildFileRequest,
     UpdateBuildFilesGoal,
     UpdateBuildFilesSubsystem,
-    format_build_file_with_black,
-    format_build_file_with_buildifier,
-    format_build_file_with_ruff,
-    format_build_file_with_yapf,
+    format_build_files_with_black,
+    format_build_files_with_buildifier,
+    format_build_files_with_ruff,
+    format_build_files_with_yapf,
     update_build_files,
 )
 from pants.core.target_types import GenericTarget
@@ -79,8 +80,8 @@ def generic_goal_rule_runner() -> RuleRunner:
         rules=(
             add_line,
             reverse_lines,
-            format_build_file_with_ruff,
-            format_build_file_with_yapf,
+            format_build_files_with_ruff,
+            format_build_files_with_yapf,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
@@ -93,8 +94,8 @@ def generic_goal_rule_runner() -> RuleRunner:
             *UpdateBuildFilesSubsystem.rules(),
             UnionRule(RewrittenBuildFileRequest, MockRewriteAddLine),
             UnionRule(RewrittenBuildFileRequest, MockRewriteReverseLines),
-            UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
-            UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithRuffRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithYapfRequest),
         )
     )
 
@@ -218,9 +219,9 @@ BLACK_ENV_INHERIT = {"PATH", "PYENV_ROOT", "HOME", "LANG", "LC_ALL"}
 def black_rule_runner() -> RuleRunner:
     return RuleRunner(
         rules=(
-            format_build_file_with_black,
-            format_build_file_with_ruff,
-            format_build_file_with_yapf,
+            format_build_files_with_black,
+            format_build_files_with_ruff,
+            format_build_files_with_yapf,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
@@ -230,9 +231,9 @@ def black_rule_runner() -> RuleRunner:
             *Ruff.rules(),
             *Yapf.rules(),
             *UpdateBuildFilesSubsystem.rules(),
-            UnionRule(RewrittenBuildFileRequest, FormatWithBlackRequest),
-            UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
-            UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithBlackRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithRuffRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithYapfRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -253,6 +254,32 @@ def test_black_fixer_fixes(black_rule_runner: RuleRunner) -> None:
     assert Path(black_rule_runner.build_root, "BUILD").read_text() == 'target(name="t")\n'
 
 
+def test_black_fixer_batches(black_rule_runner: RuleRunner) -> None:
+    black_rule_runner.write_files(
+        {
+            "BUILD": "target( name =  't' )",
+            "dir/BUILD": 'target(name="t")\n',
+            "dir/subdir/BUILD": "target( name =  't' )",
+        }
+    )
+    result = black_rule_runner.run_goal_rule(
+        UpdateBuildFilesGoal,
+        args=["--update-build-files-batch-size=1", "::"],
+        env_inherit=BLACK_ENV_INHERIT,
+    )
+    assert result.exit_code == 0
+    assert result.stdout == dedent(
+        """\
+        Updated BUILD:
+          - Format with Black
+        Updated dir/subdir/BUILD:
+          - Format with Black
+        """
+    )
+    for path in ("BUILD", "dir/BUILD", "dir/subdir/BUILD"):
+        assert Path(black_rule_runner.build_root, path).read_text() == 'target(name="t")\n'
+
+
 def test_black_fixer_noops(black_rule_runner: RuleRunner) -> None:
     black_rule_runner.write_files({"BUILD": 'target(name="t")\n'})
     result = black_rule_runner.run_goal_rule(
@@ -299,13 +326,13 @@ def run_ruff(
     """Returns the Goal's result and contents of the BUILD file after execution."""
     rule_runner = RuleRunner(
         rules=(
-            format_build_file_with_ruff,
+            format_build_files_with_ruff,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
             *Ruff.rules(),
             *UpdateBuildFilesSubsystem.rules(),
-            UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithRuffRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -350,13 +377,13 @@ def run_buildifier(
     """Returns the Goal's result and contents of the BUILD file after execution."""
     rule_runner = RuleRunner(
         rules=(
-            format_build_file_with_buildifier,
+            format_build_files_with_buildifier,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
             *Buildifier.rules(),
             *UpdateBuildFilesSubsystem.rules(),
-            UnionRule(RewrittenBuildFileRequest, FormatWithBuildifierRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithBuildifierRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -401,13 +428,13 @@ def run_yapf(
     """Returns the Goal's result and contents of the BUILD file after execution."""
     rule_runner = RuleRunner(
         rules=(
-            format_build_file_with_yapf,
+            format_build_files_with_yapf,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
             *Yapf.rules(),
             *UpdateBuildFilesSubsystem.rules(),
-            UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
+            UnionRule(FormatBuildFilesRequest, FormatWithYapfRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -46,6 +46,7 @@ from pants.core.util_rules import (
     environments,
     external_tool,
     source_files,
+    split_digest,
     stripped_source_files,
     subprocess_environment,
     system_binaries,
@@ -95,6 +96,7 @@ def rules():
         *git.rules(),
         *source_files.rules(),
         *source_root.rules(),
+        *split_digest.rules(),
         *stats_aggregator.rules(),
         *stripped_source_files.rules(),
         *subprocess_environment.rules(),
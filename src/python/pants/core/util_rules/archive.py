@@ -22,20 +22,47 @@ from pants.core.util_rules.system_binaries import (
 from pants.engine.fs import (
     CreateDigest,
     Digest,
+    DigestContents,
+    DigestEntries,
     Directory,
     FileContent,
+    FileEntry,
     MergeDigests,
     RemovePrefix,
     Snapshot,
+    SymlinkEntry,
 )
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.util.archive import (
+    ArchivedFile,
+    ArchivedSymlink,
+    ArchiveMember,
+    UnsupportedArchiveError,
+    create_tar,
+    create_zip,
+    decompress_gzip,
+    extract_tar,
+    extract_zip,
+)
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
+# Archives whose contents add up to less than this size are created and extracted in memory, which
+# avoids looking up the system binaries and materializing a sandbox. Bigger archives, and any
+# archive using features not supported in memory, are handled by the system binaries instead.
+_IN_MEMORY_ARCHIVE_MAX_SIZE = 64 * 1024 * 1024
+
+_TAR_COMPRESSION_BY_FORMAT = {
+    ArchiveFormat.TAR: "",
+    ArchiveFormat.TGZ: "gz",
+    ArchiveFormat.TBZ2: "bz2",
+    ArchiveFormat.TXZ: "xz",
+}
+
 
 @dataclass(frozen=True)
 class CreateArchive:
@@ -49,10 +76,35 @@ class CreateArchive:
     format: ArchiveFormat
 
 
+async def _create_archive_in_memory(request: CreateArchive) -> Digest | None:
+    entries = await Get(DigestEntries, Digest, request.snapshot.digest)
+    file_entries = [entry for entry in entries if isinstance(entry, FileEntry)]
+    if any(isinstance(entry, SymlinkEntry) for entry in entries) or (
+        sum(entry.file_digest.serialized_bytes_length for entry in file_entries)
+        > _IN_MEMORY_ARCHIVE_MAX_SIZE
+    ):
+        return None
+
+    digest_contents = await Get(DigestContents, Digest, request.snapshot.digest)
+    files = [
+        ArchivedFile(file.path, file.content, is_executable=file.is_executable)
+        for file in digest_contents
+    ]
+    if request.format == ArchiveFormat.ZIP:
+        content = create_zip(files)
+    else:
+        content = create_tar(files, compression=_TAR_COMPRESSION_BY_FORMAT[request.format])
+    return await Get(Digest, CreateDigest([FileContent(request.output_filename, content)]))
+
+
 @rule(desc="Creating an archive file", level=LogLevel.DEBUG)
 async def create_archive(
     request: CreateArchive, system_binaries_environment: SystemBinariesSubsystem.EnvironmentAware
 ) -> Digest:
+    in_memory_digest = await _create_archive_in_memory(request)
+    if in_memory_digest is not None:
+        return in_memory_digest
+
     # #16091 -- if an arg list is really long, archive utilities tend to get upset.
     # passing a list of filenames into the utilities fixes this.
     FILE_LIST_FILENAME = "__pants_archive_filelist__"
@@ -141,6 +193,52 @@ async def convert_digest_to_MaybeExtractArchiveRequest(
     return MaybeExtractArchiveRequest(digest)
 
 
+def _archive_member_to_digest_entry(
+    member: ArchiveMember,
+) -> FileContent | SymlinkEntry | Directory:
+    if isinstance(member, ArchivedFile):
+        return FileContent(member.path, member.content, is_executable=member.is_executable)
+    if isinstance(member, ArchivedSymlink):
+        return SymlinkEntry(member.path, member.target)
+    return Directory(member.path)
+
+
+async def _extract_archive_in_memory(
+    archive_path: str, digest: Digest, *, is_zip: bool, is_tar: bool
+) -> Digest | None:
+    archive_entries = await Get(DigestEntries, Digest, digest)
+    archive_entry = archive_entries[0]
+    if (
+        not isinstance(archive_entry, FileEntry)
+        or archive_entry.file_digest.serialized_bytes_length > _IN_MEMORY_ARCHIVE_MAX_SIZE
+    ):
+        return None
+
+    digest_contents = await Get(DigestContents, Digest, digest)
+    archive_content = digest_contents[0].content
+    try:
+        if is_zip:
+            members = extract_zip(archive_content, max_size=_IN_MEMORY_ARCHIVE_MAX_SIZE)
+        elif is_tar:
+            members = extract_tar(archive_content, max_size=_IN_MEMORY_ARCHIVE_MAX_SIZE)
+        else:
+            # Same naming as the `gunzip` binary: drop the last suffix of the archive name.
+            dest_file_name = os.path.splitext(os.path.basename(archive_path))[0]
+            members = [
+                ArchivedFile(
+                    dest_file_name,
+                    decompress_gzip(archive_content, max_size=_IN_MEMORY_ARCHIVE_MAX_SIZE),
+                )
+            ]
+    except UnsupportedArchiveError as e:
+        logger.debug(f"Falling back to extracting {archive_path} with system binaries: {e}")
+        return None
+
+    return await Get(
+        Digest, CreateDigest(_archive_member_to_digest_entry(member) for member in members)
+    )
+
+
 @rule(desc="Extracting an archive file", level=LogLevel.DEBUG)
 async def maybe_extract_archive(
     request: MaybeExtractArchiveRequest,
@@ -165,6 +263,13 @@ async def maybe_extract_archive(
     if not is_zip and not is_tar and not is_gz:
         return ExtractedArchive(request.digest)
 
+    if not archive_suffix.endswith(".tar.lz4"):
+        in_memory_digest = await _extract_archive_in_memory(
+            archive_path, request.digest, is_zip=is_zip, is_tar=is_tar
+        )
+        if in_memory_digest is not None:
+            return ExtractedArchive(in_memory_digest)
+
     merge_digest_get = Get(Digest, MergeDigests((request.digest, output_dir_digest)))
     env = {}
     append_only_caches: FrozenDict[str, str] = FrozenDict({})
@@ -18,7 +18,7 @@ from pants.core.util_rules.archive import (
     MaybeExtractArchiveRequest,
 )
 from pants.core.util_rules.system_binaries import ArchiveFormat
-from pants.engine.fs import Digest, DigestContents, FileContent
+from pants.engine.fs import CreateDigest, Digest, DigestContents, FileContent, Snapshot
 from pants.testutil.rule_runner import QueryRule, RuleRunner
 
 
@@ -31,10 +31,23 @@ def rule_runner() -> RuleRunner:
             QueryRule(Digest, [CreateArchive]),
             QueryRule(ExtractedArchive, [Digest]),
             QueryRule(ExtractedArchive, [MaybeExtractArchiveRequest]),
+            QueryRule(Digest, [CreateDigest]),
+            QueryRule(Snapshot, [Digest]),
         ],
     )
 
 
+@pytest.fixture(
+    params=[pytest.param(True, id="in_memory"), pytest.param(False, id="system_binaries")]
+)
+def in_memory(request, monkeypatch) -> bool:
+    """Runs the test both with archives handled in memory and with the system binaries."""
+    if not request.param:
+        # Every archive exceeds the limit, so the system binaries are always used.
+        monkeypatch.setattr(archive, "_IN_MEMORY_ARCHIVE_MAX_SIZE", -1)
+    return cast(bool, request.param)
+
+
 @pytest.fixture(
     params=[pytest.param(True, id="fake_suffix"), pytest.param(False, id="actual_suffix")]
 )
@@ -62,7 +75,9 @@ EXPECTED_DIGEST_CONTENTS = DigestContents(
 
 
 @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
-def test_extract_zip(extract_from_file_info: ExtractorFixtureT, compression: int) -> None:
+def test_extract_zip(
+    extract_from_file_info: ExtractorFixtureT, compression: int, in_memory: bool
+) -> None:
     io = BytesIO()
     with zipfile.ZipFile(io, "w", compression=compression) as zf:
         for name, content in FILES.items():
@@ -73,7 +88,9 @@ def test_extract_zip(extract_from_file_info: ExtractorFixtureT, compression: int
 
 
 @pytest.mark.parametrize("compression", ["", "gz", "bz2", "xz"])
-def test_extract_tar(extract_from_file_info: ExtractorFixtureT, compression: str) -> None:
+def test_extract_tar(
+    extract_from_file_info: ExtractorFixtureT, compression: str, in_memory: bool
+) -> None:
     io = BytesIO()
     mode = f"w:{compression}" if compression else "w"
     with tarfile.open(mode=mode, fileobj=io) as tf:
@@ -100,7 +117,9 @@ def test_extract_tarlz4(extract_from_file_info: ExtractorFixtureT):
     assert digest_contents == DigestContents([FileContent("tmp/msg/txt.txt", b"pants")])
 
 
-def test_extract_gz(extract_from_file_info: ExtractorFixtureT, rule_runner: RuleRunner) -> None:
+def test_extract_gz(
+    extract_from_file_info: ExtractorFixtureT, rule_runner: RuleRunner, in_memory: bool
+) -> None:
     # NB: `gz` files are only compressed, and are not archives: they represent a single file.
     name = "test"
     content = b"Hello world!\n"
@@ -113,6 +132,22 @@ def test_extract_gz(extract_from_file_info: ExtractorFixtureT, rule_runner: Rule
     assert digest_contents == DigestContents([FileContent(name, content)])
 
 
+def test_extract_tar_repeated_members(
+    extract_from_file_info: ExtractorFixtureT, in_memory: bool
+) -> None:
+    # As with `tar -r`, a member appended later replaces the earlier one with the same name.
+    io = BytesIO()
+    with tarfile.open(mode="w", fileobj=io) as tf:
+        for name, content in [*FILES.items(), ("foo", b"baz")]:
+            tarinfo = tarfile.TarInfo(name)
+            tarinfo.size = len(content)
+            tf.addfile(tarinfo, BytesIO(content))
+    digest_contents = extract_from_file_info(".tar", io.getvalue())
+    assert digest_contents == DigestContents(
+        [FileContent("foo", b"baz"), FileContent("hello/world", b"Hello, World!")]
+    )
+
+
 def test_extract_non_archive(rule_runner: RuleRunner) -> None:
     input_snapshot = rule_runner.make_snapshot({"test.sh": b"# A shell script"})
     extracted_archive = rule_runner.request(ExtractedArchive, [input_snapshot.digest])
@@ -120,7 +155,7 @@ def test_extract_non_archive(rule_runner: RuleRunner) -> None:
     assert DigestContents([FileContent("test.sh", b"# A shell script")]) == digest_contents
 
 
-def test_create_zip_archive(rule_runner: RuleRunner) -> None:
+def test_create_zip_archive(rule_runner: RuleRunner, in_memory: bool) -> None:
     output_filename = "demo/a.zip"
     input_snapshot = rule_runner.make_snapshot(FILES)
     created_digest = rule_runner.request(
@@ -144,7 +179,9 @@ def test_create_zip_archive(rule_runner: RuleRunner) -> None:
 @pytest.mark.parametrize(
     "format", [ArchiveFormat.TAR, ArchiveFormat.TGZ, ArchiveFormat.TXZ, ArchiveFormat.TBZ2]
 )
-def test_create_tar_archive(rule_runner: RuleRunner, format: ArchiveFormat) -> None:
+def test_create_tar_archive(
+    rule_runner: RuleRunner, format: ArchiveFormat, in_memory: bool
+) -> None:
     output_filename = f"demo/a.{format.value}"
     input_snapshot = rule_runner.make_snapshot(FILES)
     created_digest = rule_runner.request(
@@ -200,3 +237,25 @@ def test_create_tar_archive_in_root_dir(rule_runner: RuleRunner, format: Archive
     extracted_archive = rule_runner.request(ExtractedArchive, [created_digest])
     digest_contents = rule_runner.request(DigestContents, [extracted_archive.digest])
     assert digest_contents == EXPECTED_DIGEST_CONTENTS
+
+
+@pytest.mark.parametrize("format", list(ArchiveFormat))
+def test_create_archive_preserves_executable_bit(
+    rule_runner: RuleRunner, format: ArchiveFormat
+) -> None:
+    output_filename = f"a.{format.value}"
+    input_digest = rule_runner.request(
+        Digest,
+        [CreateDigest([FileContent("bin/run.sh", b"#!/bin/sh", is_executable=True)])],
+    )
+    input_snapshot = rule_runner.request(Snapshot, [input_digest])
+    created_digest = rule_runner.request(
+        Digest,
+        [CreateArchive(input_snapshot, output_filename=output_filename, format=format)],
+    )
+
+    extracted_archive = rule_runner.request(ExtractedArchive, [created_digest])
+    digest_contents = rule_runner.request(DigestContents, [extracted_archive.digest])
+    assert digest_contents == DigestContents(
+        [FileContent("bin/run.sh", b"#!/bin/sh", is_executable=True)]
+    )
@@ -7,7 +7,18 @@ import hashlib
 import json
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, ClassVar, Generic, Iterable, Tuple, Type, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    Iterator,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from pants.util.docutil import bin_name
 from pants.util.ordered_set import FrozenOrderedSet
@@ -17,6 +28,22 @@ BEGIN_LOCKFILE_HEADER = "--- BEGIN PANTS LOCKFILE METADATA: DO NOT EDIT OR REMOV
 END_LOCKFILE_HEADER = "--- END PANTS LOCKFILE METADATA ---"
 
 
+def _lockfile_lines(lockfile: bytes, begin_line: bytes, end_line: bytes) -> Iterator[bytes]:
+    """Lazily yields the lines of the lockfile which may contain the header.
+
+    Lockfiles can be very large, so the lines after the header are only split if needed.
+    """
+    if begin_line not in lockfile:
+        return
+    end = lockfile.find(end_line)
+    end = -1 if end == -1 else lockfile.find(b"\n", end)
+    if end == -1:
+        yield from lockfile.splitlines()
+        return
+    yield from lockfile[: end + 1].splitlines()
+    yield from lockfile[end + 1 :].splitlines()
+
+
 class LockfileScope(Enum):
     JVM = "jvm"
     PYTHON = "python"
@@ -99,12 +126,14 @@ class LockfileMetadata:
         metadata class. See the existing callers for an example.
         """
         assert cls is not LockfileMetadata, "Call me on a subclass!"
+        begin_line = f"{delimeter} {BEGIN_LOCKFILE_HEADER}".encode()
+        end_line = f"{delimeter} {END_LOCKFILE_HEADER}".encode()
         in_metadata_block = False
         metadata_lines = []
-        for line in lockfile.splitlines():
-            if line == f"{delimeter} {BEGIN_LOCKFILE_HEADER}".encode():
+        for line in _lockfile_lines(lockfile, begin_line, end_line):
+            if line == begin_line:
                 in_metadata_block = True
-            elif line == f"{delimeter} {END_LOCKFILE_HEADER}".encode():
+            elif line == end_line:
                 break
             elif in_metadata_block:
                 metadata_lines.append(line[len(delimeter) + 1 :])
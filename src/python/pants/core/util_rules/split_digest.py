@@ -0,0 +1,89 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+
+from pants.engine.fs import (
+    CreateDigest,
+    Digest,
+    DigestEntries,
+    Directory,
+    FileEntry,
+    Snapshot,
+    SymlinkEntry,
+)
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.source.filespec import FilespecMatcher
+from pants.util.dirutil import fast_relpath
+from pants.util.frozendict import FrozenDict
+
+
+@dataclass(frozen=True)
+class DigestPart:
+    """The files of a digest matching the given globs, with an optional prefix removed.
+
+    Like `PathGlobs`, globs prefixed with `!` exclude the files they match.
+    """
+
+    name: str
+    globs: tuple[str, ...]
+    strip_prefix: str = ""
+
+
+@dataclass(frozen=True)
+class SplitDigestRequest:
+    """Split a digest into named parts, which may overlap.
+
+    This is equivalent to a `DigestSubset` (and `RemovePrefix`, if a part has a prefix to strip)
+    per part, but the entries of the digest are only loaded once, and the parts are created
+    concurrently.
+    """
+
+    digest: Digest
+    parts: tuple[DigestPart, ...]
+
+
+@dataclass(frozen=True)
+class SplitDigest:
+    snapshots: FrozenDict[str, Snapshot]
+
+    def __getitem__(self, name: str) -> Snapshot:
+        return self.snapshots[name]
+
+
+@rule
+async def split_digest(request: SplitDigestRequest) -> SplitDigest:
+    entries = await Get(DigestEntries, Digest, request.digest)
+    entries_by_path = {entry.path: entry for entry in entries}
+    paths = tuple(entries_by_path)
+
+    def part_entries(part: DigestPart) -> list[FileEntry | SymlinkEntry | Directory]:
+        result = []
+        matcher = FilespecMatcher(
+            [glob for glob in part.globs if not glob.startswith("!")],
+            [glob[1:] for glob in part.globs if glob.startswith("!")],
+        )
+        for path in matcher.matches(paths):
+            entry = entries_by_path[path]
+            if part.strip_prefix:
+                relpath = fast_relpath(path, part.strip_prefix)
+                if not relpath:
+                    # The prefix directory itself.
+                    continue
+                entry = dataclasses.replace(entry, path=relpath)
+            result.append(entry)
+        return result
+
+    snapshots = await MultiGet(
+        Get(Snapshot, CreateDigest(part_entries(part))) for part in request.parts
+    )
+    return SplitDigest(
+        FrozenDict({part.name: snapshot for part, snapshot in zip(request.parts, snapshots)})
+    )
+
+
+def rules():
+    return collect_rules()
@@ -0,0 +1,72 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import pytest
+
+from pants.core.util_rules import split_digest
+from pants.core.util_rules.split_digest import DigestPart, SplitDigest, SplitDigestRequest
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    CreateDigest,
+    Digest,
+    DigestSubset,
+    Directory,
+    FileContent,
+    PathGlobs,
+    RemovePrefix,
+)
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(
+        rules=[
+            *split_digest.rules(),
+            QueryRule(SplitDigest, [SplitDigestRequest]),
+            QueryRule(Digest, [DigestSubset]),
+            QueryRule(Digest, [RemovePrefix]),
+        ],
+    )
+
+
+def test_split_digest(rule_runner: RuleRunner) -> None:
+    digest = rule_runner.request(
+        Digest,
+        [
+            CreateDigest(
+                [
+                    FileContent(".coverage", b"coverage"),
+                    FileContent("results.xml", b"<testsuite/>"),
+                    FileContent("extra-output/a.txt", b"a"),
+                    FileContent("extra-output/nested/b.txt", b"b"),
+                    Directory("extra-output/empty"),
+                    FileContent("other.txt", b"other"),
+                ]
+            )
+        ],
+    )
+    parts = (
+        DigestPart("coverage", (".coverage",)),
+        DigestPart("xml_results", ("*.xml", "missing.xml")),
+        DigestPart("extra_output", ("extra-output/**",), strip_prefix="extra-output"),
+        DigestPart("not_nested", ("**/*.txt", "!extra-output/nested/**")),
+        DigestPart("missing", ("missing/**",)),
+    )
+    result = rule_runner.request(SplitDigest, [SplitDigestRequest(digest, parts)])
+
+    assert result["coverage"].files == (".coverage",)
+    assert result["xml_results"].files == ("results.xml",)
+    assert result["extra_output"].files == ("a.txt", "nested/b.txt")
+    assert result["extra_output"].dirs == ("empty", "nested")
+    assert result["not_nested"].files == ("extra-output/a.txt", "other.txt")
+    assert result["missing"].digest == EMPTY_DIGEST
+
+    # Each part is equivalent to a `DigestSubset`, followed by a `RemovePrefix` if requested.
+    for part in parts:
+        subset = rule_runner.request(Digest, [DigestSubset(digest, PathGlobs(part.globs))])
+        if part.strip_prefix:
+            subset = rule_runner.request(Digest, [RemovePrefix(subset, part.strip_prefix)])
+        assert result[part.name].digest == subset
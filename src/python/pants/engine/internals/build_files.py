@@ -11,7 +11,6 @@ import os.path
 import sys
 import typing
 from dataclasses import dataclass
-from pathlib import PurePath
 from typing import Any, Sequence, cast
 
 import typing_extensions
@@ -225,6 +224,48 @@ async def ensure_address_family(request: OptionalAddressFamily) -> AddressFamily
     return request.ensure()
 
 
+@dataclass(frozen=True)
+class InheritedBuildFileStateRequest(EngineAwareParameter):
+    """Request the state that BUILD files in `path` inherit from their ancestor directories."""
+
+    path: str
+
+    def debug_hint(self) -> str:
+        return self.path
+
+
+@dataclass(frozen=True)
+class InheritedBuildFileState:
+    """The defaults and dependency rules of the nearest ancestor directory with BUILD files."""
+
+    defaults: BuildFileDefaults
+    dependents_rules: BuildFileDependencyRules | None = None
+    dependencies_rules: BuildFileDependencyRules | None = None
+
+
+@rule
+async def get_inherited_build_file_state(
+    request: InheritedBuildFileStateRequest,
+) -> InheritedBuildFileState:
+    # Each directory only consults its parent, and reuses the state inherited by the parent when it
+    # has no BUILD files of its own. That way directories share the walk up the tree, rather than
+    # each of them requesting the address family of all their ancestors.
+    if not request.path:
+        return InheritedBuildFileState(BuildFileDefaults({}))
+
+    parent_dir = os.path.dirname(request.path)
+    maybe_parent = await Get(OptionalAddressFamily, AddressFamilyDir(parent_dir))
+    if maybe_parent.address_family is None:
+        return await Get(InheritedBuildFileState, InheritedBuildFileStateRequest(parent_dir))
+
+    family = maybe_parent.address_family
+    return InheritedBuildFileState(
+        defaults=family.defaults,
+        dependents_rules=family.dependents_rules,
+        dependencies_rules=family.dependencies_rules,
+    )
+
+
 class BUILDFileEnvVarExtractor(ast.NodeVisitor):
     def __init__(self, filename: str):
         super().__init__()
@@ -302,25 +343,9 @@ async def parse_address_family(
     if not digest_contents and not synthetic_address_maps:
         return OptionalAddressFamily(directory.path)
 
-    defaults = BuildFileDefaults({})
-    dependents_rules: BuildFileDependencyRules | None = None
-    dependencies_rules: BuildFileDependencyRules | None = None
-    parent_dirs = tuple(PurePath(directory.path).parents)
-    if parent_dirs:
-        maybe_parents = await MultiGet(
-            Get(OptionalAddressFamily, AddressFamilyDir(str(parent_dir)))
-            for parent_dir in parent_dirs
-        )
-        for maybe_parent in maybe_parents:
-            if maybe_parent.address_family is not None:
-                family = maybe_parent.address_family
-                defaults = family.defaults
-                dependents_rules = family.dependents_rules
-                dependencies_rules = family.dependencies_rules
-                break
-
+    inherited = await Get(InheritedBuildFileState, InheritedBuildFileStateRequest(directory.path))
     defaults_parser_state = BuildFileDefaultsParserState.create(
-        directory.path, defaults, registered_target_types, union_membership
+        directory.path, inherited.defaults, registered_target_types, union_membership
     )
     build_file_dependency_rules_class = (
         maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
@@ -328,11 +353,11 @@ async def parse_address_family(
     if build_file_dependency_rules_class is not None:
         dependents_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
             directory.path,
-            dependents_rules,
+            inherited.dependents_rules,
         )
         dependencies_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
             directory.path,
-            dependencies_rules,
+            inherited.dependencies_rules,
         )
     else:
         dependents_rules_parser_state = None
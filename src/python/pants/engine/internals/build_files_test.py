@@ -619,6 +619,28 @@ def test_inherit_defaults(target_adaptor_rule_runner: RuleRunner) -> None:
     assert target_adaptor.kwargs["tags"] == ("root",)
 
 
+def test_inherit_defaults_from_nearest_ancestor(target_adaptor_rule_runner: RuleRunner) -> None:
+    target_adaptor_rule_runner.write_files(
+        {
+            "BUILD": """__defaults__(all=dict(tags=["root"]))""",
+            "a/BUILD": """__defaults__(all=dict(tags=["a"]))""",
+            "a/b/c/BUILD": "mock_tgt()",
+            "d/e/BUILD": "mock_tgt()",
+        }
+    )
+    target_adaptor = target_adaptor_rule_runner.request(
+        TargetAdaptor,
+        [TargetAdaptorRequest(Address("a/b/c"), description_of_origin="tests")],
+    )
+    assert target_adaptor.kwargs["tags"] == ("a",)
+
+    target_adaptor = target_adaptor_rule_runner.request(
+        TargetAdaptor,
+        [TargetAdaptorRequest(Address("d/e"), description_of_origin="tests")],
+    )
+    assert target_adaptor.kwargs["tags"] == ("root",)
+
+
 def test_parametrize_defaults(target_adaptor_rule_runner: RuleRunner) -> None:
     target_adaptor_rule_runner.write_files(
         {
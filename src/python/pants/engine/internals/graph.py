@@ -14,7 +14,6 @@ from dataclasses import dataclass
 from pathlib import PurePath
 from typing import (
     Any,
-    DefaultDict,
     FrozenSet,
     Iterable,
     Iterator,
@@ -37,6 +36,7 @@ from pants.engine.addresses import (
     UnparsedAddressInputs,
 )
 from pants.engine.collection import Collection
+from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.environment import ChosenLocalEnvironmentName, EnvironmentName
 from pants.engine.fs import EMPTY_SNAPSHOT, GlobMatchErrorBehavior, PathGlobs, Paths, Snapshot
 from pants.engine.internals import native_engine
@@ -50,10 +50,16 @@ from pants.engine.internals.parametrize import (  # noqa: F401
 from pants.engine.internals.parametrize import (  # noqa: F401
     _TargetParametrizationsRequest as _TargetParametrizationsRequest,
 )
-from pants.engine.internals.target_adaptor import SourceBlocks, TargetAdaptor, TargetAdaptorRequest
+from pants.engine.internals.target_adaptor import (
+    SourceBlocksIndex,
+    TargetAdaptor,
+    TargetAdaptorRequest,
+)
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
     AllTargets,
+    AllTargetsShard,
+    AllTargetsShards,
     AllUnexpandedTargets,
     CoarsenedTarget,
     CoarsenedTargets,
@@ -658,6 +664,25 @@ async def find_all_targets() -> AllTargets:
     return AllTargets(tgts)
 
 
+@rule(
+    desc="Shard all targets in the project",
+    level=LogLevel.DEBUG,
+    _masked_types=[EnvironmentName],
+)
+async def shard_all_targets(all_targets: AllTargets) -> AllTargetsShards:
+    targets_per_shard: dict[tuple[str, type[Target]], list[Target]] = defaultdict(list)
+    for tgt in all_targets:
+        targets_per_shard[(tgt.address.spec_path, type(tgt))].append(tgt)
+    return AllTargetsShards(
+        tuple(
+            AllTargetsShard(directory, target_type, tuple(sorted(targets)))
+            for (directory, target_type), targets in sorted(
+                targets_per_shard.items(), key=lambda item: (item[0][0], item[0][1].alias)
+            )
+        )
+    )
+
+
 @rule(
     desc="Find all (unexpanded) targets in the project",
     level=LogLevel.DEBUG,
@@ -998,16 +1023,6 @@ def _log_or_raise_unmatched_owners(
         raise ResolveError(msg)
 
 
-@dataclass(frozen=True)
-class TargetSourceBlocks:
-    address: Address
-    source_blocks: SourceBlocks
-
-
-class FilenameTargetSourceBlocksMapping(FrozenDict[str, tuple[TargetSourceBlocks, ...]]):
-    """Map file paths to all TargetSourceBlocks owned by that file."""
-
-
 @dataclass(frozen=True)
 class TargetOriginSourcesBlocksOptions:
     enable: bool
@@ -1022,35 +1037,68 @@ def extract_enable_target_origin_sources_blocks(
     )
 
 
+@dataclass(frozen=True)
+class FileSourceBlocksRequest(EngineAwareParameter):
+    """Request the index of the source blocks of all the targets owning lines of a file."""
+
+    filename: str
+
+    def debug_hint(self) -> str:
+        return self.filename
+
+
+class FileSourceBlocks(SourceBlocksIndex[Address]):
+    pass
+
+
 @rule
-def calc_source_block_mapping(
-    targets: AllTargets,
-    options: TargetOriginSourcesBlocksOptions,
-) -> FilenameTargetSourceBlocksMapping:
+async def index_file_source_blocks(
+    request: FileSourceBlocksRequest, options: TargetOriginSourcesBlocksOptions
+) -> FileSourceBlocks:
     if not options.enable:
-        return FilenameTargetSourceBlocksMapping()
-
-    result: DefaultDict[str, list[TargetSourceBlocks]] = defaultdict(list)
-    for target in targets:
-        for filename, sources_blocks in target.origin_sources_blocks.items():
-            result[filename].append(
-                TargetSourceBlocks(address=target.address, source_blocks=sources_blocks)
-            )
+        return FileSourceBlocks(())
 
-    return FilenameTargetSourceBlocksMapping(
-        (filename, tuple(blocks)) for filename, blocks in result.items()
+    # Like for `OwnersRequest`, only targets declared in the directory of the file or any of its
+    # ancestors may own it, so there is no need to look at all the targets in the repository.
+    candidate_targets = await Get(
+        Targets,
+        RawSpecsWithoutFileOwners(
+            ancestor_globs=(AncestorGlobSpec(directory=os.path.dirname(request.filename)),),
+            description_of_origin="<source blocks rule - unused>",
+            unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+        ),
+    )
+    return FileSourceBlocks(
+        (block, target.address)
+        for target in candidate_targets
+        for block in target.origin_sources_blocks.get(request.filename, ())
     )
 
 
+@dataclass(frozen=True)
+class FilesWithSourceBlocksRequest:
+    """Request which of the given files have lines owned by source blocks of targets."""
+
+    files: tuple[str, ...]
+
+
 class FilesWithSourceBlocks(FrozenSet[str]):
     pass
 
 
 @rule
-def calc_files_with_sources_blocks(
-    mapping: FilenameTargetSourceBlocksMapping,
+async def calc_files_with_sources_blocks(
+    request: FilesWithSourceBlocksRequest, options: TargetOriginSourcesBlocksOptions
 ) -> FilesWithSourceBlocks:
-    return FilesWithSourceBlocks(mapping.keys())
+    if not options.enable:
+        return FilesWithSourceBlocks()
+
+    indexes = await MultiGet(
+        Get(FileSourceBlocks, FileSourceBlocksRequest(filename)) for filename in request.files
+    )
+    return FilesWithSourceBlocks(
+        filename for filename, index in zip(request.files, indexes) if len(index)
+    )
 
 
 @dataclass(frozen=True)
@@ -1192,30 +1240,19 @@ async def find_owners(
 
 
 @rule
-def find_source_blocks_owners(
-    request: TextBlocksOwnersRequest, mapping: FilenameTargetSourceBlocksMapping
-) -> Owners:
-    file_blocks = mapping.get(request.filename)
-    if not file_blocks:
-        return Owners()
-
-    owners = set()
-
+async def find_source_blocks_owners(request: TextBlocksOwnersRequest) -> Owners:
     # Let's say the rule is called to figure out which targets has changed given the `git diff` output.
-    # Then `request.source_blocks` is populated with source blocks parsed from `git diff` output
-    # and `file_blocks` is holding the list of all source blocks for the given `request.filename`.
-    # In order to get an answer we need to find an intersection for all pairs of blocks and return
-    # the targets they correspond to.
-    #
-    # TODO Use interval tree?
-    for request_block, target_blocks in itertools.product(request.text_blocks, file_blocks):
-        for target_block in target_blocks.source_blocks:
-            if not target_block.is_touched_by(request_block):
-                continue
-            owners.add(target_blocks.address)
-            break  # continue outer loop
+    # Then `request.source_blocks` is populated with source blocks parsed from `git diff` output,
+    # and we look up the targets owning any of the source blocks they touch in the file's index.
+    index = await Get(FileSourceBlocks, FileSourceBlocksRequest(request.filename))
+    if not len(index):
+        return Owners()
 
-    return Owners(owners)
+    return Owners(
+        itertools.chain.from_iterable(
+            index.owners_touched_by(text_block) for text_block in request.text_blocks
+        )
+    )
 
 
 # -----------------------------------------------------------------------------------------------
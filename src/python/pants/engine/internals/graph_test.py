@@ -36,6 +36,8 @@ from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.rules import Get, MultiGet, rule
 from pants.engine.target import (
     AllTargets,
+    AllTargetsShard,
+    AllTargetsShards,
     AllUnexpandedTargets,
     AlwaysTraverseDeps,
     AsyncFieldMixin,
@@ -158,6 +160,7 @@ def transitive_targets_rule_runner() -> RuleRunner:
     return RuleRunner(
         rules=[
             QueryRule(AllTargets, []),
+            QueryRule(AllTargetsShards, []),
             QueryRule(AllUnexpandedTargets, []),
             QueryRule(CoarsenedTargets, [Addresses]),
             QueryRule(Targets, [DependenciesRequest]),
@@ -804,6 +807,30 @@ def test_find_all_targets(transitive_targets_rule_runner: RuleRunner) -> None:
     all_unexpanded = transitive_targets_rule_runner.request(AllUnexpandedTargets, [])
     assert {t.address for t in all_unexpanded} == {*expected, Address("", target_name="generator")}
 
+    all_tgts_by_address = {t.address: t for t in all_tgts}
+    shards = transitive_targets_rule_runner.request(AllTargetsShards, [])
+    assert shards == AllTargetsShards(
+        (
+            AllTargetsShard(
+                "",
+                MockGeneratedTarget,
+                tuple(
+                    all_tgts_by_address[
+                        Address("", target_name="generator", relative_file_path=file_name)
+                    ]
+                    for file_name in ("f1.txt", "f2.txt")
+                ),
+            ),
+            AllTargetsShard(
+                "", MockTarget, (all_tgts_by_address[Address("", target_name="non-generator")],)
+            ),
+            AllTargetsShard("dir", MockTarget, (all_tgts_by_address[Address("dir")],)),
+        )
+    )
+    assert [shard.target_type for shard in shards.with_field(MockSingleSourceField)] == [
+        MockGeneratedTarget
+    ]
+
 
 def test_invalid_target(transitive_targets_rule_runner: RuleRunner) -> None:
     transitive_targets_rule_runner.write_files(
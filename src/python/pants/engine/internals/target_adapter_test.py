@@ -1,10 +1,10 @@
 # Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
-from itertools import zip_longest
+from itertools import product, zip_longest
 
 import pytest
 
-from pants.engine.internals.target_adaptor import SourceBlock
+from pants.engine.internals.target_adaptor import SourceBlock, SourceBlocksIndex
 from pants.vcs.hunk import TextBlock
 
 
@@ -41,3 +41,22 @@ from pants.vcs.hunk import TextBlock
 )
 def test_source_block_intersection(inputs: tuple[SourceBlock, TextBlock], expected: bool):
     assert inputs[0].is_touched_by(inputs[1]) == expected
+
+
+def test_source_blocks_index() -> None:
+    blocks = [
+        (SourceBlock(start=1, end=3), "a"),
+        (SourceBlock(start=4, end=6), "b"),
+        (SourceBlock(start=4, end=20), "c"),
+        (SourceBlock(start=10, end=12), "d"),
+        (SourceBlock(start=15, end=16), "e"),
+    ]
+    index = SourceBlocksIndex(reversed(blocks))
+    assert index == SourceBlocksIndex(blocks)
+
+    for start, count in product(range(0, 25), range(0, 4)):
+        text_block = TextBlock(start=start, count=count)
+        expected = {owner for block, owner in blocks if block.is_touched_by(text_block)}
+        assert set(index.owners_touched_by(text_block)) == expected, text_block
+
+    assert not SourceBlocksIndex([]).owners_touched_by(TextBlock(start=1, count=1))
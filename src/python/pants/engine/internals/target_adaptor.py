@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Generic, Iterable, TypeVar
 
 from typing_extensions import final
 
@@ -15,6 +15,8 @@ from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.vcs.hunk import TextBlock
 
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class SourceBlock:
@@ -49,19 +51,20 @@ class SourceBlock:
         different. See test cases for details.
         """
 
-        if o.count == 0:
-            start = o.start + 1
-            end = start
-        else:
-            start = o.start
-            end = o.end
-
+        start, end = self._touched_lines(o)
         if self.end < start:
             return False
         if end < self.start:
             return False
         return True
 
+    @staticmethod
+    def _touched_lines(o: TextBlock) -> tuple[int, int]:
+        if o.count == 0:
+            start = o.start + 1
+            return start, start
+        return o.start, o.end
+
     @classmethod
     def from_text_block(cls, text_block: TextBlock) -> SourceBlock:
         """Convert (start, count) range to (start, end) range.
@@ -76,6 +79,74 @@ class SourceBlocks(FrozenOrderedSet[SourceBlock]):
     pass
 
 
+class SourceBlocksIndex(Generic[T]):
+    """An interval tree of the source blocks in a single file, along with their owners.
+
+    Finding the blocks touched by a `TextBlock` takes `O(log n + k)` time, where `k` is the number
+    of touched blocks. The tree is stored implicitly: the blocks are sorted by `start`, the root of
+    each sub-range is its middle element, and `_max_end` holds the largest `end` in the sub-range
+    rooted at each element.
+    """
+
+    def __init__(self, blocks: Iterable[tuple[SourceBlock, T]]) -> None:
+        self._entries = tuple(sorted(blocks, key=lambda entry: (entry[0].start, entry[0].end)))
+        max_end = [0] * len(self._entries)
+        self._build(max_end, 0, len(self._entries))
+        self._max_end = tuple(max_end)
+        self._hash = hash(self._entries)
+
+    def _build(self, max_end: list[int], lo: int, hi: int) -> int:
+        if lo >= hi:
+            return 0
+        mid = (lo + hi) // 2
+        max_end[mid] = max(
+            self._entries[mid][0].end,
+            self._build(max_end, lo, mid),
+            self._build(max_end, mid + 1, hi),
+        )
+        return max_end[mid]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SourceBlocksIndex):
+            return NotImplemented
+        return self._entries == other._entries
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"SourceBlocksIndex({list(self._entries)})"
+
+    def owners_touched_by(self, text_block: TextBlock) -> FrozenOrderedSet[T]:
+        """Returns the owners of all the blocks touched by the given `TextBlock`."""
+
+        start, end = SourceBlock._touched_lines(text_block)
+        touched: list[T] = []
+
+        # See `SourceBlock.is_touched_by`: both ends of the ranges are inclusive.
+        def visit(lo: int, hi: int) -> None:
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            if self._max_end[mid] < start:
+                # No block in this sub-range ends after the text block starts.
+                return
+            visit(lo, mid)
+            block, owner = self._entries[mid]
+            if block.start > end:
+                # Neither this block nor any block after it starts before the text block ends.
+                return
+            if block.end >= start:
+                touched.append(owner)
+            visit(mid + 1, hi)
+
+        visit(0, len(self._entries))
+        return FrozenOrderedSet(touched)
+
+
 @dataclass(frozen=True)
 class TargetAdaptorRequest(EngineAwareParameter):
     """Lookup the TargetAdaptor for an Address."""
@@ -69,7 +69,12 @@ from pants.util.collections import ensure_list, ensure_str_list
 from pants.util.dirutil import fast_relpath
 from pants.util.docutil import bin_name, doc_url
 from pants.util.frozendict import FrozenDict
-from pants.util.memo import memoized_classproperty, memoized_method, memoized_property
+from pants.util.memo import (
+    memoized,
+    memoized_classproperty,
+    memoized_method,
+    memoized_property,
+)
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import bullet_list, help_text, pluralize, softwrap
 
@@ -359,7 +364,7 @@ class Target:
         *,
         ignore_unrecognized_fields: bool,
     ) -> FrozenDict[type[Field], Field]:
-        all_field_types = self.class_field_types(union_membership)
+        all_field_types = self._class_field_types_by_alias(union_membership)
         field_values = {}
         aliases_to_field_types = self._get_field_aliases_to_field_types(all_field_types)
 
@@ -384,16 +389,26 @@ class Target:
             field_type = aliases_to_field_types[alias]
             field_values[field_type] = field_type(value, address)
 
-        # For undefined fields, mark the raw value as missing.
-        for field_type in all_field_types:
-            if field_type in field_values:
-                continue
-            field_values[field_type] = field_type(NO_VALUE, address)
+        # For undefined fields, mark the raw value as missing. The field types are already sorted by
+        # alias, so the result does not need to be sorted again.
         return FrozenDict(
-            sorted(
-                field_values.items(),
-                key=lambda field_type_to_val_pair: field_type_to_val_pair[0].alias,
+            (
+                field_type,
+                field_values[field_type]
+                if field_type in field_values
+                else _default_field(field_type, address),
             )
+            for field_type in all_field_types
+        )
+
+    @final
+    @classmethod
+    @memoized_method
+    def _class_field_types_by_alias(
+        cls, union_membership: UnionMembership | None
+    ) -> tuple[type[Field], ...]:
+        return tuple(
+            sorted(cls.class_field_types(union_membership), key=lambda field_type: field_type.alias)
         )
 
     @final
@@ -660,6 +675,56 @@ class Target:
         """
 
 
+# Fields with no value set are shared between all targets, as long as their value does not depend
+# on the target address. The engine keeps lots of targets in memory (e.g. one per file for target
+# generators), and most of their fields are usually left to their default.
+_shared_default_fields: dict[type[Field], Field] = {}
+
+
+@memoized
+def _address_independent_compute_value_types() -> frozenset[type[Field]]:
+    """The field templates whose `compute_value` only uses the address for error messages."""
+    return frozenset(
+        (
+            Field,
+            ScalarField,
+            BoolField,
+            TriBoolField,
+            IntField,
+            FloatField,
+            StringField,
+            SequenceField,
+            StringSequenceField,
+            TupleSequenceField,
+            DictStringToStringField,
+            ListOfDictStringToStringField,
+            NestedDictStringToStringField,
+            DictStringToStringSequenceField,
+        )
+    )
+
+
+@memoized
+def _has_address_independent_default(field_type: type[Field]) -> bool:
+    if issubclass(field_type, AsyncFieldMixin):
+        # Async fields store their address.
+        return False
+    compute_value_owner = next(
+        (cls for cls in field_type.__mro__ if "compute_value" in cls.__dict__), Field
+    )
+    return compute_value_owner in _address_independent_compute_value_types()
+
+
+def _default_field(field_type: type[_F], address: Address) -> _F:
+    shared = _shared_default_fields.get(field_type)
+    if shared is not None:
+        return cast(_F, shared)
+    field = field_type(NO_VALUE, address)
+    if _has_address_independent_default(field_type):
+        _shared_default_fields[field_type] = field
+    return field
+
+
 def _validate_origin_sources_blocks(origin_sources_blocks: FrozenDict[str, SourceBlocks]) -> None:
     if not isinstance(origin_sources_blocks, FrozenDict):
         raise ValueError(
@@ -1027,6 +1092,34 @@ class AllTargets(Collection[Target]):
     unlike `AllUnexpandedTargets`."""
 
 
+@dataclass(frozen=True)
+class AllTargetsShard:
+    """The targets of `AllTargets` with the same directory and target type."""
+
+    directory: str
+    target_type: type[Target]
+    targets: tuple[Target, ...]
+
+
+@dataclass(frozen=True)
+class AllTargetsShards:
+    """`AllTargets`, sharded by directory and target type.
+
+    Rules which compute something for each target can fold over the shards, computing a result per
+    shard with a `Get` and merging those results. The engine memoizes the result for each shard,
+    so when a BUILD file changes, only the shards of its directory are recomputed.
+    """
+
+    shards: tuple[AllTargetsShard, ...]
+
+    def with_field(self, field: type[Field]) -> tuple[AllTargetsShard, ...]:
+        """The shards whose targets have the field.
+
+        All targets of a type have the same fields, so only one target of each shard is checked.
+        """
+        return tuple(shard for shard in self.shards if shard.targets[0].has_field(field))
+
+
 class AllUnexpandedTargets(Collection[Target]):
     """All targets in the project, including generated targets.
 
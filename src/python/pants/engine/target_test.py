@@ -217,6 +217,21 @@ def test_field_hydration_is_eager() -> None:
     assert "//:bad_extension" in str(exc)
 
 
+def test_default_fields_are_shared() -> None:
+    tgt1 = FortranTarget({}, Address("", target_name="tgt1"))
+    tgt2 = FortranTarget({FortranVersion.alias: "1.0"}, Address("", target_name="tgt2"))
+    tgt3 = FortranTarget({}, Address("", target_name="tgt3"))
+
+    # `FortranVersion` only uses a field template, so its default does not depend on the address.
+    assert tgt1[FortranVersion] is tgt3[FortranVersion]
+    assert tgt2[FortranVersion].value == "1.0"
+    # `FortranExtensions` overrides `compute_value`, so it might use the address.
+    assert tgt1[FortranExtensions] is not tgt3[FortranExtensions]
+    assert tgt1[FortranExtensions] == tgt3[FortranExtensions]
+
+    assert list(tgt1.field_types) == sorted(tgt1.field_types, key=lambda ft: ft.alias)
+
+
 def test_has_fields() -> None:
     empty_union_membership = UnionMembership({})
     tgt = FortranTarget({}, Address("", target_name="lib"))
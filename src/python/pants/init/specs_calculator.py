@@ -11,7 +11,7 @@ from pants.core.util_rules.environments import determine_bootstrap_environment
 from pants.core.util_rules.system_binaries import GitBinary
 from pants.engine.addresses import AddressInput
 from pants.engine.environment import EnvironmentName
-from pants.engine.internals.graph import FilesWithSourceBlocks
+from pants.engine.internals.graph import FilesWithSourceBlocks, FilesWithSourceBlocksRequest
 from pants.engine.internals.scheduler import SchedulerSession
 from pants.engine.internals.selectors import Params
 from pants.engine.rules import QueryRule
@@ -71,12 +71,16 @@ def calculate_specs(
             "The `--changed-*` options are only available if Git is used for the repository."
         )
 
+    all_changed_files = tuple(
+        sorted(changed_options.changed_files(maybe_git_worktree.git_worktree))
+    )
     (files_with_sources_blocks,) = session.product_request(
-        FilesWithSourceBlocks, [Params(bootstrap_environment)]
+        FilesWithSourceBlocks,
+        [Params(FilesWithSourceBlocksRequest(all_changed_files), bootstrap_environment)],
     )
     changed_files = tuple(
         file
-        for file in changed_options.changed_files(maybe_git_worktree.git_worktree)
+        for file in all_changed_files
         # We want to exclude the file from the normal processing flow if it has associated
         # targets with text blocks. These files are handled with special logic.
         if file not in files_with_sources_blocks
@@ -144,5 +148,5 @@ def rules():
         QueryRule(ChangedAddresses, [ChangedRequest, EnvironmentName]),
         QueryRule(GitBinary, [EnvironmentName]),
         QueryRule(MaybeGitWorktree, [GitWorktreeRequest, GitBinary, EnvironmentName]),
-        QueryRule(FilesWithSourceBlocks, [EnvironmentName]),
+        QueryRule(FilesWithSourceBlocks, [FilesWithSourceBlocksRequest, EnvironmentName]),
     ]
@@ -0,0 +1,329 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Lightweight extraction of package, import and top-level type declarations from JVM sources.
+
+Unlike the full parsers for each language, this runs in-process and without a JVM, so it is cheap
+enough to run over every source in the repository. It only understands the lexical structure of
+the sources: it returns `None` whenever it finds something it can not reliably skip over (e.g.
+string templates or unicode escapes), in which case callers must fall back to the full parser.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterator
+
+
+class JvmLanguage(Enum):
+    JAVA = "java"
+    KOTLIN = "kotlin"
+
+    @property
+    def nested_comments(self) -> bool:
+        return self == JvmLanguage.KOTLIN
+
+
+class _UnsupportedSource(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class JvmSourceImport:
+    name: str
+    is_static: bool = False
+    is_wildcard: bool = False
+    alias: str | None = None
+
+
+@dataclass(frozen=True)
+class JvmSourceHeader:
+    package: str | None
+    imports: tuple[JvmSourceImport, ...]
+    top_level_types: tuple[str, ...]
+
+
+_STRING_TOKEN = '"'
+_CHAR_TOKEN = "'"
+_NUMBER_TOKEN = "0"
+
+_JAVA_TYPE_KEYWORDS = frozenset(["class", "interface", "enum", "record"])
+
+
+def _is_identifier_start(c: str) -> bool:
+    return c.isalpha() or c in "_$"
+
+
+def _is_identifier_part(c: str) -> bool:
+    return c.isalnum() or c in "_$"
+
+
+def _tokenize(content: str, language: JvmLanguage) -> Iterator[str]:
+    """Yields identifiers and punctuation, replacing literals by a placeholder token."""
+
+    if language == JvmLanguage.JAVA and "\\u" in content:
+        # Unicode escapes may appear anywhere in Java sources, including outside of literals.
+        raise _UnsupportedSource()
+
+    pos = 0
+    length = len(content)
+    if language == JvmLanguage.KOTLIN and content.startswith("#!"):
+        # Kotlin scripts may start with a shebang line.
+        end = content.find("\n")
+        pos = length if end == -1 else end + 1
+    while pos < length:
+        c = content[pos]
+        if c.isspace():
+            pos += 1
+        elif content.startswith("//", pos):
+            end = content.find("\n", pos)
+            pos = length if end == -1 else end + 1
+        elif content.startswith("/*", pos):
+            pos = _skip_block_comment(content, pos, nested=language.nested_comments)
+        elif content.startswith('"""', pos):
+            pos = _skip_text_block(content, pos, language)
+            yield _STRING_TOKEN
+        elif c == '"':
+            pos = _skip_string(content, pos, language)
+            yield _STRING_TOKEN
+        elif c == "'":
+            pos = _skip_char(content, pos)
+            yield _CHAR_TOKEN
+        elif c == "`" and language == JvmLanguage.KOTLIN:
+            end = content.find("`", pos + 1)
+            if end == -1:
+                raise _UnsupportedSource()
+            yield content[pos + 1 : end]
+            pos = end + 1
+        elif _is_identifier_start(c):
+            end = pos + 1
+            while end < length and _is_identifier_part(content[end]):
+                end += 1
+            yield content[pos:end]
+            pos = end
+        elif c.isdigit():
+            end = pos + 1
+            while end < length and (_is_identifier_part(content[end]) or content[end] == "."):
+                end += 1
+            yield _NUMBER_TOKEN
+            pos = end
+        else:
+            yield c
+            pos += 1
+
+
+def _skip_block_comment(content: str, pos: int, *, nested: bool) -> int:
+    depth = 0
+    while pos < len(content):
+        if content.startswith("/*", pos):
+            depth = depth + 1 if nested or depth == 0 else depth
+            pos += 2
+        elif content.startswith("*/", pos):
+            depth -= 1
+            pos += 2
+            if depth == 0:
+                return pos
+        else:
+            pos += 1
+    raise _UnsupportedSource()
+
+
+def _skip_text_block(content: str, pos: int, language: JvmLanguage) -> int:
+    pos += 3
+    while True:
+        end = content.find('"""', pos)
+        if end == -1:
+            raise _UnsupportedSource()
+        if language == JvmLanguage.KOTLIN and "${" in content[pos:end]:
+            raise _UnsupportedSource()
+        if language == JvmLanguage.JAVA and content[end - 1] == "\\":
+            pos = end + 1
+            continue
+        end += 3
+        # Raw strings may end with extra quotes, which are part of the string content.
+        while end < len(content) and content[end] == '"':
+            end += 1
+        return end
+
+
+def _skip_string(content: str, pos: int, language: JvmLanguage) -> int:
+    pos += 1
+    while pos < len(content):
+        c = content[pos]
+        if c == "\\":
+            pos += 2
+        elif c == '"':
+            return pos + 1
+        elif c == "\n":
+            break
+        elif c == "$" and language == JvmLanguage.KOTLIN and content.startswith("${", pos):
+            # Template expressions may contain nested strings and braces.
+            break
+        else:
+            pos += 1
+    raise _UnsupportedSource()
+
+
+def _skip_char(content: str, pos: int) -> int:
+    end = pos + 1
+    if content.startswith("\\", end):
+        end += 1
+    end = content.find("'", end + 1)
+    if end == -1 or end - pos > 8:
+        raise _UnsupportedSource()
+    return end + 1
+
+
+class _TokenStream:
+    """Tokens are produced lazily, so that parsing can stop before the end of the source."""
+
+    def __init__(self, tokens: Iterator[str]) -> None:
+        self._iterator = tokens
+        self._tokens: list[str] = []
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> str | None:
+        idx = self.pos + offset
+        while idx >= len(self._tokens):
+            token = next(self._iterator, None)
+            if token is None:
+                return None
+            self._tokens.append(token)
+        return self._tokens[idx]
+
+    def next(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise _UnsupportedSource()
+        self.pos += 1
+        return token
+
+    def at_end(self) -> bool:
+        return self.peek() is None
+
+    def qualified_name(self) -> tuple[str, bool]:
+        """Consumes a dotted name, returning it and whether it ended in a wildcard."""
+
+        parts = [self.next()]
+        if not _is_identifier_start(parts[0][0]):
+            raise _UnsupportedSource()
+        while self.peek() == ".":
+            self.pos += 1
+            part = self.next()
+            if part == "*":
+                return ".".join(parts), True
+            if not _is_identifier_start(part[0]):
+                raise _UnsupportedSource()
+            parts.append(part)
+        return ".".join(parts), False
+
+
+def _parse_java(tokens: _TokenStream) -> JvmSourceHeader:
+    package: str | None = None
+    imports: list[JvmSourceImport] = []
+    top_level_types: list[str] = []
+
+    depth = 0
+    previous: str | None = None
+    while not tokens.at_end():
+        token = tokens.next()
+        if token in ("{", "(", "["):
+            depth += 1
+        elif token in ("}", ")", "]"):
+            depth -= 1
+            if depth < 0:
+                raise _UnsupportedSource()
+        elif depth > 0 or previous == ".":
+            pass
+        elif token == "package" and package is None and not imports and not top_level_types:
+            package, _ = tokens.qualified_name()
+        elif token == "import":
+            is_static = tokens.peek() == "static"
+            if is_static:
+                tokens.next()
+            name, is_wildcard = tokens.qualified_name()
+            imports.append(JvmSourceImport(name, is_static=is_static, is_wildcard=is_wildcard))
+        elif token in _JAVA_TYPE_KEYWORDS:
+            name = tokens.peek()
+            if token == "record" and tokens.peek(1) not in ("(", "<"):
+                # `record` is only a keyword when followed by a type name and its components.
+                pass
+            elif name and _is_identifier_start(name[0]):
+                top_level_types.append(f"{package}.{name}" if package else name)
+        previous = token
+
+    if depth != 0:
+        raise _UnsupportedSource()
+    return JvmSourceHeader(
+        package=package, imports=tuple(imports), top_level_types=tuple(top_level_types)
+    )
+
+
+def _parse_kotlin(tokens: _TokenStream) -> JvmSourceHeader:
+    package: str | None = None
+    imports: list[JvmSourceImport] = []
+
+    # Kotlin only allows the package and import directives in the file header, so we can stop as
+    # soon as we find anything else that is not a file annotation.
+    while not tokens.at_end():
+        token = tokens.peek()
+        if token == "package" and package is None and not imports:
+            tokens.next()
+            package, _ = tokens.qualified_name()
+        elif token == "import":
+            tokens.next()
+            name, is_wildcard = tokens.qualified_name()
+            alias = None
+            if not is_wildcard and tokens.peek() == "as":
+                tokens.next()
+                alias = tokens.next()
+            imports.append(JvmSourceImport(name, is_wildcard=is_wildcard, alias=alias))
+        elif token == ";":
+            tokens.next()
+        elif token == "@" and tokens.peek(1) == "file" and tokens.peek(2) == ":":
+            _skip_file_annotation(tokens)
+        elif token == "@" or _is_identifier_start(token[0]):
+            # The first declaration (or statement, in scripts), which ends the header.
+            break
+        else:
+            # Anything else is not allowed here by the grammar, so we may have misread the header.
+            raise _UnsupportedSource()
+
+    return JvmSourceHeader(package=package, imports=tuple(imports), top_level_types=())
+
+
+def _skip_file_annotation(tokens: _TokenStream) -> None:
+    tokens.pos += 3
+    if tokens.peek() == "[":
+        closing = "]"
+    else:
+        tokens.qualified_name()
+        if tokens.peek() != "(":
+            return
+        closing = ")"
+
+    opening = tokens.next()
+    depth = 1
+    while depth:
+        token = tokens.next()
+        if token == opening:
+            depth += 1
+        elif token == closing:
+            depth -= 1
+
+
+def parse_source_header(content: str, language: JvmLanguage) -> JvmSourceHeader | None:
+    """Extracts the package, imports and top-level types declared in the given source.
+
+    Top-level types are only extracted for Java sources. Returns `None` if the source uses constructs
+    that this parser does not handle.
+    """
+
+    try:
+        tokens = _TokenStream(_tokenize(content, language))
+        if language == JvmLanguage.JAVA:
+            return _parse_java(tokens)
+        return _parse_kotlin(tokens)
+    except _UnsupportedSource:
+        return None
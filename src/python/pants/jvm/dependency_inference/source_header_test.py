@@ -0,0 +1,128 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from textwrap import dedent
+
+import pytest
+
+from pants.jvm.dependency_inference.source_header import (
+    JvmLanguage,
+    JvmSourceHeader,
+    JvmSourceImport,
+    parse_source_header,
+)
+
+
+def test_java_source_header() -> None:
+    source = dedent(
+        """\
+        /* Copyright header with `package fake;` inside. */
+        package org.pantsbuild.example;
+
+        import java.util.List;
+        import static org.junit.Assert.*;
+        import org.pantsbuild.other.*;
+
+        @Deprecated(since = "class Fake {}")
+        public final class Example<T extends List<String>> {
+            class Inner {}
+            private final Class<?> cls = String.class;
+            private final String text = \"\"\"
+                interface Fake {}
+                \"\"\";
+        }
+
+        interface ExampleInterface {
+            enum Nested { A, B }
+        }
+
+        @interface ExampleAnnotation {}
+
+        enum ExampleEnum { C; char c = '}'; }
+
+        record ExampleRecord(int record) {}
+        """
+    )
+
+    assert parse_source_header(source, JvmLanguage.JAVA) == JvmSourceHeader(
+        package="org.pantsbuild.example",
+        imports=(
+            JvmSourceImport("java.util.List"),
+            JvmSourceImport("org.junit.Assert", is_static=True, is_wildcard=True),
+            JvmSourceImport("org.pantsbuild.other", is_wildcard=True),
+        ),
+        top_level_types=(
+            "org.pantsbuild.example.Example",
+            "org.pantsbuild.example.ExampleInterface",
+            "org.pantsbuild.example.ExampleAnnotation",
+            "org.pantsbuild.example.ExampleEnum",
+            "org.pantsbuild.example.ExampleRecord",
+        ),
+    )
+
+
+def test_java_source_header_default_package() -> None:
+    header = parse_source_header("class Foo {}", JvmLanguage.JAVA)
+    assert header == JvmSourceHeader(package=None, imports=(), top_level_types=("Foo",))
+
+
+def test_kotlin_source_header() -> None:
+    source = dedent(
+        """\
+        @file:JvmName("Example")
+        @file:[Suppress("UNUSED")]
+        /* Nested /* comments */ package fake */
+        package org.pantsbuild.`example`
+
+        import org.pantsbuild.a.A
+        import org.pantsbuild.b.B as C
+        import org.pantsbuild.c.*
+
+        class Example {
+            val s = "${A()}"
+        }
+        """
+    )
+
+    assert parse_source_header(source, JvmLanguage.KOTLIN) == JvmSourceHeader(
+        package="org.pantsbuild.example",
+        imports=(
+            JvmSourceImport("org.pantsbuild.a.A"),
+            JvmSourceImport("org.pantsbuild.b.B", alias="C"),
+            JvmSourceImport("org.pantsbuild.c", is_wildcard=True),
+        ),
+        top_level_types=(),
+    )
+
+
+def test_kotlin_source_header_shebang() -> None:
+    source = dedent(
+        """\
+        #!/usr/bin/env kotlin
+        import org.pantsbuild.a.A
+
+        println(A())
+        """
+    )
+
+    assert parse_source_header(source, JvmLanguage.KOTLIN) == JvmSourceHeader(
+        package=None, imports=(JvmSourceImport("org.pantsbuild.a.A"),), top_level_types=()
+    )
+
+
+@pytest.mark.parametrize(
+    "language, source",
+    [
+        (JvmLanguage.JAVA, 'class Foo { String s = "unterminated; }'),
+        (JvmLanguage.JAVA, "class Foo { String s = \"\\u0022\"; }"),
+        (JvmLanguage.JAVA, "class Foo { /* unterminated }"),
+        (JvmLanguage.JAVA, "class Foo {"),
+        (JvmLanguage.KOTLIN, '@file:JvmName("${"nested"}")\nimport a.b.C'),
+        (JvmLanguage.KOTLIN, "import a.b.C\n#!/usr/bin/env kotlin\nimport d.e.F"),
+        (JvmLanguage.KOTLIN, "# import a.b.C\nimport d.e.F"),
+    ],
+)
+def test_unsupported_sources(language: JvmLanguage, source: str) -> None:
+    assert parse_source_header(source, language) is None
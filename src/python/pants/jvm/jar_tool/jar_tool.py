@@ -75,6 +75,7 @@ class JarToolRequest:
     skip: tuple[str, ...]
     compress: bool
     update: bool
+    normalize_timestamps: bool
 
     def __init__(
         self,
@@ -92,6 +93,7 @@ class JarToolRequest:
         skip: Iterable[str] | None = None,
         compress: bool = False,
         update: bool = False,
+        normalize_timestamps: bool = False,
     ) -> None:
         _file_mappings = {**(file_mappings or {}), **({f: f for f in (files or [])})}
 
@@ -107,6 +109,7 @@ class JarToolRequest:
         object.__setattr__(self, "skip", tuple(skip or ()))
         object.__setattr__(self, "compress", compress)
         object.__setattr__(self, "update", update)
+        object.__setattr__(self, "normalize_timestamps", normalize_timestamps)
 
     @staticmethod
     def __parse_policies(
@@ -191,6 +194,7 @@ async def run_jar_tool(
             *((f"-skip={','.join(request.skip)}",) if request.skip else ()),
             *(("-compress",) if request.compress else ()),
             *(("-update",) if request.update else ()),
+            *(("-normalize_timestamps",) if request.normalize_timestamps else ()),
         ],
         classpath_entries=[*tool_classpath.classpath_entries(toolcp_prefix), jartoolcp_prefix],
         input_digest=empty_output_digest,
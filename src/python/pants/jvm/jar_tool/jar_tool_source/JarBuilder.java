@@ -14,9 +14,9 @@ import com.google.common.base.Predicate;
 import com.google.common.base.Predicates;
 import com.google.common.base.Splitter;
 import com.google.common.collect.FluentIterable;
-import com.google.common.collect.HashMultimap;
 import com.google.common.collect.ImmutableList;
 import com.google.common.collect.Iterables;
+import com.google.common.collect.LinkedHashMultimap;
 import com.google.common.collect.LinkedListMultimap;
 import com.google.common.collect.Lists;
 import com.google.common.collect.Multimap;
@@ -33,9 +33,11 @@ import java.io.File;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStream;
+import java.util.Calendar;
 import java.util.Collection;
 import java.util.Collections;
 import java.util.Enumeration;
+import java.util.GregorianCalendar;
 import java.util.Iterator;
 import java.util.LinkedList;
 import java.util.List;
@@ -635,12 +637,20 @@ public class JarBuilder implements Closeable {
     void execute(Multimap<String, ReadableEntry> entries) throws JarBuilderException;
   }
 
+  /**
+   * The timestamp given to all entries when normalizing timestamps: 2000-01-01 00:00:00 in the
+   * local time zone, which is stored as the same DOS date and time whatever the time zone is.
+   */
+  static final long NORMALIZED_ENTRY_TIME =
+      new GregorianCalendar(2000, Calendar.JANUARY, 1).getTimeInMillis();
+
   private final File target;
   private final Listener listener;
   private final Closer closer = Closer.create();
   private final List<EntryIndexer> additions = Lists.newLinkedList();
 
   @Nullable private ByteSource manifest;
+  private boolean normalizeTimestamps = false;
 
   /**
    * Creates a JarBuilder that will write scheduled jar additions to {@code target} upon {@link
@@ -909,6 +919,17 @@ public class JarBuilder implements Closeable {
     return this;
   }
 
+  /**
+   * Gives all entries in the jar written out by {@link #write} the same fixed timestamp, rather
+   * than their original (or the current) time, so that the jar is reproducible.
+   *
+   * @return This builder for chaining.
+   */
+  public JarBuilder normalizeTimestamps() {
+    normalizeTimestamps = true;
+    return this;
+  }
+
   /**
    * Creates a jar at the configured target path applying the scheduled additions and skipping any
    * duplicate entries found. Entries will not be compressed.
@@ -1026,8 +1047,9 @@ public class JarBuilder implements Closeable {
    */
   private void copyJarFiles(JarWriter writer, Iterable<ReadableJarEntry> entries)
       throws IOException {
-    // Walk the entries to bucketize by input jar file names
-    Multimap<JarSource, ReadableJarEntry> jarEntries = HashMultimap.create();
+    // Walk the entries to bucketize by input jar file names, preserving their order so that the
+    // output is deterministic.
+    Multimap<JarSource, ReadableJarEntry> jarEntries = LinkedHashMultimap.create();
     for (ReadableJarEntry entry : entries) {
       Preconditions.checkState(entry.getSource() instanceof JarSource);
       jarEntries.put((JarSource) entry.getSource(), entry);
@@ -1192,14 +1214,16 @@ public class JarBuilder implements Closeable {
   private static final class JarWriter {
     static class EntryFactory {
       private final boolean compress;
+      private final boolean normalizeTimestamps;
 
-      EntryFactory(boolean compress) {
+      EntryFactory(boolean compress, boolean normalizeTimestamps) {
         this.compress = compress;
+        this.normalizeTimestamps = normalizeTimestamps;
       }
 
       JarEntry createEntry(String path, ByteSource contents) throws IOException {
 
-        JarEntry entry = new JarEntry(path);
+        JarEntry entry = newEntry(path);
         entry.setMethod(compress ? JarEntry.DEFLATED : JarEntry.STORED);
         if (!compress) {
           prepareEntry(entry, contents);
@@ -1207,6 +1231,14 @@ public class JarBuilder implements Closeable {
         return entry;
       }
 
+      JarEntry newEntry(String path) {
+        JarEntry entry = new JarEntry(path);
+        if (normalizeTimestamps) {
+          entry.setTime(NORMALIZED_ENTRY_TIME);
+        }
+        return entry;
+      }
+
       private void prepareEntry(JarEntry entry, ByteSource contents) throws IOException {
 
         final CRC32 crc32 = new CRC32();
@@ -1237,11 +1269,13 @@ public class JarBuilder implements Closeable {
 
     private final Set<List<String>> directories = Sets.newHashSet();
     private final JarOutputStream out;
+    private final boolean normalizeTimestamps;
     private final EntryFactory entryFactory;
 
-    private JarWriter(JarOutputStream out, boolean compress) {
+    private JarWriter(JarOutputStream out, boolean compress, boolean normalizeTimestamps) {
       this.out = out;
-      this.entryFactory = new EntryFactory(compress);
+      this.normalizeTimestamps = normalizeTimestamps;
+      this.entryFactory = new EntryFactory(compress, normalizeTimestamps);
     }
 
     public void write(String path, ByteSource contents) throws IOException {
@@ -1252,7 +1286,7 @@ public class JarBuilder implements Closeable {
 
     public void copy(String path, JarFile jarIn, JarEntry srcJarEntry) throws IOException {
       ensureParentDir(path);
-      JarEntryCopier.copyEntry(out, path, jarIn, srcJarEntry);
+      JarEntryCopier.copyEntry(out, path, jarIn, srcJarEntry, normalizeTimestamps);
     }
 
     private void ensureParentDir(String path) throws IOException {
@@ -1265,7 +1299,7 @@ public class JarBuilder implements Closeable {
           ancestry.add(component);
           if (!directories.contains(ancestry)) {
             directories.add(ImmutableList.copyOf(ancestry));
-            out.putNextEntry(new JarEntry(joinJarPath(ancestry) + "/"));
+            out.putNextEntry(entryFactory.newEntry(joinJarPath(ancestry) + "/"));
           }
         }
       }
@@ -1291,7 +1325,7 @@ public class JarBuilder implements Closeable {
             jar.closeEntry();
           }
         });
-    return new JarWriter(jar, compress);
+    return new JarWriter(jar, compress, normalizeTimestamps);
   }
 
   private static ByteSource entrySupplier(final InputSupplier<JarFile> jar, final JarEntry entry) {
@@ -108,13 +108,21 @@ final class JarEntryCopier {
    * @param jarIn The input JarFile.
    * @param jarEntry The entry extracted from <code>jarIn</code>. The compression method passed in
    *     to this entry is preserved in the output file.
+   * @param normalizeTimestamps Pass {@code true} to give the output entry the fixed {@link
+   *     JarBuilder#NORMALIZED_ENTRY_TIME}, and to drop its extra fields and comment, rather than
+   *     preserving those of <code>jarEntry</code>.
    * @throws IOException if there is a problem reading from {@code jarIn} or writing to {@code
    *     jarOut}.
    */
-  static void copyEntry(JarOutputStream jarOut, String name, JarFile jarIn, JarEntry jarEntry)
+  static void copyEntry(
+      JarOutputStream jarOut,
+      String name,
+      JarFile jarIn,
+      JarEntry jarEntry,
+      boolean normalizeTimestamps)
       throws IOException {
 
-    JarEntry outEntry = new JarEntry(jarEntry);
+    JarEntry outEntry = normalizeTimestamps ? normalizedCopy(jarEntry) : new JarEntry(jarEntry);
     ZE_NAME.set(outEntry, name);
 
     if (outEntry.isDirectory()) {
@@ -167,6 +175,24 @@ final class JarEntryCopier {
     }
   }
 
+  private static JarEntry normalizedCopy(JarEntry jarEntry) {
+    // Only the fields needed to copy the entry are carried over: the extra fields may hold further
+    // timestamps.
+    JarEntry outEntry = new JarEntry(jarEntry.getName());
+    outEntry.setMethod(jarEntry.getMethod());
+    if (jarEntry.getSize() >= 0) {
+      outEntry.setSize(jarEntry.getSize());
+    }
+    if (jarEntry.getCompressedSize() >= 0) {
+      outEntry.setCompressedSize(jarEntry.getCompressedSize());
+    }
+    if (jarEntry.getCrc() >= 0) {
+      outEntry.setCrc(jarEntry.getCrc());
+    }
+    outEntry.setTime(JarBuilder.NORMALIZED_ENTRY_TIME);
+    return outEntry;
+  }
+
   private JarEntryCopier() {
     // utility
   }
@@ -215,6 +215,11 @@ public final class Main {
     @Option(name = "-compress", usage = "Compress jar entries.")
     private boolean compress;
 
+    @Option(
+        name = "-normalize_timestamps",
+        usage = "Give all jar entries the same fixed timestamp, so that the jar is reproducible.")
+    private boolean normalizeTimestamps;
+
     public static class FilesOptionHandler extends ArgfileOptionHandler<FileSource> {
       public FilesOptionHandler(
           CmdLineParser parser, OptionDef option, Setter<? super FileSource> setter) {
@@ -424,6 +429,10 @@ public final class Main {
       throw new ExitException(1, "Failed to configure custom manifest: %s", e);
     }
 
+    if (options.normalizeTimestamps) {
+      jarBuilder.normalizeTimestamps();
+    }
+
     for (Options.FileSource fileSource : options.files) {
       fileSource.addTo(jarBuilder);
     }
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import io
+import zipfile
+
 import pytest
 
 from pants.backend.java.dependency_inference.rules import rules as java_dep_inf_rules
@@ -102,3 +105,34 @@ def test_pack_files_into_jar(rule_runner: RuleRunner) -> None:
     jar_snapshot = rule_runner.request(Snapshot, [jar_extracted.digest])
     assert len(jar_snapshot.files) == 2
     assert file_jar_location in jar_snapshot.files
+
+
+@maybe_skip_jdk_test
+def test_normalize_timestamps(rule_runner: RuleRunner) -> None:
+    file_digest = rule_runner.request(
+        Digest, [CreateDigest([FileContent("file.txt", content=b"Sample content")])]
+    )
+    jar_digest = rule_runner.request(
+        Digest,
+        [
+            JarToolRequest(
+                jar_name="test.jar",
+                digest=file_digest,
+                main_class="com.example.Main",
+                file_mappings={"file.txt": "newpath/file.txt"},
+                compress=True,
+                normalize_timestamps=True,
+            )
+        ],
+    )
+
+    jar_contents = rule_runner.request(DigestContents, [jar_digest])
+    with zipfile.ZipFile(io.BytesIO(jar_contents[0].content)) as jar:
+        infos = jar.infolist()
+    assert {info.filename for info in infos} == {
+        "META-INF/",
+        "META-INF/MANIFEST.MF",
+        "newpath/",
+        "newpath/file.txt",
+    }
+    assert {info.date_time for info in infos} == {(2000, 1, 1, 0, 0, 0)}
@@ -31,7 +31,6 @@ from pants.jvm.jar_tool.jar_tool import JarToolRequest
 from pants.jvm.jar_tool.jar_tool import rules as jar_tool_rules
 from pants.jvm.shading.rules import ShadedJar, ShadeJarRequest
 from pants.jvm.shading.rules import rules as shaded_jar_rules
-from pants.jvm.strip_jar.strip_jar import StripJarRequest
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import (
     DeployJarDuplicatePolicyField,
@@ -107,9 +106,9 @@ async def package_deploy_jar(
     """
     Constructs a deploy ("fat") JAR file by
     1. Resolving/compiling a Classpath for the `root_address` target,
-    2. Creating a deploy jar with a valid ZIP index and deduplicated entries
-    3. (optionally) Stripping the jar of all metadata that may cause it to be non-reproducible (https://reproducible-builds.org)
-    4. (optionally) Apply shading rules to the bytecode inside the jar file
+    2. Creating a deploy jar with a valid ZIP index and deduplicated entries, (optionally) with
+       the timestamps normalized so that the jar is reproducible (https://reproducible-builds.org)
+    3. (optionally) Apply shading rules to the bytecode inside the jar file
     """
 
     if field_set.main_class.value is None:
@@ -140,25 +139,16 @@ async def package_deploy_jar(
             ],
             skip=[*(jvm.deploy_jar_exclude_files or []), *(field_set.exclude_files.value or [])],
             compress=True,
+            # Rather than stripping the jar in a separate pass afterwards, the JAR tool writes all
+            # entries with a fixed timestamp.
+            normalize_timestamps=jvm.reproducible_jars,
         ),
     )
 
-    #
-    # 3. Strip the JAR from  all non-reproducible metadata if requested so
-    #
-    if jvm.reproducible_jars:
-        jar_digest = await Get(
-            Digest,
-            StripJarRequest(
-                digest=jar_digest,
-                filenames=(output_filename.name,),
-            ),
-        )
-
     jar_digest = await Get(Digest, AddPrefix(jar_digest, str(output_filename.parent)))
 
     #
-    # 4. Apply shading rules
+    # 3. Apply shading rules
     #
     if field_set.shading_rules.value:
         shaded_jar = await Get(
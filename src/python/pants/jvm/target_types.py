@@ -14,7 +14,11 @@ from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.core.goals.generate_lockfiles import UnrecognizedResolveNamesError
 from pants.core.goals.package import OutputPathField
 from pants.core.goals.run import RestartableField, RunFieldSet, RunInSandboxBehavior, RunRequest
-from pants.core.goals.test import TestExtraEnvVarsField, TestTimeoutField
+from pants.core.goals.test import (
+    TestExtraEnvVarsField,
+    TestsBatchCompatibilityTagField,
+    TestTimeoutField,
+)
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Address
 from pants.engine.fs import Digest, DigestContents
@@ -583,6 +587,10 @@ class JunitTestExtraEnvVarsField(TestExtraEnvVarsField):
     pass
 
 
+class JunitTestBatchCompatibilityTagField(TestsBatchCompatibilityTagField):
+    help = help_text(TestsBatchCompatibilityTagField.format_help("junit_test", "JUnit"))
+
+
 # -----------------------------------------------------------------------------------------------
 # JAR support fields
 # -----------------------------------------------------------------------------------------------
@@ -4,8 +4,8 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
 
 from pants.backend.java.subsystems.junit import JUnit
 from pants.core.goals.resolves import ExportableTool
@@ -19,10 +19,13 @@ from pants.core.goals.test import (
     TestSubsystem,
 )
 from pants.core.target_types import FileSourceField
+from pants.core.util_rules import split_digest
+from pants.core.util_rules.partitions import Partition, PartitionerType, Partitions
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.core.util_rules.split_digest import DigestPart, SplitDigest, SplitDigestRequest
 from pants.engine.addresses import Addresses
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, RemovePrefix, Snapshot
+from pants.engine.fs import Digest, MergeDigests
 from pants.engine.process import (
     InteractiveProcess,
     Process,
@@ -40,10 +43,12 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import (
+    JunitTestBatchCompatibilityTagField,
     JunitTestSourceField,
     JunitTestTimeoutField,
     JvmDependenciesField,
     JvmJdkField,
+    JvmResolveField,
 )
 from pants.util.logging import LogLevel
 
@@ -60,19 +65,69 @@ class JunitTestFieldSet(TestFieldSet):
     sources: JunitTestSourceField
     timeout: JunitTestTimeoutField
     jdk_version: JvmJdkField
+    resolve: JvmResolveField
     dependencies: JvmDependenciesField
     extra_env_vars: TestExtraEnvVarsField
+    batch_compatibility_tag: JunitTestBatchCompatibilityTagField
 
 
 class JunitTestRequest(TestRequest):
     tool_subsystem = JUnit
     field_set_type = JunitTestFieldSet
+    partitioner_type = PartitionerType.CUSTOM
     supports_debug = True
 
 
+@dataclass(frozen=True)
+class TestMetadata:
+    """Parameters that must be constant for all test targets in a JUnit batch."""
+
+    jdk_version: str | None
+    resolve: str
+    extra_env_vars: tuple[str, ...]
+    compatibility_tag: str | None = None
+
+    # Prevent this class from being detected by pytest as a test class.
+    __test__ = False
+
+    @property
+    def description(self) -> str | None:
+        return self.compatibility_tag
+
+
+@rule(desc="Partition JUnit tests", level=LogLevel.DEBUG)
+async def partition_junit_tests(
+    request: JunitTestRequest.PartitionRequest[JunitTestFieldSet],
+    jvm: JvmSubsystem,
+) -> Partitions[JunitTestFieldSet, TestMetadata]:
+    partitions = []
+    compatible_tests = defaultdict(list)
+
+    for field_set in request.field_sets:
+        metadata = TestMetadata(
+            jdk_version=field_set.jdk_version.value,
+            resolve=field_set.resolve.normalized_value(jvm),
+            extra_env_vars=field_set.extra_env_vars.sorted(),
+            compatibility_tag=field_set.batch_compatibility_tag.value,
+        )
+
+        if not metadata.compatibility_tag:
+            # Tests without a compatibility tag are assumed to be incompatible with all others.
+            partitions.append(Partition((field_set,), metadata))
+        else:
+            # Group tests by their common metadata.
+            compatible_tests[metadata].append(field_set)
+
+    for metadata, field_sets in compatible_tests.items():
+        partitions.append(Partition(tuple(field_sets), metadata))
+
+    return Partitions(partitions)
+
+
 @dataclass(frozen=True)
 class TestSetupRequest:
-    field_set: JunitTestFieldSet
+    field_sets: tuple[JunitTestFieldSet, ...]
+    metadata: TestMetadata
     is_debug: bool
 
 
@@ -90,14 +145,16 @@ async def setup_junit_for_target(
     test_subsystem: TestSubsystem,
     test_extra_env: TestExtraEnv,
 ) -> TestSetup:
+    addresses = Addresses(field_set.address for field_set in request.field_sets)
+    # All of the tests in a batch have the same JDK, so we can use the field of any of them.
     jdk, transitive_tgts = await MultiGet(
-        Get(JdkEnvironment, JdkRequest, JdkRequest.from_field(request.field_set.jdk_version)),
-        Get(TransitiveTargets, TransitiveTargetsRequest([request.field_set.address])),
+        Get(JdkEnvironment, JdkRequest, JdkRequest.from_field(request.field_sets[0].jdk_version)),
+        Get(TransitiveTargets, TransitiveTargetsRequest(addresses)),
     )
 
     lockfile_request = GenerateJvmLockfileFromTool.create(junit)
     classpath, junit_classpath, files = await MultiGet(
-        Get(Classpath, Addresses([request.field_set.address])),
+        Get(Classpath, Addresses, addresses),
         Get(ToolClasspath, ToolClasspathRequest(lockfile=lockfile_request)),
         Get(
             SourceFiles,
@@ -117,7 +174,9 @@ async def setup_junit_for_target(
     }
 
     reports_dir_prefix = "__reports_dir"
-    reports_dir = f"{reports_dir_prefix}/{request.field_set.address.path_safe_spec}"
+    reports_dir = f"{reports_dir_prefix}/{request.field_sets[0].address.path_safe_spec}"
+    if len(request.field_sets) > 1:
+        reports_dir = f"{reports_dir}+{len(request.field_sets)-1}-others"
 
     # Classfiles produced by the root `junit_test` targets are the only ones which should run.
     user_classpath_arg = ":".join(classpath.root_args())
@@ -132,9 +191,24 @@ async def setup_junit_for_target(
         extra_jvm_args.extend(jvm.debug_args)
 
     field_set_extra_env = await Get(
-        EnvironmentVars, EnvironmentVarsRequest(request.field_set.extra_env_vars.value or ())
+        EnvironmentVars, EnvironmentVarsRequest(request.metadata.extra_env_vars)
     )
 
+    timeout_seconds: int | None = None
+    for field_set in request.field_sets:
+        timeout = field_set.timeout.calculate_from_global_options(test_subsystem)
+        if timeout:
+            if timeout_seconds:
+                timeout_seconds += timeout
+            else:
+                timeout_seconds = timeout
+
+    run_description = request.field_sets[0].address.spec
+    if len(request.field_sets) > 1:
+        run_description = (
+            f"batch of {run_description} and {len(request.field_sets)-1} other targets"
+        )
+
     process = JvmProcess(
         jdk=jdk,
         classpath_entries=[
@@ -155,8 +229,8 @@ async def setup_junit_for_target(
         extra_jvm_options=junit.jvm_options,
         extra_immutable_input_digests=extra_immutable_input_digests,
         output_directories=(reports_dir,),
-        description=f"Run JUnit 5 ConsoleLauncher against {request.field_set.address}",
-        timeout_seconds=request.field_set.timeout.calculate_from_global_options(test_subsystem),
+        description=f"Run JUnit 5 ConsoleLauncher against {run_description}",
+        timeout_seconds=timeout_seconds,
         level=LogLevel.DEBUG,
         cache_scope=cache_scope,
         use_nailgun=False,
@@ -167,26 +241,33 @@ async def setup_junit_for_target(
 @rule(desc="Run JUnit", level=LogLevel.DEBUG)
 async def run_junit_test(
     test_subsystem: TestSubsystem,
-    batch: JunitTestRequest.Batch[JunitTestFieldSet, Any],
+    batch: JunitTestRequest.Batch[JunitTestFieldSet, TestMetadata],
 ) -> TestResult:
-    field_set = batch.single_element
-
-    test_setup = await Get(TestSetup, TestSetupRequest(field_set, is_debug=False))
+    test_setup = await Get(
+        TestSetup, TestSetupRequest(batch.elements, batch.partition_metadata, is_debug=False)
+    )
     process = await Get(Process, JvmProcess, test_setup.process)
     process_results = await Get(
         ProcessResultWithRetries, ProcessWithRetries(process, test_subsystem.attempts_default)
     )
     reports_dir_prefix = test_setup.reports_dir_prefix
 
-    xml_result_subset = await Get(
-        Digest,
-        DigestSubset(process_results.last.output_digest, PathGlobs([f"{reports_dir_prefix}/**"])),
+    reports = await Get(
+        SplitDigest,
+        SplitDigestRequest(
+            process_results.last.output_digest,
+            (
+                DigestPart(
+                    "xml_results", (f"{reports_dir_prefix}/**",), strip_prefix=reports_dir_prefix
+                ),
+            ),
+        ),
     )
-    xml_results = await Get(Snapshot, RemovePrefix(xml_result_subset, reports_dir_prefix))
+    xml_results = reports["xml_results"]
 
-    return TestResult.from_fallible_process_result(
-        process_results=process_results.results,
-        address=field_set.address,
+    return TestResult.from_batched_fallible_process_result(
+        process_results.results,
+        batch=batch,
         output_setting=test_subsystem.output,
         xml_results=xml_results,
     )
@@ -194,9 +275,11 @@ async def run_junit_test(
 
 @rule(level=LogLevel.DEBUG)
 async def setup_junit_debug_request(
-    batch: JunitTestRequest.Batch[JunitTestFieldSet, Any]
+    batch: JunitTestRequest.Batch[JunitTestFieldSet, TestMetadata]
 ) -> TestDebugRequest:
-    setup = await Get(TestSetup, TestSetupRequest(batch.single_element, is_debug=True))
+    setup = await Get(
+        TestSetup, TestSetupRequest(batch.elements, batch.partition_metadata, is_debug=True)
+    )
     process = await Get(Process, JvmProcess, setup.process)
     return TestDebugRequest(
         InteractiveProcess.from_process(process, forward_signals_to_process=False, restartable=True)
@@ -207,6 +290,7 @@ def rules():
     return [
         *collect_rules(),
         *lockfile.rules(),
+        *split_digest.rules(),
         UnionRule(ExportableTool, JUnit),
         *JunitTestRequest.rules(),
     ]
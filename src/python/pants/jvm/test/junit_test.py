@@ -23,7 +23,8 @@ from pants.core.goals.test import TestResult, get_filtered_environment
 from pants.core.target_types import FilesGeneratorTarget, FileTarget, RelocatedFiles
 from pants.core.util_rules import config_files, source_files, stripped_source_files
 from pants.core.util_rules.external_tool import rules as external_tool_rules
-from pants.engine.addresses import Addresses
+from pants.core.util_rules.partitions import Partitions
+from pants.engine.addresses import Address, Addresses
 from pants.engine.target import CoarsenedTargets
 from pants.jvm import classpath
 from pants.jvm.jdk_rules import rules as java_util_rules
@@ -32,12 +33,12 @@ from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.coursier_setup import rules as coursier_setup_rules
 from pants.jvm.strip_jar import strip_jar
 from pants.jvm.target_types import JvmArtifactTarget
-from pants.jvm.test.junit import JunitTestRequest
+from pants.jvm.test.junit import JunitTestFieldSet, JunitTestRequest
 from pants.jvm.test.junit import rules as junit_rules
 from pants.jvm.test.testutil import ATTEMPTS_DEFAULT_OPTION, run_junit_test
 from pants.jvm.testutil import maybe_skip_jdk_test
 from pants.jvm.util_rules import rules as util_rules
-from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, QueryRule, RuleRunner
 
 # TODO(12812): Switch tests to using parsed junit.xml results instead of scanning stdout strings.
 
@@ -65,6 +66,7 @@ def rule_runner() -> RuleRunner:
             *non_jvm_dependencies_rules(),
             get_filtered_environment,
             QueryRule(CoarsenedTargets, (Addresses,)),
+            QueryRule(Partitions, (JunitTestRequest.PartitionRequest,)),
             QueryRule(TestResult, (JunitTestRequest.Batch,)),
         ],
         target_types=[
@@ -138,6 +140,88 @@ def test_vintage_simple_success(
     assert re.search(r"1 tests found", stdout_text) is not None
 
 
+@maybe_skip_jdk_test
+def test_vintage_batched_success(
+    rule_runner: RuleRunner, junit4_lockfile: JVMLockfileFixture
+) -> None:
+    rule_runner.write_files(
+        {
+            "3rdparty/jvm/default.lock": junit4_lockfile.serialized_lockfile,
+            "3rdparty/jvm/BUILD": junit4_lockfile.requirements_as_jvm_artifact_targets(),
+            "BUILD": dedent(
+                """\
+                junit_tests(
+                    name='example-test',
+                    sources=['FirstTest.java', 'SecondTest.java'],
+                    dependencies= [
+                        '3rdparty/jvm:junit_junit',
+                    ],
+                    batch_compatibility_tag='default',
+                )
+                junit_tests(
+                    name='other-test',
+                    sources=['OtherTest.java'],
+                    dependencies= [
+                        '3rdparty/jvm:junit_junit',
+                    ],
+                    batch_compatibility_tag='other',
+                )
+                """
+            ),
+            **{
+                f"{name}.java": dedent(
+                    f"""
+                    package org.pantsbuild.example;
+
+                    import junit.framework.TestCase;
+
+                    public class {name} extends TestCase {{
+                       public void testHello(){{
+                          assertTrue("Hello!" == "Hello!");
+                       }}
+                    }}
+                    """
+                )
+                for name in ("FirstTest", "SecondTest", "OtherTest")
+            },
+        }
+    )
+    rule_runner.set_options(
+        [
+            "--junit-args=['--disable-ansi-colors','--details=flat','--details-theme=ascii']",
+            f"--test-attempts-default={ATTEMPTS_DEFAULT_OPTION}",
+        ],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+    field_sets = tuple(
+        JunitTestFieldSet.create(
+            rule_runner.get_target(
+                Address(spec_path="", target_name=target_name, relative_file_path=path)
+            )
+        )
+        for target_name, path in (
+            ("example-test", "FirstTest.java"),
+            ("example-test", "SecondTest.java"),
+            ("other-test", "OtherTest.java"),
+        )
+    )
+    partitions = rule_runner.request(Partitions, [JunitTestRequest.PartitionRequest(field_sets)])
+    assert sorted(len(partition.elements) for partition in partitions) == [1, 2]
+
+    batch_partition = next(partition for partition in partitions if len(partition.elements) == 2)
+    assert batch_partition.elements == field_sets[:2]
+    test_result = rule_runner.request(
+        TestResult,
+        [JunitTestRequest.Batch("", batch_partition.elements, batch_partition.metadata)],
+    )
+
+    assert test_result.exit_code == 0
+    assert test_result.addresses == tuple(field_set.address for field_set in field_sets[:2])
+    stdout_text = test_result.stdout_bytes.decode()
+    assert re.search(r"2 tests successful", stdout_text) is not None
+    assert re.search(r"2 tests found", stdout_text) is not None
+
+
 @maybe_skip_jdk_test
 def test_vintage_simple_failure(
     rule_runner: RuleRunner, junit4_lockfile: JVMLockfileFixture
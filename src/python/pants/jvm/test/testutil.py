@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Iterable, Mapping
 
 from pants.core.goals.test import TestResult
+from pants.core.util_rules.partitions import Partitions
 from pants.engine.internals.native_engine import Address
 from pants.jvm.test.junit import JunitTestFieldSet, JunitTestRequest
 from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, RuleRunner
@@ -29,6 +30,11 @@ def run_junit_test(
     tgt = rule_runner.get_target(
         Address(spec_path="", target_name=target_name, relative_file_path=relative_file_path)
     )
+    partitions = rule_runner.request(
+        Partitions, [JunitTestRequest.PartitionRequest((JunitTestFieldSet.create(tgt),))]
+    )
+    assert len(partitions) == 1
     return rule_runner.request(
-        TestResult, [JunitTestRequest.Batch("", (JunitTestFieldSet.create(tgt),), None)]
+        TestResult,
+        [JunitTestRequest.Batch("", partitions[0].elements, partitions[0].metadata)],
     )
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import dataclasses
+import fnmatch
 import itertools
 import logging
 import os
+import re
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Iterable
@@ -63,13 +66,61 @@ class NoSourceRootError(SourceRootError):
         super().__init__(f"No source root found for `{path}`. {extra_msg}")
 
 
-# We perform pattern matching against absolute paths, where "/" represents the repo root.
-_repo_root = PurePath(os.path.sep)
+def _segment_to_regex(segment: str) -> str:
+    """Translates a glob for a single path segment, with the semantics of `fnmatch`."""
+    parts = []
+    i = 0
+    while i < len(segment):
+        c = segment[i]
+        i += 1
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            start = i + 1 if segment[i : i + 1] == "!" else i
+            end = segment.find("]", start + 1 if segment[start : start + 1] == "]" else start)
+            if end == -1:
+                parts.append(re.escape(c))
+                continue
+            negated = start != i
+            chars = "".join(ch if ch == "-" else re.escape(ch) for ch in segment[start:end])
+            parts.append(f"[^/{chars}]" if negated else f"[{chars}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(c))
+    return "".join(parts)
+
+
+def _pattern_to_regex(pattern: str) -> str:
+    """Translates a root pattern to a regex with the semantics of `PurePath.match`.
+
+    The regex is matched against putative roots rendered as `/` followed by each of their path
+    segments, so that the buildroot itself is rendered as the empty string.
+    """
+    segments = [segment for segment in pattern.split("/") if segment not in ("", ".")]
+    if pattern.startswith("/"):
+        # Anchored at the buildroot: the whole path must match.
+        return "".join(f"/{_segment_to_regex(segment)}" for segment in segments)
+
+    # Otherwise, the pattern is matched from the right. Like `PurePath.match`, we consider the
+    # root of the (absolute) path to be a segment, which some patterns match.
+    body = "".join(f"/{_segment_to_regex(segment)}" for segment in segments)
+    if fnmatch.fnmatchcase(os.path.sep, segments[0]):
+        rest = "".join(f"/{_segment_to_regex(segment)}" for segment in segments[1:])
+        return f".*{body}|{rest}"
+    return f".*{body}"
 
 
 @dataclass(frozen=True)
 class SourceRootPatternMatcher:
     root_patterns: tuple[str, ...]
+    # All the patterns are combined into a single regex, so that matching a putative root is a
+    # single operation, rather than one `PurePath.match` per pattern.
+    _regex: re.Pattern | None = dataclasses.field(init=False, compare=False, repr=False)
+    _roots_by_dir: dict[PurePath, PurePath | None] = dataclasses.field(
+        init=False, compare=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self) -> None:
         for root_pattern in self.root_patterns:
@@ -77,19 +128,41 @@ class SourceRootPatternMatcher:
                 raise InvalidSourceRootPatternError(
                     f"`..` disallowed in source root pattern: {root_pattern}."
                 )
+            if not root_pattern.strip("/.") and not root_pattern.startswith("/"):
+                raise InvalidSourceRootPatternError(f"Empty source root pattern: `{root_pattern}`.")
+        regex = (
+            re.compile("|".join(f"(?:{_pattern_to_regex(p)})" for p in self.root_patterns))
+            if self.root_patterns
+            else None
+        )
+        object.__setattr__(self, "_regex", regex)
 
     def get_patterns(self) -> tuple[str, ...]:
         return tuple(self.root_patterns)
 
     def matches_root_patterns(self, relpath: PurePath) -> bool:
         """Does this putative root match a pattern?"""
-        # Note: This is currently O(n) where n is the number of patterns, which
-        # we expect to be small.  We can optimize if it becomes necessary.
-        putative_root = _repo_root / relpath
-        for pattern in self.root_patterns:
-            if putative_root.match(pattern):
-                return True
-        return False
+        if self._regex is None:
+            return False
+        path = relpath.as_posix()
+        return self._regex.fullmatch("" if path == "." else f"/{path}") is not None
+
+    def find_root(self, relpath: PurePath) -> PurePath | None:
+        """Returns the closest of the given path and its ancestors which matches a pattern.
+
+        Results are memoized per directory, so that finding the roots of many paths which share
+        ancestors only matches each of those ancestors once.
+        """
+        if relpath in self._roots_by_dir:
+            return self._roots_by_dir[relpath]
+        if self.matches_root_patterns(relpath):
+            root: PurePath | None = relpath
+        elif str(relpath) == ".":
+            root = None
+        else:
+            root = self.find_root(relpath.parent)
+        self._roots_by_dir[relpath] = root
+        return root
 
 
 class SourceRootConfig(Subsystem):
@@ -222,9 +295,16 @@ class OptionalSourceRootsResult:
     path_to_optional_root: FrozenDict[PurePath, OptionalSourceRoot]
 
 
+def _find_root_by_pattern(
+    path: PurePath, pattern_matcher: SourceRootPatternMatcher
+) -> OptionalSourceRoot:
+    root = pattern_matcher.find_root(path)
+    return OptionalSourceRoot(None if root is None else SourceRoot(str(root)))
+
+
 @rule
 async def get_optional_source_roots(
-    source_roots_request: SourceRootsRequest,
+    source_roots_request: SourceRootsRequest, source_root_config: SourceRootConfig
 ) -> OptionalSourceRootsResult:
     """Rule to request source roots that may not exist."""
     # A file cannot be a source root, so request for its parent.
@@ -236,7 +316,14 @@ async def get_optional_source_roots(
     }
     dirs.update(file_to_dir.values())
 
-    roots = await MultiGet(Get(OptionalSourceRoot, SourceRootRequest(d)) for d in dirs)
+    roots: tuple[OptionalSourceRoot, ...]
+    if source_root_config.marker_filenames:
+        roots = await MultiGet(Get(OptionalSourceRoot, SourceRootRequest(d)) for d in dirs)
+    else:
+        # Without marker files, source roots only depend on the patterns, so there is no need for
+        # an engine request per directory.
+        pattern_matcher = source_root_config.get_pattern_matcher()
+        roots = tuple(_find_root_by_pattern(d, pattern_matcher) for d in dirs)
     dir_to_root = dict(zip(dirs, roots))
 
     path_to_optional_root: dict[PurePath, OptionalSourceRoot] = {}
@@ -271,6 +358,9 @@ async def get_optional_source_root(
     """Rule to request a SourceRoot that may not exist."""
     pattern_matcher = source_root_config.get_pattern_matcher()
     path = source_root_request.path
+    marker_filenames = source_root_config.marker_filenames
+    if not marker_filenames:
+        return _find_root_by_pattern(path, pattern_matcher)
 
     # Check if the requested path itself is a source root.
 
@@ -279,20 +369,16 @@ async def get_optional_source_root(
         return OptionalSourceRoot(SourceRoot(str(path)))
 
     # B) Does it contain a marker file?
-    marker_filenames = source_root_config.marker_filenames
-    if marker_filenames:
-        for marker_filename in marker_filenames:
-            if (
-                os.path.basename(marker_filename) != marker_filename
-                or "*" in marker_filename
-                or "!" in marker_filename
-            ):
-                raise InvalidMarkerFileError(
-                    f"Marker filename must be a base name: {marker_filename}"
-                )
-        paths = await Get(Paths, PathGlobs([str(path / mf) for mf in marker_filenames]))
-        if len(paths.files) > 0:
-            return OptionalSourceRoot(SourceRoot(str(path)))
+    for marker_filename in marker_filenames:
+        if (
+            os.path.basename(marker_filename) != marker_filename
+            or "*" in marker_filename
+            or "!" in marker_filename
+        ):
+            raise InvalidMarkerFileError(f"Marker filename must be a base name: {marker_filename}")
+    paths = await Get(Paths, PathGlobs([str(path / mf) for mf in marker_filenames]))
+    if len(paths.files) > 0:
+        return OptionalSourceRoot(SourceRoot(str(path)))
 
     # The requested path itself is not a source root, but maybe its parent is.
     if str(path) != ".":
@@ -13,6 +13,7 @@ from pants.source.source_root import (
     OptionalSourceRoot,
     SourceRoot,
     SourceRootConfig,
+    SourceRootPatternMatcher,
     SourceRootRequest,
     SourceRootsRequest,
     SourceRootsResult,
@@ -116,6 +117,27 @@ def test_source_root_default_patterns() -> None:
     assert "." == find_root("corge/grault.py")
 
 
+@pytest.mark.parametrize(
+    "pattern",
+    ["/", "src", "src/python", "/src/python", "src/*", "/src/*", "*", "*/python", "[!s]*", "s?c"],
+)
+def test_pattern_matcher_matches_purepath_semantics(pattern: str) -> None:
+    matcher = SourceRootPatternMatcher((pattern,))
+    for path in (".", "src", "python", "src/python", "a/src/python", "src/python/a", "a/b/src"):
+        assert matcher.matches_root_patterns(PurePath(path)) == (PurePath("/") / path).match(
+            pattern
+        ), path
+
+
+def test_pattern_matcher_find_root() -> None:
+    matcher = SourceRootPatternMatcher(("src/python", "/project/*"))
+    assert matcher.find_root(PurePath("src/python/foo/bar")) == PurePath("src/python")
+    assert matcher.find_root(PurePath("project/a/src/python")) == PurePath("project/a/src/python")
+    assert matcher.find_root(PurePath("project/a/b")) == PurePath("project/a")
+    assert matcher.find_root(PurePath("prefix/project/a")) is None
+    assert SourceRootPatternMatcher(()).find_root(PurePath("src/python")) is None
+
+
 def test_marker_file() -> None:
     def find_root(path):
         return _find_root(
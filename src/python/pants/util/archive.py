@@ -0,0 +1,251 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""In-memory creation and extraction of zip and tar archives.
+
+Archives are created reproducibly: entries are sorted by path and carry fixed timestamps,
+permissions and ownership, and compressed streams don't embed any timestamp.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import posixpath
+import stat
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Iterable, Union
+
+# The earliest timestamp representable in a zip file, used for every entry.
+_ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+_TAR_COMPRESSIONS = ("", "gz", "bz2", "xz")
+
+
+class UnsupportedArchiveError(Exception):
+    """The archive can not be handled in memory, e.g. it is too big or has unsupported entries."""
+
+
+@dataclass(frozen=True)
+class ArchivedFile:
+    path: str
+    content: bytes
+    is_executable: bool = False
+
+
+@dataclass(frozen=True)
+class ArchivedSymlink:
+    path: str
+    target: str
+
+
+@dataclass(frozen=True)
+class ArchivedDirectory:
+    path: str
+
+
+ArchiveMember = Union[ArchivedFile, ArchivedSymlink, ArchivedDirectory]
+
+
+def _file_mode(is_executable: bool) -> int:
+    return 0o755 if is_executable else 0o644
+
+
+def _sorted_files(files: Iterable[ArchivedFile]) -> list[ArchivedFile]:
+    return sorted(files, key=lambda f: f.path)
+
+
+def create_zip(files: Iterable[ArchivedFile]) -> bytes:
+    """Creates a deflated zip archive containing the given files."""
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for file in _sorted_files(files):
+            info = zipfile.ZipInfo(file.path, date_time=_ZIP_TIMESTAMP)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3  # Unix, so the permissions in `external_attr` are honoured.
+            info.external_attr = (stat.S_IFREG | _file_mode(file.is_executable)) << 16
+            zf.writestr(info, file.content)
+    return buffer.getvalue()
+
+
+def create_tar(files: Iterable[ArchivedFile], *, compression: str = "") -> bytes:
+    """Creates a tar archive containing the given files.
+
+    :param compression: One of `""` (no compression), `"gz"`, `"bz2"` or `"xz"`.
+    """
+
+    if compression not in _TAR_COMPRESSIONS:
+        raise ValueError(f"Unsupported tar compression: {compression!r}")
+
+    buffer = BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tf:
+        for file in _sorted_files(files):
+            info = tarfile.TarInfo(file.path)
+            info.size = len(file.content)
+            info.mode = _file_mode(file.is_executable)
+            info.mtime = 0
+            tf.addfile(info, BytesIO(file.content))
+    data = buffer.getvalue()
+
+    if compression == "gz":
+        return gzip.compress(data, mtime=0)
+    if compression == "bz2":
+        return bz2.compress(data)
+    if compression == "xz":
+        return lzma.compress(data, format=lzma.FORMAT_XZ)
+    return data
+
+
+class _SizeBudget:
+    def __init__(self, max_size: int | None) -> None:
+        self._remaining = max_size
+
+    def consume(self, size: int) -> None:
+        if self._remaining is None:
+            return
+        self._remaining -= size
+        if self._remaining < 0:
+            raise UnsupportedArchiveError("The archive contents exceed the in-memory size limit.")
+
+
+def _safe_member_path(name: str) -> str:
+    path = posixpath.normpath(name)
+    if posixpath.isabs(path) or path == ".." or path.startswith("../"):
+        raise UnsupportedArchiveError(f"The archive member {name!r} points outside of the archive.")
+    return path
+
+
+def _is_archive_root(path: str) -> bool:
+    return path == "."
+
+
+def _unique_members(members: list[ArchiveMember]) -> list[ArchiveMember]:
+    """Resolves repeated member paths like `tar` and `unzip` do, i.e. the last entry wins.
+
+    A path used both by a directory and by a file or symlink, including as the parent directory of
+    another member, is not supported.
+    """
+
+    by_path: dict[str, ArchiveMember] = {}
+    for member in members:
+        previous = by_path.pop(member.path, None)
+        if previous is not None and isinstance(previous, ArchivedDirectory) != isinstance(
+            member, ArchivedDirectory
+        ):
+            raise UnsupportedArchiveError(
+                f"The archive member {member.path!r} is both a directory and a file or link."
+            )
+        by_path[member.path] = member
+
+    for path in by_path:
+        parent = posixpath.dirname(path)
+        while parent:
+            if parent in by_path and not isinstance(by_path[parent], ArchivedDirectory):
+                raise UnsupportedArchiveError(
+                    f"The archive member {parent!r} is both a directory and a file or link."
+                )
+            parent = posixpath.dirname(parent)
+    return list(by_path.values())
+
+
+def extract_zip(content: bytes, *, max_size: int | None = None) -> list[ArchiveMember]:
+    """Lists the members of the given zip archive, along with their contents.
+
+    If several members have the same path, only the last one is returned.
+
+    :param max_size: The maximum accumulated size of the uncompressed contents.
+    """
+
+    budget = _SizeBudget(max_size)
+    members: list[ArchiveMember] = []
+    try:
+        with zipfile.ZipFile(BytesIO(content)) as zf:
+            for info in zf.infolist():
+                path = _safe_member_path(info.filename)
+                if info.is_dir():
+                    if not _is_archive_root(path):
+                        members.append(ArchivedDirectory(path))
+                    continue
+
+                budget.consume(info.file_size)
+                mode = info.external_attr >> 16
+                data = zf.read(info)
+                if info.create_system == 3 and stat.S_ISLNK(mode):
+                    members.append(ArchivedSymlink(path, data.decode("utf-8")))
+                else:
+                    members.append(
+                        ArchivedFile(path, data, is_executable=bool(mode & stat.S_IXUSR))
+                    )
+    except zipfile.BadZipFile as e:
+        raise UnsupportedArchiveError(str(e)) from e
+    return _unique_members(members)
+
+
+def extract_tar(content: bytes, *, max_size: int | None = None) -> list[ArchiveMember]:
+    """Lists the members of the given tar archive, along with their contents.
+
+    The compression of the archive, if any, is detected automatically. The archive is read as a
+    stream, so it is decompressed only once. If several members have the same path, e.g. after
+    appending to the archive with `tar -r`, only the last one is returned.
+
+    :param max_size: The maximum accumulated size of the uncompressed contents.
+    """
+
+    budget = _SizeBudget(max_size)
+    members: list[ArchiveMember] = []
+    file_contents: dict[str, ArchivedFile] = {}
+    try:
+        with tarfile.open(fileobj=BytesIO(content), mode="r|*") as tf:
+            for info in tf:
+                path = _safe_member_path(info.name)
+                if info.isdir():
+                    if not _is_archive_root(path):
+                        members.append(ArchivedDirectory(path))
+                elif info.issym():
+                    members.append(ArchivedSymlink(path, info.linkname))
+                elif info.islnk():
+                    linked = file_contents.get(_safe_member_path(info.linkname))
+                    if linked is None:
+                        raise UnsupportedArchiveError(
+                            f"The hard link {info.name!r} points to an unknown member."
+                        )
+                    budget.consume(len(linked.content))
+                    members.append(
+                        ArchivedFile(path, linked.content, is_executable=linked.is_executable)
+                    )
+                elif info.isreg():
+                    budget.consume(info.size)
+                    fileobj = tf.extractfile(info)
+                    assert fileobj is not None
+                    file = ArchivedFile(
+                        path, fileobj.read(), is_executable=bool(info.mode & stat.S_IXUSR)
+                    )
+                    file_contents[path] = file
+                    members.append(file)
+                else:
+                    raise UnsupportedArchiveError(
+                        f"The archive member {info.name!r} is not a file, directory or link."
+                    )
+    except (tarfile.TarError, EOFError, OSError, lzma.LZMAError) as e:
+        raise UnsupportedArchiveError(str(e)) from e
+    return _unique_members(members)
+
+
+def decompress_gzip(content: bytes, *, max_size: int | None = None) -> bytes:
+    """Decompresses a single gzip compressed file.
+
+    :param max_size: The maximum size of the uncompressed content.
+    """
+
+    try:
+        with gzip.GzipFile(fileobj=BytesIO(content), mode="rb") as gzf:
+            data = gzf.read(max_size + 1 if max_size is not None else -1)
+    except (OSError, EOFError) as e:
+        raise UnsupportedArchiveError(str(e)) from e
+    _SizeBudget(max_size).consume(len(data))
+    return data
@@ -0,0 +1,172 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import gzip
+import tarfile
+import warnings
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from pants.util.archive import (
+    ArchivedDirectory,
+    ArchivedFile,
+    ArchivedSymlink,
+    UnsupportedArchiveError,
+    create_tar,
+    create_zip,
+    decompress_gzip,
+    extract_tar,
+    extract_zip,
+)
+
+FILES = [
+    ArchivedFile("hello/world", b"Hello, World!"),
+    ArchivedFile("bin/run.sh", b"#!/bin/sh", is_executable=True),
+    ArchivedFile("foo", b"bar"),
+]
+
+
+def test_zip_roundtrip() -> None:
+    archive = create_zip(FILES)
+    assert create_zip(reversed(FILES)) == archive
+
+    with zipfile.ZipFile(BytesIO(archive)) as zf:
+        assert zf.namelist() == ["bin/run.sh", "foo", "hello/world"]
+        assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+
+    assert sorted(extract_zip(archive), key=lambda m: m.path) == sorted(
+        FILES, key=lambda f: f.path
+    )
+
+
+@pytest.mark.parametrize("compression", ["", "gz", "bz2", "xz"])
+def test_tar_roundtrip(compression: str) -> None:
+    archive = create_tar(FILES, compression=compression)
+    assert create_tar(reversed(FILES), compression=compression) == archive
+
+    with tarfile.open(fileobj=BytesIO(archive), mode="r:*") as tf:
+        assert tf.getnames() == ["bin/run.sh", "foo", "hello/world"]
+        assert {info.mtime for info in tf.getmembers()} == {0}
+
+    assert sorted(extract_tar(archive), key=lambda m: m.path) == sorted(
+        FILES, key=lambda f: f.path
+    )
+
+
+def test_extract_tar_links_and_directories() -> None:
+    buffer = BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+        for dir_name in ("./", "dir"):
+            dir_info = tarfile.TarInfo(dir_name)
+            dir_info.type = tarfile.DIRTYPE
+            tf.addfile(dir_info)
+
+        file_info = tarfile.TarInfo("dir/file")
+        file_info.size = 3
+        tf.addfile(file_info, BytesIO(b"abc"))
+
+        symlink_info = tarfile.TarInfo("dir/symlink")
+        symlink_info.type = tarfile.SYMTYPE
+        symlink_info.linkname = "file"
+        tf.addfile(symlink_info)
+
+        hardlink_info = tarfile.TarInfo("dir/hardlink")
+        hardlink_info.type = tarfile.LNKTYPE
+        hardlink_info.linkname = "dir/file"
+        tf.addfile(hardlink_info)
+
+    assert extract_tar(buffer.getvalue()) == [
+        ArchivedDirectory("dir"),
+        ArchivedFile("dir/file", b"abc"),
+        ArchivedSymlink("dir/symlink", "file"),
+        ArchivedFile("dir/hardlink", b"abc"),
+    ]
+
+
+def _tar(*members: tuple[str, bytes | None]) -> bytes:
+    """Creates a tar archive with the given files, or directories if the content is `None`."""
+    buffer = BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tf:
+        for name, content in members:
+            info = tarfile.TarInfo(name)
+            if content is None:
+                info.type = tarfile.DIRTYPE
+                tf.addfile(info)
+            else:
+                info.size = len(content)
+                tf.addfile(info, BytesIO(content))
+    return buffer.getvalue()
+
+
+def _zip(*members: tuple[str, bytes]) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf, warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "Duplicate name")
+        for name, content in members:
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_extract_repeated_members() -> None:
+    # The last member with a given path wins, as when extracting with `tar` or `unzip`.
+    expected = [ArchivedDirectory("dir"), ArchivedFile("b.txt", b"b"), ArchivedFile("a.txt", b"2")]
+    assert (
+        extract_tar(
+            _tar(("dir", None), ("a.txt", b"1"), ("dir", None), ("b.txt", b"b"), ("a.txt", b"2"))
+        )
+        == expected
+    )
+    assert (
+        extract_zip(_zip(("dir/", b""), ("a.txt", b"1"), ("b.txt", b"b"), ("a.txt", b"2")))
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "archive",
+    [
+        _tar(("a", None), ("a", b"file")),
+        _tar(("a", b"file"), ("a", None)),
+        _tar(("a", b"file"), ("a/b", b"file")),
+        _zip(("a/", b""), ("a", b"file")),
+        _zip(("a", b"file"), ("a/b/c", b"file")),
+    ],
+)
+def test_extract_rejects_file_directory_collisions(archive: bytes) -> None:
+    with pytest.raises(UnsupportedArchiveError):
+        if zipfile.is_zipfile(BytesIO(archive)):
+            extract_zip(archive)
+        else:
+            extract_tar(archive)
+
+
+def test_extract_rejects_paths_outside_archive() -> None:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("../escape", b"")
+
+    with pytest.raises(UnsupportedArchiveError):
+        extract_zip(buffer.getvalue())
+
+
+def test_extract_max_size() -> None:
+    archive = create_tar(FILES, compression="gz")
+    with pytest.raises(UnsupportedArchiveError):
+        extract_tar(archive, max_size=10)
+    with pytest.raises(UnsupportedArchiveError):
+        extract_zip(create_zip(FILES), max_size=10)
+
+    with pytest.raises(UnsupportedArchiveError):
+        decompress_gzip(gzip.compress(b"Hello, World!"), max_size=10)
+    assert decompress_gzip(gzip.compress(b"Hello, World!"), max_size=13) == b"Hello, World!"
+
+
+def test_extract_invalid_archive() -> None:
+    with pytest.raises(UnsupportedArchiveError):
+        extract_zip(b"not a zip")
+    with pytest.raises(UnsupportedArchiveError):
+        extract_tar(b"not a tar")